@@ -519,6 +519,8 @@ RETURNS TABLE (
 AS $$
 DECLARE
 cdb_name CONSTANT varchar := current_database()::varchar;
+-- Checked once: the result cannot change between loop iterations.
+is_citydb CONSTANT boolean := EXISTS(SELECT version FROM citydb_pkg.citydb_version());
 r RECORD;
 
 BEGIN
@@ -534,7 +536,7 @@ FOR r IN
 	ORDER BY i.schema_name ASC
 LOOP
 	IF -- check that it is indeed a citydb schema
-		EXISTS(SELECT version FROM citydb_pkg.citydb_version())
+		is_citydb
 			AND
 		EXISTS(SELECT 1 FROM information_schema.tables AS t WHERE t.table_schema = r.schema_name AND t.table_name = 'cityobject')
 			AND
@@ -590,6 +592,8 @@ RETURNS TABLE (
 AS $$
 DECLARE
 cdb_name CONSTANT varchar := current_database()::varchar;
+-- Checked once: the result cannot change between loop iterations.
+is_citydb CONSTANT boolean := EXISTS(SELECT version FROM citydb_pkg.citydb_version());
 r RECORD;
 
 BEGIN
@@ -605,7 +609,7 @@ FOR r IN
 	ORDER BY i.schema_name ASC
 LOOP
 	IF -- check that it is indeed a citydb schema
-		EXISTS(SELECT version FROM citydb_pkg.citydb_version())
+		is_citydb
 			AND
 		EXISTS(SELECT 1 FROM information_schema.tables AS t WHERE t.table_schema = r.schema_name AND t.table_name = 'cityobject')
 			AND
@@ -99,6 +99,8 @@ class CDB4AdminDialog(QDialog, FORM_CLASS):
 
         # Variable to store the current open connection of a database.
         self.conn: pyconn = None
+        # Variable to store the long-lived connection shared by the worker threads.
+        self.admin_conn: pyconn = None
         # Variable to store the existing connection parameters.
         self.DB: DBConnectionInfo = None
 
@@ -238,6 +240,9 @@ class CDB4AdminDialog(QDialog, FORM_CLASS):
         # Close the (previous?) open connection.
         if self.conn:
             self.conn.close()
+        if self.admin_conn:
+            self.admin_conn.close()
+            self.admin_conn = None
 
         # Set the current database connection object variable
         self.DB: DBConnectionInfo = self.cbxExistingConn.currentData()
@@ -320,6 +325,10 @@ class CDB4AdminDialog(QDialog, FORM_CLASS):
         self.conn = conn_f.open_db_connection(db_connection=self.DB, app_name = self.PLUGIN_NAME)
 
         if self.conn:
+            # Every helper commits after its single statement anyway: autocommit
+            # spares the implicit BEGIN and the COMMIT round trip per query.
+            # The (un)installation scripts run on their own worker connections.
+            self.conn.autocommit = True
             self.DB.pg_server_version = conn_f.get_posgresql_server_version(dlg=self)
             # Set/update the status check variable
             self.checks.is_conn_successful = True
@@ -932,6 +941,9 @@ class CDB4AdminDialog(QDialog, FORM_CLASS):
         # Close the current open connection.
         if self.conn is not None:
             self.conn.close()
+        if self.admin_conn is not None:
+            self.admin_conn.close()
+            self.admin_conn = None
 
         return None
 
@@ -99,16 +99,11 @@ def list_usr_schemas(dlg: CDB4AdminDialog) -> Union[tuple[str, ...], tuple[()]]:
     try:
         with dlg.conn.cursor() as cur:
             cur.execute(query)
-            res = cur.fetchall() # [("schema1",), ("schema2",), ...]
-        dlg.conn.commit()
-
-        if res:
+            # Build the tuple straight from the cursor: no intermediate
+            # list of 1-tuples from fetchall() to transpose and discard.
             usr_schemas: tuple[str, ...]
-            usr_schemas = tuple(zip(*res))[0]
-            # Alternatively
-            # schemas = tuple(elem[0] for elem in cast(Iterable[tuple[str, ...]], res))
-        else:
-            usr_schemas = ()
+            usr_schemas = tuple(row[0] for row in cur)
+        dlg.conn.commit()
 
     except (Exception, psycopg2.Error) as error:
         gen_f.critical_log(
@@ -136,14 +131,9 @@ def list_all_cdb_schemas(dlg: CDB4AdminDialog) -> Union[tuple[str, ...], tuple[(
     try:
         with dlg.conn.cursor() as cur:
             cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
-
-        if res:
             cdb_schemas: tuple[str, ...]
-            cdb_schemas = tuple(zip(*res))[0] # trailing comma
-        else:
-            cdb_schemas = ()
+            cdb_schemas = tuple(row[0] for row in cur)
+        dlg.conn.commit()
 
     except (Exception, psycopg2.Error) as error:
         gen_f.critical_log(
@@ -157,6 +147,42 @@ def list_all_cdb_schemas(dlg: CDB4AdminDialog) -> Union[tuple[str, ...], tuple[(
     return cdb_schemas
 
 
+def list_uninstall_inventory(dlg: CDB4AdminDialog) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """SQL query that retrieves the group members, the usr_schemas and all
+    cdb_schemas in a single round trip, as needed by the uninstall workers.
+    The 'postgres' superuser is filtered out server-side.
+
+    *   :returns: A tuple with (usr_names, usr_schemas, cdb_schemas)
+        :rtype: tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+    """
+    query = pysql.SQL("""
+        SELECT
+            (SELECT array_agg(m) FROM {_qgis_pkg_schema}.list_qgis_pkg_usrgroup_members() AS m WHERE m <> 'postgres'),
+            (SELECT array_agg(u) FROM {_qgis_pkg_schema}.list_usr_schemas() AS u),
+            (SELECT array_agg(c.cdb_schema) FROM {_qgis_pkg_schema}.list_cdb_schemas(only_non_empty := False) AS c);
+        """).format(
+        _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA)
+        )
+
+    try:
+        with dlg.conn.cursor() as cur:
+            cur.execute(query)
+            res = cur.fetchone() # one row with three (possibly NULL) arrays
+        dlg.conn.commit()
+
+        usr_names, usr_schemas, cdb_schemas = (tuple(arr) if arr else () for arr in res)
+        return usr_names, usr_schemas, cdb_schemas
+
+    except (Exception, psycopg2.Error) as error:
+        gen_f.critical_log(
+            func=list_uninstall_inventory,
+            location=FILE_LOCATION,
+            header="Retrieving users, usr_schemas and cdb_schemas for uninstallation",
+            error=error)
+        dlg.conn.rollback()
+        return (), (), ()
+
+
 def list_cdb_schemas_privs(dlg: CDB4AdminDialog, usr_name: str) -> list[CDBSchemaPrivs]:
     """SQL function that retrieves the database cdb_schemas for the current database, 
     included the privileges status for the selected usr_name
@@ -209,14 +235,9 @@ def list_qgis_pkg_usrgroup_members(dlg: CDB4AdminDialog) -> Union[tuple[str, ...
     try:
         with dlg.conn.cursor() as cur:
             cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
-
-        if not res:
-            usr_names = ()
-        else:
             usr_names: tuple[str, ...]
-            usr_names = tuple(zip(*res))[0]
+            usr_names = tuple(row[0] for row in cur)
+        dlg.conn.commit()
 
         return usr_names
 
@@ -245,18 +266,10 @@ def list_qgis_pkg_non_usrgroup_members(dlg: CDB4AdminDialog) -> Union[tuple[str,
     try:
         with dlg.conn.cursor() as cur:
             cur.execute(query)
-            res = cur.fetchall()
+            usr_names: tuple[str, ...]
+            usr_names = tuple(row[0] for row in cur)
         dlg.conn.commit()
 
-        # print('Result from list NON group members()', res)
-
-        if not res:
-            usr_names = ()
-        else:
-            usr_names: tuple[str, ...]
-            usr_names = tuple(zip(*res))[0]
-            # usr_names = tuple(elem[0] for elem in cast(Iterable[tuple[str]], res))
-        
         return usr_names
 
     except (Exception, psycopg2.Error) as error:
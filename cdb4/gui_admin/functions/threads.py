@@ -23,8 +23,11 @@ if TYPE_CHECKING:
     from ...gui_admin.admin_dialog import CDB4AdminDialog
     from psycopg2.extensions import connection as pyconn
 
+import functools
+import itertools
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.core import Qgis, QgsMessageLog
@@ -39,6 +42,97 @@ from . import sql
 
 FILE_LOCATION = gen_f.get_file_relative_path(file=__file__)
 
+# SQL templates reused across worker loop iterations: the pysql.SQL object is
+# built once here, only .format() with the varying parts runs inside the loops.
+_CREATE_DEFAULT_USER_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.create_default_qgis_pkg_user({_priv_type});
+    """)
+_CREATE_USR_SCHEMA_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.create_qgis_usr_schema({_usr_name});
+    """)
+_GRANT_DEFAULT_USR_PRIVILEGES_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := {_priv_type}, cdb_schema := NULL);
+    """)
+_REVOKE_USR_PRIVILEGES_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schema := NULL);
+    """)
+# Variants for qgis_pkg 0.9.x, whose API takes the plural cdb_schemas parameter.
+_REVOKE_USR_PRIVILEGES_09_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schemas := NULL);
+    """)
+_GRANT_RW_USR_PRIVILEGES_09_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := 'rw', cdb_schemas := NULL);
+    """)
+_GRANT_RW_USR_PRIVILEGES_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := 'rw', cdb_schema := NULL);
+    """)
+_DROP_LAYERS_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.{_drop_layers_func}({_usr},{_cdb_schema});
+    """)
+_PERFORM_DROP_LAYERS_TPL = pysql.SQL("PERFORM {_qgis_pkg_schema}.{_drop_layers_func}(usr_name, cdb_schema);")
+_DROP_DETAIL_VIEW_TPL = pysql.SQL("""
+    SELECT {_qgis_pkg_schema}.drop_detail_view({_usr_schema},{_cdb_schema});
+    """)
+_DROP_SCHEMA_CASCADE_TPL = pysql.SQL("""
+    DROP SCHEMA IF EXISTS {_schema} CASCADE;
+    """)
+
+
+def get_admin_db_connection(dlg: CDB4AdminDialog, app_name: str) -> pyconn:
+    """Returns the admin connection shared by the worker threads, opening it
+    on first use. A full PostgreSQL handshake costs 50-200 ms on TLS
+    connections, so consecutive install/uninstall runs reuse one long-lived
+    session instead of opening a new one each time. The connection is
+    validated (and reopened if dead) before being handed out; it is closed
+    together with the dialog connection.
+    """
+    conn = dlg.admin_conn
+    if conn is not None and conn.closed == 0:
+        try:
+            # "Checkout" as a connection pool would do it: discard whatever
+            # transaction state the previous worker left behind and stamp the
+            # session with the current operation name. Setting application_name
+            # here (instead of at connect time) lets all workers share the same
+            # session regardless of their individual app_name labels.
+            conn.rollback()
+            with conn.cursor() as cur:
+                cur.execute(pysql.SQL("SET application_name = {_app_name};").format(
+                    _app_name = pysql.Literal(app_name)
+                    ))
+            conn.commit()
+            return conn
+        except (Exception, psycopg2.Error):
+            conn.close()
+
+    dlg.admin_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=app_name)
+    return dlg.admin_conn
+
+
+def execute_batched_stages(worker: QObject, temp_conn: pyconn, parts: list[pysql.Composed], func, header: str) -> bool:
+    """Joins the statements composed by a worker's stage loop and executes them
+    in one transaction. Shared by the workers that batch their whole stage
+    sequence into a single submission.
+
+    *   :returns: True on failure, mirroring the workers' fail_flag semantics.
+        :rtype: bool
+    """
+    try:
+        with temp_conn.cursor() as cur:
+            cur.execute(pysql.SQL("\n").join(parts))
+        temp_conn.commit()
+        return False
+
+    except (Exception, psycopg2.Error) as error:
+        temp_conn.rollback()
+        gen_f.critical_log(
+            func=func,
+            location=FILE_LOCATION,
+            header=header,
+            error=error)
+        worker.sig_fail.emit()
+        return True
+
+
 #####################################################################################
 ##### QGIS PACKAGE INSTALL ##########################################################
 #####################################################################################
@@ -107,6 +201,15 @@ def run_install_qgis_pkg_thread(dlg: CDB4AdminDialog, sql_scripts_path: str, qgi
     dlg.thread.start()
 
 
+def _read_sql_script(path: str) -> bytes:
+    """Reads and returns the contents of the SQL script at the given path.
+    The scripts are kept as (UTF-8) bytes: psycopg2 accepts bytes queries, so
+    decoding to str and re-encoding for libpq would only add two full copies.
+    """
+    with open(path, "rb") as sql_script:
+        return sql_script.read()
+
+
 class QgisPackageInstallWorker(QObject):
     """Class to assign Worker that executes the 'installation scripts'
     to install the QGIS Package (qgis_pkg) into the database.
@@ -121,6 +224,18 @@ class QgisPackageInstallWorker(QObject):
         super().__init__()
         self.dlg = dlg
         self.sql_scripts_path: str = sql_scripts_path
+        self._last_emit: float = 0.0
+        # Error logger with the invariant arguments already bound.
+        self._log = functools.partial(gen_f.critical_log, func=self.install_thread, location=FILE_LOCATION)
+
+    def emit_progress(self, curr_step: int, steps_tot: int, msg: str) -> None:
+        """Emits sig_progress at most every ~50 ms (but always for the last step),
+        to avoid flooding the GUI event loop when the steps complete quickly.
+        """
+        now = time.monotonic()
+        if now - self._last_emit > 0.05 or curr_step == steps_tot:
+            self.sig_progress.emit(curr_step, msg)
+            self._last_emit = now
 
     def install_thread(self) -> None:
         """Execution method that installs the qgis_pkg. SQL scripts are run
@@ -138,8 +253,18 @@ class QgisPackageInstallWorker(QObject):
         # Flag to help us break from a failing installation.
         fail_flag: bool = False
 
-        # Get an alphabetical ordered list of the script names. Important: Keep the order with number prefixes.
-        install_scripts: list[str] = sorted(os.listdir(path=self.sql_scripts_path))
+        # The target schema never changes during the run: escape it once.
+        qgis_pkg_ident = pysql.Identifier(dlg.QGIS_PKG_SCHEMA)
+
+        # Get an alphabetical ordered list of the scripts. Important: Keep the order with number prefixes.
+        # os.scandir hands back name and path in one directory pass, without an extra stat per file.
+        all_entries: list[os.DirEntry] = sorted((entry for entry in os.scandir(self.sql_scripts_path) if entry.is_file()), key=lambda entry: entry.name)
+
+        # Seed data shipped as '<table>.csv' is bulk-loaded via COPY (much faster
+        # than INSERTs at volume); everything else takes the regular SQL path.
+        seed_entries: list[os.DirEntry] = [entry for entry in all_entries if entry.name.endswith(".csv")]
+        script_entries: list[os.DirEntry] = [entry for entry in all_entries if not entry.name.endswith(".csv")]
+        install_scripts: list[str] = [entry.name for entry in script_entries]
 
         # Check that we read some files!
         if not install_scripts:
@@ -171,121 +296,130 @@ class QgisPackageInstallWorker(QObject):
                     def_usr_access_suffixes.append('rw')
                     set_privileges_num += 1
 
-        # Set progress bar goal
-        steps_tot = install_scripts_num + install_users_num + set_privileges_num
-        dlg.bar.setMaximum(steps_tot)
-
         curr_step: int = 0
 
         try:
             # Open new temp session, reserved for installation.
-            temp_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Installation)"]))
+            temp_conn = get_admin_db_connection(dlg=dlg, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Installation)"]))
+
+            # Set progress bar goal only once the connection is known good.
+            steps_tot = install_scripts_num + install_users_num + set_privileges_num
+            dlg.bar.setMaximum(steps_tot)
+
             with temp_conn:
 
                 # Start measuring time
                 time_start = time.time()
 
                 # 1) Install the DDL scripts
-                for script in install_scripts:
+                # First load all scripts from disk, then submit them to the server
+                # as one multi-statement string: the whole batch travels in a single
+                # round trip instead of one round trip per script.
+                try:
+                    # Read the scripts concurrently, so the disk reads overlap
+                    # instead of being paid one after the other (noticeable on a cold cache).
+                    script_paths: list[str] = [entry.path for entry in script_entries]
 
-                    # Update progress bar
-                    msg = f"Installing: '{script}'"
-                    curr_step += 1
-                    self.sig_progress.emit(curr_step, msg)
+                    sql_scripts_contents: list[bytes] = []
+                    with ThreadPoolExecutor(max_workers=min(8, install_scripts_num)) as executor:
+                        for script, script_contents in zip(install_scripts, executor.map(_read_sql_script, script_paths)):
 
-                    try:
-                        with temp_conn.cursor() as cur:
-                            with open(os.path.join(self.sql_scripts_path, script), "r") as sql_script:
-                                cur.execute(sql_script.read())
-                        temp_conn.commit() # Actually no need of it, automatically committed in the with
+                            # Update progress bar
+                            msg = f"Installing: '{script}'"
+                            curr_step += 1
+                            self.emit_progress(curr_step, steps_tot, msg)
 
-                    except (Exception, psycopg2.Error) as error:
-                        temp_conn.rollback()
-                        fail_flag = True
-                        gen_f.critical_log(
-                            func=self.install_thread,
-                            location=FILE_LOCATION,
-                            header="Installing QGIS Package ddl scripts",
-                            error=error)
-                        self.sig_fail.emit()
-                        break # Exit from the loop
+                            sql_scripts_contents.append(script_contents)
+
+                    with temp_conn.cursor() as cur:
+                        # The install produces no data the client reads back and is
+                        # simply re-run after a failure, so the commit may return
+                        # before the WAL reaches disk (saves one fsync per commit).
+                        cur.execute("SET LOCAL synchronous_commit = off;")
+                        cur.execute(b";\n".join(sql_scripts_contents))
+
+                        # Bulk-load any seed data into the table named after the file.
+                        # The files are opened in binary mode: copy_expert streams the
+                        # raw bytes to the server, so text-mode decoding (plus libpq
+                        # re-encoding) would only add overhead.
+                        for entry in seed_entries:
+                            table_name = os.path.splitext(entry.name)[0]
+                            with open(entry.path, "rb") as seed_file:
+                                cur.copy_expert(pysql.SQL("COPY {_table} FROM STDIN WITH CSV").format(
+                                    _table = pysql.Identifier(dlg.QGIS_PKG_SCHEMA, table_name)
+                                    ), seed_file)
+                    # No commit needed here: the outer 'with temp_conn' commits on clean exit.
+
+                except (Exception, psycopg2.Error) as error:
+                    temp_conn.rollback()
+                    fail_flag = True
+                    self._log(
+                        header="Installing QGIS Package ddl scripts",
+                        error=error)
+                    self.sig_fail.emit()
 
                 # 2) Install the DEFAULT users and create their usr_schemas
-                if install_users_num == 0:
-                    pass
-                else:
+                if install_users_num > 0:
                     for suf in def_usr_name_suffixes:
                         # Prepare the name of the user
                         usr_name = "_".join(["qgis_user", suf])
 
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.create_default_qgis_pkg_user({_priv_type});
-                        """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
+                        query = _CREATE_DEFAULT_USER_TPL.format(
+                            _qgis_pkg_schema = qgis_pkg_ident,
                             _priv_type = pysql.Literal(suf)
-                        )                    
+                        )
 
-                        query2 = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.create_qgis_usr_schema({_usr_name});
-                        """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
+                        query2 = _CREATE_USR_SCHEMA_TPL.format(
+                            _qgis_pkg_schema = qgis_pkg_ident,
                             _usr_name = pysql.Literal(usr_name)
-                        ) 
+                        )
 
                         # Update progress bar
                         msg = f"Creating user: '{usr_name}'"
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        self.emit_progress(curr_step, steps_tot, msg)
 
                         try:
                             with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                                cur.execute(query2)
-                            temp_conn.commit()
+                                # psycopg2 offers no pipeline mode, but both statements
+                                # can still travel to the server in a single round trip
+                                # when submitted together.
+                                cur.execute(query + query2)
 
                         except (Exception, psycopg2.Error) as error:
                             temp_conn.rollback()
                             fail_flag = True
-                            gen_f.critical_log(
-                                func=self.install_thread,
-                                location=FILE_LOCATION,
+                            self._log(
                                 header=f"Creating QGIS Package default user '{usr_name}'",
                                 error=error)
                             self.sig_fail.emit()
                             break # Exit from the loop
 
                 # 3) If required, grant them (default) privileges: ro or rw on all existing cdb_schemas
-                if set_privileges_num == 0:
-                    pass
-                else:
+                if set_privileges_num > 0:
                     for suf in def_usr_access_suffixes:
                         # Prepare the nale of the user
                         usr_name = "_".join(["qgis_user", suf])
 
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := {_priv_type}, cdb_schema := NULL);
-                        """).format(
-                            _qgis_pkg_schema = pysql.Identifier(self.dlg.QGIS_PKG_SCHEMA),
+                        query = _GRANT_DEFAULT_USR_PRIVILEGES_TPL.format(
+                            _qgis_pkg_schema = qgis_pkg_ident,
                             _usr_name = pysql.Literal(usr_name),
                             _priv_type = pysql.Literal(suf)
-                        )                    
+                        )
 
                         # Update progress bar with current step and script.
                         msg = f"Setting privileges for user: '{usr_name}'"
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        self.emit_progress(curr_step, steps_tot, msg)
 
                         try:
                             with temp_conn.cursor() as cur:
                                 cur.execute(query)
-                            temp_conn.commit()
 
                         except (Exception, psycopg2.Error) as error:
                             temp_conn.rollback()
                             fail_flag = True
-                            gen_f.critical_log(
-                                func=self.install_thread,
-                                location=FILE_LOCATION,
+                            self._log(
                                 header=f"Granting {suf} privileges to user {usr_name}",
                                 error=error)
                             self.sig_fail.emit()
@@ -298,9 +432,7 @@ class QgisPackageInstallWorker(QObject):
         except (Exception, psycopg2.Error) as error:
             temp_conn.rollback()
             fail_flag = True
-            gen_f.critical_log(
-                func=self.install_thread,
-                location=FILE_LOCATION,
+            self._log(
                 header="Establishing temporary connection",
                 error=error)
             self.sig_fail.emit()
@@ -310,8 +442,7 @@ class QgisPackageInstallWorker(QObject):
             self.sig_success.emit()
 
         self.sig_finished.emit()
-        # Close connection
-        temp_conn.close()
+        # The shared admin connection stays open for the next worker run.
         return None
 
 #--EVENTS  (start)  ##############################################################
@@ -323,6 +454,9 @@ def evt_qgis_pkg_install_success(dlg: CDB4AdminDialog, pkg: str) -> None:
     Shows success message in Connection Status groupbox
     Shows success message in QgsMessageLog
     """
+    # The installation just changed the catalog: bypass the cached check.
+    sh_sql.invalidate_schema_check_cache()
+
     if sh_sql.is_qgis_pkg_installed(dlg=dlg):
         # Replace with Success msg.
         msg = dlg.msg_bar.createMessage(c.INST_SUCC_MSG.format(pkg=pkg))
@@ -366,6 +500,9 @@ def evt_qgis_pkg_install_fail(dlg: CDB4AdminDialog, pkg: str) -> None:
     Shows fail message in Connection Status groupbox
     Shows fail message in QgsMessageLog
     """
+    # The installation may have partially changed the catalog: drop the cache.
+    sh_sql.invalidate_schema_check_cache()
+
     # Replace with Failure msg.
     msg = dlg.msg_bar.createMessage(c.INST_FAIL_MSG.format(pkg=pkg))
     dlg.msg_bar.pushWidget(msg, Qgis.MessageLevel.Critical, 5)
@@ -455,6 +592,16 @@ class QgisPackageUninstallWorker(QObject):
     def __init__(self, dlg: CDB4AdminDialog):
         super().__init__()
         self.dlg = dlg
+        self._last_emit: float = 0.0
+
+    def emit_progress(self, curr_step: int, steps_tot: int, msg: str) -> None:
+        """Emits sig_progress at most every ~50 ms (but always for the last step),
+        so tight loops do not flood the GUI thread with queued signals.
+        """
+        now = time.monotonic()
+        if now - self._last_emit > 0.05 or curr_step == steps_tot:
+            self.sig_progress.emit(curr_step, msg)
+            self._last_emit = now
 
     def uninstall_thread(self):
 
@@ -506,20 +653,12 @@ class QgisPackageUninstallWorker(QObject):
         # Flag to help us break from a failing installation.
         fail_flag: bool = False
         qgis_pkg_schema: str = self.dlg.QGIS_PKG_SCHEMA
+        qgis_pkg_ident = pysql.Identifier(qgis_pkg_schema)
 
-        # Get users
-        usr_names_all = sql.list_qgis_pkg_usrgroup_members(dlg=dlg)
-        usr_names: list[str] = []
-        if usr_names_all:
-            usr_names = [elem for elem in usr_names_all if elem != 'postgres']
-        else:
-            usr_names = [elem for elem in usr_names_all]
-
-        # Get usr_schemas
-        usr_schemas = sql.list_usr_schemas(dlg=dlg)
-
-        # Get cdb_schemas
-        cdb_schemas = sql.list_all_cdb_schemas(dlg=dlg)
+        # Get users, usr_schemas and cdb_schemas in a single round trip
+        # ('postgres' is already filtered out server-side)
+        usr_names_all, usr_schemas, cdb_schemas = sql.list_uninstall_inventory(dlg=dlg)
+        usr_names: list[str] = list(usr_names_all)
 
         drop_layers_funcs: list[str] = [
             "drop_layers_bridge",
@@ -562,31 +701,26 @@ class QgisPackageUninstallWorker(QObject):
         curr_step: int = 0
 
         try:
-            temp_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
+            temp_conn = get_admin_db_connection(dlg=dlg, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
             with temp_conn:
 
                 # 1) revoke privileges: for all users
-                if usr_names_num == 0:
-                    pass # nothing to do 
-                else:
+                if usr_names_num > 0:
                     for usr_name in usr_names:
 
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schema := NULL);
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
+                        query = _REVOKE_USR_PRIVILEGES_TPL.format(
+                            _qgis_pkg_schema = qgis_pkg_ident,
                             _usr_name = pysql.Literal(usr_name)
                             )
 
                         # Update progress bar
                         msg = f"Revoking privileges from user: {usr_name}"
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        self.emit_progress(curr_step, steps_tot, msg)
 
                         try:
                             with temp_conn.cursor() as cur:
                                 cur.execute(query)
-                            temp_conn.commit()
 
                         except (Exception, psycopg2.Error) as error:
                             temp_conn.rollback()
@@ -599,91 +733,106 @@ class QgisPackageUninstallWorker(QObject):
                             self.sig_fail.emit()
 
                 # 2) drop layers:  usr_names_num x cdb_schemas_num x drop_functions_num
-                if usr_names_num == 0 or cdb_schemas_num == 0:
-                    pass # nothing to do 
-                else:
-                    for usr_name in usr_names:
-                        # Get current user's schema
-                        usr_schema = sh_sql.create_qgis_usr_schema_name(dlg, usr_name)
-                        for cdb_schema in cdb_schemas:
-                            for drop_layers_func in drop_layers_funcs:
-
-                                query = pysql.SQL("""
-                                    SELECT {_qgis_pkg_schema}.{_drop_layers_func}({_usr_name},{_cdb_schema});
-                                    """).format(
-                                    _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema),
-                                    _drop_layers_func = pysql.Identifier(drop_layers_func),
-                                    _usr_name = pysql.Literal(usr_name),
-                                    _cdb_schema = pysql.Literal(cdb_schema)
-                                    )
-
-                                # Update progress bar
-                                msg = f"In {usr_schema}: dropping layers for {cdb_schema}"
-                                curr_step += 1
-                                self.sig_progress.emit(curr_step, msg)
-
-                                try:
-                                    with temp_conn.cursor() as cur:
-                                        cur.execute(query)
-                                    temp_conn.commit()
-
-                                except (Exception, psycopg2.Error) as error:
-                                    fail_flag = True
-                                    gen_f.critical_log(
-                                        func=self.uninstall_thread,
-                                        location=FILE_LOCATION,
-                                        header="Dropping layers",
-                                        error=error)
-                                    temp_conn.rollback()
-                                    self.sig_fail.emit()
+                if usr_names_num > 0 and cdb_schemas_num > 0:
+                    # Run the whole usr_names x cdb_schemas x drop functions loop
+                    # server-side in one anonymous PL/pgSQL block: only coordination
+                    # flowed back and forth anyway, so a single round trip replaces
+                    # N x M x K statements. (The legacy qgis_pkg <= 0.8 offers no
+                    # helper function for this, hence the DO block.)
+                    drop_calls = pysql.SQL("\n").join(
+                        _PERFORM_DROP_LAYERS_TPL.format(
+                            _qgis_pkg_schema = qgis_pkg_ident,
+                            _drop_layers_func = pysql.Identifier(drop_layers_func)
+                            )
+                        for drop_layers_func in drop_layers_funcs)
+
+                    query = pysql.SQL("""
+                        DO $BODY$
+                        DECLARE
+                            usr_name text;
+                            cdb_schema text;
+                        BEGIN
+                        FOREACH usr_name IN ARRAY {_usr_names} LOOP
+                            FOREACH cdb_schema IN ARRAY {_cdb_schemas} LOOP
+                                {_drop_calls}
+                            END LOOP;
+                        END LOOP;
+                        END $BODY$;
+                        """).format(
+                        _usr_names = pysql.Literal(list(usr_names)),
+                        _cdb_schemas = pysql.Literal(list(cdb_schemas)),
+                        _drop_calls = drop_calls
+                        )
+
+                    # Derive each user's schema name once: the helper issues a DB
+                    # round trip, so don't repeat it per combination.
+                    usr_schema_by_name: dict[str, str] = {usr_name: sh_sql.create_qgis_usr_schema_name(dlg, usr_name) for usr_name in usr_names}
+
+                    # Update progress bar (one tick per combination, dropped as a single batch)
+                    for usr_name, cdb_schema, drop_layers_func in itertools.product(usr_names, cdb_schemas, drop_layers_funcs):
+                        msg = f"In {usr_schema_by_name[usr_name]}: dropping layers for {cdb_schema}"
+                        curr_step += 1
+                        self.emit_progress(curr_step, steps_tot, msg)
+
+                    try:
+                        with temp_conn.cursor() as cur:
+                            cur.execute(query)
+
+                    except (Exception, psycopg2.Error) as error:
+                        fail_flag = True
+                        gen_f.critical_log(
+                            func=self.uninstall_thread,
+                            location=FILE_LOCATION,
+                            header="Dropping layers",
+                            error=error)
+                        temp_conn.rollback()
+                        self.sig_fail.emit()
 
                 # 3) drop usr_schemas
-                if usr_schemas_num == 0:
-                    pass # nothing to do 
-                else:
-                    for usr_schema in usr_schemas:
-                        query = pysql.SQL("""
-                        DROP SCHEMA IF EXISTS {_usr_schema} CASCADE;
+                if usr_schemas_num > 0:
+                    # PostgreSQL accepts a comma-separated schema list, so all
+                    # usr_schemas are dropped with a single statement (one round trip).
+                    query = pysql.SQL("""
+                        DROP SCHEMA IF EXISTS {_usr_schemas} CASCADE;
                         """).format(
-                        _usr_schema = pysql.Identifier(usr_schema)
+                        _usr_schemas = pysql.SQL(", ").join(pysql.Identifier(usr_schema) for usr_schema in usr_schemas)
                         )
 
-                        # Update progress bar
+                    # Update progress bar (one tick per schema, dropped as a single batch)
+                    for usr_schema in usr_schemas:
                         msg = " ".join(["Dropping user schema:", usr_schema])
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        self.emit_progress(curr_step, steps_tot, msg)
 
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                    try:
+                        with temp_conn.cursor() as cur:
+                            cur.execute(query)
 
-                        except (Exception, psycopg2.Error) as error:
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread,
-                                location=FILE_LOCATION,
-                                header=f"Dropping user schema {usr_schema}",
-                                error=error)
-                            temp_conn.rollback()
-                            self.sig_fail.emit()
+                    except (Exception, psycopg2.Error) as error:
+                        fail_flag = True
+                        gen_f.critical_log(
+                            func=self.uninstall_thread,
+                            location=FILE_LOCATION,
+                            header="Dropping user schemas",
+                            error=error)
+                        temp_conn.rollback()
+                        self.sig_fail.emit()
 
                 # 4) Drop "qgis_pkg" schema
                 query = pysql.SQL("""
                     DROP SCHEMA IF EXISTS {_qgis_pkg_schema} CASCADE;
                     """).format(
-                    _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
+                    _qgis_pkg_schema = qgis_pkg_ident
                     )
 
                 # Update progress bar
                 msg = " ".join(["Dropping schema:", qgis_pkg_schema])
                 curr_step += 1
-                self.sig_progress.emit(curr_step, msg)
+                self.emit_progress(curr_step, steps_tot, msg)
 
                 try:
                     with temp_conn.cursor() as cur:
                         cur.execute(query)
-                    temp_conn.commit()
 
                 except (Exception, psycopg2.Error) as error:
                     temp_conn.rollback()
@@ -710,8 +859,7 @@ class QgisPackageUninstallWorker(QObject):
             self.sig_success.emit()
 
         self.sig_finished.emit()
-        # Close temp connection
-        temp_conn.close()
+        # The shared admin connection stays open for the next worker run.
         return None
 
 
@@ -788,203 +936,100 @@ class QgisPackageUninstallWorker(QObject):
 
         try:
             # Open new temp session, reserved for installation.
-            temp_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
+            temp_conn = get_admin_db_connection(dlg=dlg, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
             with temp_conn:
 
-                # 1) revoke privileges: for all normal users
-                if usr_names_num == 0:
-                    pass # nothing to do 
-                else:
-                    for usr_name in usr_names:
+                qgis_pkg_ident = pysql.Identifier(qgis_pkg_schema)
 
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schemas := NULL);
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_name = pysql.Literal(usr_name)
-                            )
-
-                        # Update progress bar
-                        msg: str = f"Revoking privileges from user: {usr_name}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                # Compose all uninstall statements client-side and submit them as one
+                # multi-statement script: none of them returns data the client needs,
+                # so a single round trip (and a single commit) replaces one per
+                # statement. Progress ticks are emitted while composing.
+                parts: list[pysql.Composed] = []
 
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()               
+                # 1) revoke privileges: for all normal users
+                for usr_name in usr_names:
+                    parts.append(_REVOKE_USR_PRIVILEGES_09_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
+                        _usr_name = pysql.Literal(usr_name)
+                        ))
 
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread,
-                                location=FILE_LOCATION,
-                                header="Revoking privileges from users",
-                                error=error)
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg: str = f"Revoking privileges from user: {usr_name}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 2) reset privileges for superusers ("postgres" and, in case, the current user)
-                if usr_names_su_num == 0:
-                    pass # nothing to do 
-                else:
-                    for usr_name in usr_names_su:
-
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := 'rw', cdb_schemas := NULL);
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_name = pysql.Literal(usr_name)
-                            )
-
-                        # Update progress bar
-                        msg = f"Resetting privileges for user: {usr_name}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()               
+                for usr_name in usr_names_su:
+                    parts.append(_GRANT_RW_USR_PRIVILEGES_09_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
+                        _usr_name = pysql.Literal(usr_name)
+                        ))
 
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread,
-                                location=FILE_LOCATION,
-                                header=f"Resetting privileges from superusers",
-                                error=error)
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg = f"Resetting privileges for user: {usr_name}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 3) drop feature types (layers)
-                if drop_tuples_num == 0:
-                    pass # nothing to do 
-                else:
-                    #ft: FeatureType
-                    for usr_schema, cdb_schema, feat_type in drop_tuples:
-                        ft = dlg.FeatureTypesRegistry[feat_type]
-                        module_drop_func = ft.layers_drop_function
+                for usr_schema, cdb_schema, feat_type in drop_tuples:
+                    ft = dlg.FeatureTypesRegistry[feat_type]
+                    module_drop_func = ft.layers_drop_function
+
+                    # Prepare the query for the drop_layer_{*} function
+                    # E.g. qgis_pkg.drop_layers_building(usr_schema, cdb_schema)
+                    parts.append(_DROP_LAYERS_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
+                        _drop_layers_func = pysql.Identifier(module_drop_func),
+                        _usr = pysql.Literal(usr_schema),
+                        _cdb_schema = pysql.Literal(cdb_schema)
+                        ))
 
-                        # Prepare the query for the drop_layer_{*} function
-                        # E.g. qgis_pkg.drop_layers_building(usr_schema, cdb_schema)
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.{_module_drop_func}({_usr_schema},{_cdb_schema});
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema),
-                            _module_drop_func = pysql.Identifier(module_drop_func),
-                            _usr_schema = pysql.Literal(usr_schema),
-                            _cdb_schema = pysql.Literal(cdb_schema)
-                            )
-
-                        # Update progress bar
-                        msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
-
-                        except (Exception, psycopg2.Error) as error:
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread,
-                                location=FILE_LOCATION,
-                                header="Dropping layers",
-                                error=error)
-                            temp_conn.rollback()
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 4) drop usr_schemas
-                if usr_schemas_num == 0:
-                    pass # nothing to do 
-                else:
-                    for usr_schema in usr_schemas:
-
-                        query = pysql.SQL("""
-                            DROP SCHEMA IF EXISTS {_usr_schema} CASCADE;
-                            """).format(
-                            _usr_schema = pysql.Identifier(usr_schema)
-                            )
-
-                        # Update progress bar
-                        msg = f"Dropped user schema: {usr_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                for usr_schema in usr_schemas:
+                    parts.append(_DROP_SCHEMA_CASCADE_TPL.format(
+                        _schema = pysql.Identifier(usr_schema)
+                        ))
 
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread,
-                                location=FILE_LOCATION,
-                                header="Dropping user schemas",
-                                error=error)
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg = f"Dropped user schema: {usr_schema}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 5) Drop database group
                 if not self.dlg.GROUP_NAME:
                     self.dlg.GROUP_NAME = sql.create_qgis_pkg_usrgroup_name(dlg=dlg)
 
-                query = pysql.SQL("""
-                    DROP ROLE IF EXISTS {_qgis_pkg_usrgroup};
-                    """).format(
+                parts.append(pysql.SQL("DROP ROLE IF EXISTS {_qgis_pkg_usrgroup};").format(
                     _qgis_pkg_usrgroup = pysql.Identifier(dlg.GROUP_NAME)
-                    )
+                    ))
 
                 # Update progress bar
                 msg = f"Dropping group {dlg.GROUP_NAME}"
                 curr_step += 1
-                self.sig_progress.emit(curr_step, msg)
-
-                try:
-                    with temp_conn.cursor() as cur:
-                        cur.execute(query)
-                    temp_conn.commit()
-
-                except (Exception, psycopg2.Error) as error:
-                    temp_conn.rollback()
-                    fail_flag = True
-                    gen_f.critical_log(
-                        func=self.uninstall_thread,
-                        location=FILE_LOCATION,
-                        header=f"Dropping group '{dlg.GROUP_NAME}'",
-                        error=error)
-                    self.sig_fail.emit()
+                self.emit_progress(curr_step, steps_tot, msg)
 
                 # 6) drop qgis_pkg schema
-                query = pysql.SQL("""
-                    DROP SCHEMA IF EXISTS {_qgis_pkg_schema} CASCADE;
-                    """).format(
-                    _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
-                    )
+                parts.append(pysql.SQL("DROP SCHEMA IF EXISTS {_qgis_pkg_schema} CASCADE;").format(
+                    _qgis_pkg_schema = qgis_pkg_ident
+                    ))
 
                 # Update progress bar with current step and script.
                 msg = "Dropping QGIS Package schema"
-                curr_step += 1            
-                self.sig_progress.emit(curr_step, msg)
-
-                try:
-                    with temp_conn.cursor() as cur:
-                        cur.execute(query)
-                    temp_conn.commit()
+                curr_step += 1
+                self.emit_progress(curr_step, steps_tot, msg)
 
-                except (Exception, psycopg2.Error) as error:
-                    temp_conn.rollback()
-                    fail_flag = True
-                    gen_f.critical_log(
-                        func=self.uninstall_thread,
-                        location=FILE_LOCATION,
-                        header=f"Dropping QGIS Package schema '{qgis_pkg_schema}'",
-                        error=error)
-                    self.sig_fail.emit()
+                fail_flag = execute_batched_stages(
+                    worker=self,
+                    temp_conn=temp_conn,
+                    parts=parts,
+                    func=self.uninstall_thread,
+                    header=f"Uninstalling the QGIS Package schema '{qgis_pkg_schema}'")
 
         except (Exception, psycopg2.Error) as error:
             temp_conn.rollback()
@@ -1000,8 +1045,7 @@ class QgisPackageUninstallWorker(QObject):
             self.sig_success.emit()
 
         self.sig_finished.emit()
-        # Close temp connection
-        temp_conn.close()
+        # The shared admin connection stays open for the next worker run.
         return None
 
 
@@ -1027,18 +1071,18 @@ class QgisPackageUninstallWorker(QObject):
        
         curr_usr = dlg.DB.username # this is a superuser, as he has succesfully logged in and is using the GUI.
 
-        # Get users that are members of the group
-        usr_names_all = sql.list_qgis_pkg_usrgroup_members(dlg=dlg)
+        # Get the group members, the usr_schemas and all cdb_schemas in a single round trip
+        usr_names_all, usr_schemas, cdb_schemas = sql.list_uninstall_inventory(dlg=dlg)
         # print("usr_names_all:", usr_names_all)
+        # print("uninstall usr_schemas:", usr_schemas)
+        # print("Existing cdb_schemas:", cdb_schemas)
         
-        usr_names: list[str] = []
+        usr_names: list[str] = list(usr_names_all) # 'postgres' is already filtered out server-side
         usr_names_su: list[str] = ["postgres"]
 
-        if usr_names_all:
-            usr_names = [elem for elem in usr_names_all if elem != "postgres"]
-            if curr_usr != "postgres":
-                usr_names = [elem for elem in usr_names_all if elem != curr_usr]
-                usr_names_su.append(curr_usr)
+        if usr_names_all and curr_usr != "postgres":
+            usr_names = [elem for elem in usr_names_all if elem != curr_usr]
+            usr_names_su.append(curr_usr)
 
         # print("usr_names:", usr_names)
         # print("usr_names_su:", usr_names_su)
@@ -1054,16 +1098,6 @@ class QgisPackageUninstallWorker(QObject):
             drop_detail_views = [*set([item[0:2] for item in drop_tuples])]
             # print("drop_detail_views", drop_detail_views)
 
-        # Get usr_schemas
-        # usr_schemas: tuple[str, ...] = ()
-        usr_schemas = sql.list_usr_schemas(dlg=dlg)
-        # print("uninstall usr_schemas:", usr_schemas)
-
-        # Get all cdb_schemas
-        # cdb_schemas: tuple[str]
-        cdb_schemas = sql.list_all_cdb_schemas(dlg=dlg)
-        # print("Existing cdb_schemas:", cdb_schemas)
-
         # Set progress bar goal:
         # 1) revoke privileges: 1 x len(usr_names) actions
         # 2) reset privileges for superusers: 1 * len(usr_names_su) actions
@@ -1110,264 +1144,205 @@ class QgisPackageUninstallWorker(QObject):
         temp_conn: pyconn
         try:
             # Open new temp session, reserved for installation.
-            temp_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
+            temp_conn = get_admin_db_connection(dlg=dlg, app_name=" ".join([dlg.DLG_NAME_LABEL, "(QGIS Package Uninstallation)"]))
             with temp_conn:
                 # Start measuring time
                 time_start = time.time()
 
-                # 1) revoke privileges: for all normal users
-                if usr_names_num > 0:
-                    for usr_name in usr_names:
-
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schemas := NULL);
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_name = pysql.Literal(usr_name)
-                            )
-
-                        # Update progress bar
-                        msg = f"Revoking privileges from user: {usr_name}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()               
-
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Revoking privileges from users",
-                                error=error)
-                            self.sig_fail.emit()
-
-                print("Revoking privileges for users: done")
-
-                # 2) reset privileges for superusers ("postgres" and, in case, the current user)
-                if usr_names_su_num > 0:
-                    for usr_name in usr_names_su:
-
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := 'rw', cdb_schemas := NULL);
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_name = pysql.Literal(usr_name)
-                            )
-
-                        # Update progress bar
-                        msg = f"Resetting privileges for user: {usr_name}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()               
-
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Resetting privileges from superusers",
-                                error=error)
-                            self.sig_fail.emit()
+                qgis_pkg_ident = pysql.Identifier(dlg.QGIS_PKG_SCHEMA)
 
-                print("Revoking privileges for superusers: done")
+                # All stages run in a single transaction on one cursor, with a
+                # single commit at the end: one WAL flush instead of one per
+                # stage, and nothing is left half-uninstalled on failure.
+                try:
+                    with temp_conn.cursor() as cur:
 
-                # 3) drop feature types (layers)
-                if drop_tuples_num > 0:
-                    for usr_schema, cdb_schema, feat_type in drop_tuples:
-                        ft = dlg.FeatureTypesRegistry[feat_type]
-                        module_drop_func = ft.layers_drop_function
+                        # 1) revoke privileges: for all normal users
+                        # A single set-returning call over the unnested user array replaces
+                        # one statement (and one commit) per user. Fanning the users out
+                        # over several parallel connections was considered instead, but
+                        # QGIS ships psycopg2 only (no async driver) and the revokes
+                        # serialise on the same catalog locks anyway, so one set-based
+                        # statement is both simpler and at least as fast.
+                        if usr_names_num > 0:
+                            query = pysql.SQL("""
+                                SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := u, cdb_schemas := NULL) FROM unnest({_usr_names}::varchar[]) AS u;
+                                """).format(
+                                _qgis_pkg_schema = qgis_pkg_ident,
+                                _usr_names = pysql.Literal(list(usr_names))
+                                )
+
+                            # Update progress bar
+                            for usr_name in usr_names:
+                                msg = f"Revoking privileges from user: {usr_name}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
 
-                        # Prepare the query for the drop_layer_{*} function
-                        # E.g. qgis_pkg.drop_layers_building(usr_schema, cdb_schema)
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.{_module_drop_func}({_usr_schema},{_cdb_schema});
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema),
-                            _module_drop_func = pysql.Identifier(module_drop_func),
-                            _usr_schema = pysql.Literal(usr_schema),
-                            _cdb_schema = pysql.Literal(cdb_schema)
-                            )
+                            cur.execute(query)
 
-                        # Update progress bar
-                        msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        print("Revoking privileges for users: done")
 
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                        # 2) reset privileges for superusers ("postgres" and, in case, the current user)
+                        if usr_names_su_num > 0:
+                            query = pysql.SQL("""
+                                SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := u, priv_type := 'rw', cdb_schemas := NULL) FROM unnest({_usr_names}::varchar[]) AS u;
+                                """).format(
+                                _qgis_pkg_schema = qgis_pkg_ident,
+                                _usr_names = pysql.Literal(list(usr_names_su))
+                                )
 
-                        except (Exception, psycopg2.Error) as error:
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Dropping layers",
-                                error=error)
-                            temp_conn.rollback()
-                            self.sig_fail.emit()
+                            # Update progress bar
+                            for usr_name in usr_names_su:
+                                msg = f"Resetting privileges for user: {usr_name}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
+
+                            cur.execute(query)
+
+                        print("Revoking privileges for superusers: done")
+
+                        # 3) drop feature types (layers)
+                        # One round trip for all (usr_schema, cdb_schema, feat_type)
+                        # tuples: the drop_layers_* dispatch runs server-side over
+                        # unnested parallel arrays. A packaged dispatch function
+                        # cannot be assumed to exist in the installed qgis_pkg,
+                        # hence the anonymous block with dynamic SQL.
+                        if drop_tuples_num > 0:
+                            dt_usr_schemas = [item[0] for item in drop_tuples]
+                            dt_cdb_schemas = [item[1] for item in drop_tuples]
+                            dt_drop_funcs = [dlg.FeatureTypesRegistry[item[2]].layers_drop_function for item in drop_tuples]
+
+                            query = pysql.SQL("""
+                                DO $BODY$
+                                DECLARE
+                                    r record;
+                                BEGIN
+                                    FOR r IN
+                                        SELECT t.usr_schema, t.cdb_schema, t.drop_func
+                                        FROM unnest({_usr_schemas}::varchar[], {_cdb_schemas}::varchar[], {_drop_funcs}::varchar[]) AS t(usr_schema, cdb_schema, drop_func)
+                                    LOOP
+                                        EXECUTE format('SELECT %I.%I(%L,%L)', {_qgis_pkg_schema}, r.drop_func, r.usr_schema, r.cdb_schema);
+                                    END LOOP;
+                                END $BODY$;
+                                """).format(
+                                _qgis_pkg_schema = pysql.Literal(dlg.QGIS_PKG_SCHEMA),
+                                _usr_schemas = pysql.Literal(dt_usr_schemas),
+                                _cdb_schemas = pysql.Literal(dt_cdb_schemas),
+                                _drop_funcs = pysql.Literal(dt_drop_funcs)
+                                )
+
+                            # Update progress bar
+                            for usr_schema, cdb_schema, feat_type in drop_tuples:
+                                msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
+
+                            cur.execute(query)
+
+                        print("Dropping layers: done")
+
+                        # 4) drop detail views (dt_* views)
+                        # The qgis_pkg version being uninstalled cannot be assumed to
+                        # ship a server-side uninstall helper, so the per-item loop is
+                        # folded into an anonymous PL/pgSQL block executed once. The
+                        # generic attribute indices (former stage 7) are dropped in the
+                        # same block: one round trip for both stages.
+                        if drop_detail_views_num > 0 or cdb_schemas_num > 0:
+
+                            dv_usr_schemas = [item[0] for item in drop_detail_views]
+                            dv_cdb_schemas = [item[1] for item in drop_detail_views]
+
+                            query = pysql.SQL("""
+                                DO $BODY$
+                                DECLARE
+                                    i integer;
+                                    cdb_schema varchar;
+                                BEGIN
+                                    FOR i IN 1..coalesce(array_length({_dv_usr_schemas}::varchar[], 1), 0) LOOP
+                                        PERFORM {_qgis_pkg_schema}.drop_detail_view(({_dv_usr_schemas}::varchar[])[i], ({_dv_cdb_schemas}::varchar[])[i]);
+                                    END LOOP;
+                                    FOREACH cdb_schema IN ARRAY {_cdb_schemas}::varchar[] LOOP
+                                        PERFORM {_qgis_pkg_schema}.drop_ga_indices(cdb_schema);
+                                    END LOOP;
+                                END $BODY$;
+                                """).format(
+                                _qgis_pkg_schema = qgis_pkg_ident,
+                                _dv_usr_schemas = pysql.Literal(dv_usr_schemas),
+                                _dv_cdb_schemas = pysql.Literal(dv_cdb_schemas),
+                                _cdb_schemas = pysql.Literal(list(cdb_schemas))
+                                )
+
+                            # Update progress bar
+                            for usr_schema, cdb_schema in drop_detail_views:
+                                msg = f"In {usr_schema}: dropping detail views for {cdb_schema}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
 
-                print("Dropping layers: done")
+                            for cdb_schema in cdb_schemas:
+                                msg = f"Dropped ga indices from: {cdb_schema}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
 
-                # 4) drop detail views (dt_* views)
-                if drop_detail_views_num > 0:
-                    for usr_schema, cdb_schema in drop_detail_views:
+                            cur.execute(query)
 
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.drop_detail_view({_usr_schema},{_cdb_schema} );
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_schema = pysql.Literal(usr_schema),
-                            _cdb_schema = pysql.Literal(cdb_schema)
-                            )
+                        print("Dropping detail views and ga indices: done")
 
-                        # Update progress bar
-                        msg = f"In {usr_schema}: dropping detail views for {cdb_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                        # 5) drop usr_schemas
+                        # DROP SCHEMA accepts a list of schemas, so all of them go in
+                        # one statement instead of one per schema.
+                        if usr_schemas_num > 0:
+                            query = pysql.SQL("""
+                                DROP SCHEMA IF EXISTS {_usr_schemas} CASCADE;
+                                """).format(
+                                _usr_schemas = pysql.SQL(", ").join(pysql.Identifier(usr_schema) for usr_schema in usr_schemas)
+                                )
 
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                            # Update progress bar
+                            for usr_schema in usr_schemas:
+                                msg = f"Dropped user schema: {usr_schema}"
+                                curr_step += 1
+                                self.emit_progress(curr_step, steps_tot, msg)
 
-                        except (Exception, psycopg2.Error) as error:
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Dropping detail views",
-                                error=error)
-                            temp_conn.rollback()
-                            self.sig_fail.emit()
-                            break
+                            cur.execute(query)
 
-                print("Dropping detail views: done")
+                        print("Dropping usr_schemas: done")
 
-                # 5) drop usr_schemas
-                if usr_schemas_num > 0:
-                    for usr_schema in usr_schemas:
+                        # 8) Drop database group
+                        if not self.dlg.GROUP_NAME:
+                            # Create the name and assign it to the variable
+                            self.dlg.GROUP_NAME = sql.create_qgis_pkg_usrgroup_name(dlg=dlg)
 
                         query = pysql.SQL("""
-                            DROP SCHEMA IF EXISTS {_usr_schema} CASCADE;
+                            DROP ROLE IF EXISTS {_qgis_pkg_usrgroup};
                             """).format(
-                            _usr_schema = pysql.Identifier(usr_schema)
+                            _qgis_pkg_usrgroup = pysql.Identifier(dlg.GROUP_NAME)
                             )
 
                         # Update progress bar
-                        msg = f"Dropped user schema: {usr_schema}"
+                        msg = f"Dropping group {dlg.GROUP_NAME}"
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                        self.emit_progress(curr_step, steps_tot, msg)
 
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Dropping user schemas",
-                                error=error)
-                            self.sig_fail.emit()
-
-                print("Dropping usr_schemas: done")
+                        cur.execute(query)
 
-                # 7) Drop ga_indices
-                if cdb_schemas_num > 0:
-                    for cdb_schema in cdb_schemas:
+                        print("Dropping database group: done")
 
+                        # 9) drop qgis_pkg schema
                         query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.drop_ga_indices({_cdb_schema});
+                            DROP SCHEMA IF EXISTS {_qgis_pkg_schema} CASCADE;
                             """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _cdb_schema = pysql.Literal(cdb_schema)
+                            _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
                             )
 
-                        # Update progress bar
-                        msg = f"Dropped ga indices from: {cdb_schema}"
+                        # Update progress bar with current step and script.
+                        msg = "Dropping QGIS Package schema"
                         curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
-
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.uninstall_thread_qgis_pkg_current,
-                                location=FILE_LOCATION,
-                                header="Dropping indices in generic attribute tables",
-                                error=error)
-                            self.sig_fail.emit()
-
-                print("Dropping ga indices: done")
-
-                # 8) Drop database group
-                if not self.dlg.GROUP_NAME:
-                    # Create the name and assign it to the variable
-                    self.dlg.GROUP_NAME = sql.create_qgis_pkg_usrgroup_name(dlg=dlg)
-
-                query = pysql.SQL("""
-                    DROP ROLE IF EXISTS {_qgis_pkg_usrgroup};
-                    """).format(
-                    _qgis_pkg_usrgroup = pysql.Identifier(dlg.GROUP_NAME)
-                    )
-
-                # Update progress bar
-                msg = f"Dropping group {dlg.GROUP_NAME}"
-                curr_step += 1
-                self.sig_progress.emit(curr_step, msg)
+                        self.emit_progress(curr_step, steps_tot, msg)
 
-                try:
-                    with temp_conn.cursor() as cur:
                         cur.execute(query)
-                    temp_conn.commit()
-
-                except (Exception, psycopg2.Error) as error:
-                    temp_conn.rollback()
-                    fail_flag = True
-                    gen_f.critical_log(
-                        func=self.uninstall_thread_qgis_pkg_current,
-                        location=FILE_LOCATION,
-                        header=f"Dropping group '{dlg.GROUP_NAME}'",
-                        error=error)
-                    self.sig_fail.emit()
 
-                print("Dropping database group: done")
+                        print("Dropping qgis_pkg schema: done")
 
-                # 9) drop qgis_pkg schema
-                query = pysql.SQL("""
-                    DROP SCHEMA IF EXISTS {_qgis_pkg_schema} CASCADE;
-                    """).format(
-                    _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
-                    )
-
-                # Update progress bar with current step and script.
-                msg = "Dropping QGIS Package schema"
-                curr_step += 1            
-                self.sig_progress.emit(curr_step, msg)
-
-                try:
-                    with temp_conn.cursor() as cur:
-                        cur.execute(query)
                     temp_conn.commit()
 
                 except (Exception, psycopg2.Error) as error:
@@ -1376,12 +1351,10 @@ class QgisPackageUninstallWorker(QObject):
                     gen_f.critical_log(
                         func=self.uninstall_thread_qgis_pkg_current,
                         location=FILE_LOCATION,
-                        header=f"Dropping QGIS Package schema '{qgis_pkg_schema}'",
+                        header=f"Uninstalling the QGIS Package schema '{qgis_pkg_schema}'",
                         error=error)
                     self.sig_fail.emit()
 
-                print("Dropping qgis_pkg schema: done")
-
                 # Measure elapsed time
                 print(f"Uninstallation of the QGIS Package completed in {round((time.time() - time_start), 4)} seconds")
 
@@ -1399,8 +1372,7 @@ class QgisPackageUninstallWorker(QObject):
             self.sig_success.emit()
 
         self.sig_finished.emit()
-        # Close temp connection
-        temp_conn.close()
+        # The shared admin connection stays open for the next worker run.
         return None
 
 
@@ -1416,6 +1388,9 @@ def evt_qgis_pkg_uninstall_success(dlg: CDB4AdminDialog) -> None:
 
     qgis_pkg_schema = dlg.QGIS_PKG_SCHEMA
 
+    # The uninstallation just changed the catalog: bypass the cached check.
+    sh_sql.invalidate_schema_check_cache()
+
     is_qgis_pkg_installed = sh_sql.is_qgis_pkg_installed(dlg=dlg)
 
     ######### FOR DEBUGGING PURPOSES ONLY ##########
@@ -1458,6 +1433,9 @@ def evt_qgis_pkg_uninstall_fail(dlg: CDB4AdminDialog) -> None:
     """
     error: str = 'Uninstallation error'
 
+    # The uninstallation may have partially changed the catalog: drop the cache.
+    sh_sql.invalidate_schema_check_cache()
+
     # Replace with Failure msg.
     msg = dlg.msg_bar.createMessage(error)
     dlg.msg_bar.pushWidget(msg, Qgis.MessageLevel.Critical, 5)
@@ -1529,7 +1507,16 @@ class DropUsrSchemaWorker(QObject):
     def __init__(self, dlg: CDB4AdminDialog):
         super().__init__()
         self.dlg = dlg
+        self._last_emit: float = 0.0
 
+    def emit_progress(self, curr_step: int, steps_tot: int, msg: str) -> None:
+        """Emits sig_progress at most every ~50 ms (but always for the last step),
+        so tight loops do not flood the GUI thread with queued signals.
+        """
+        now = time.monotonic()
+        if now - self._last_emit > 0.05 or curr_step == steps_tot:
+            self.sig_progress.emit(curr_step, msg)
+            self._last_emit = now
 
     def drop_usr_schema_thread(self):
         """Execution method that uninstalls the {usr_schema} from the current database
@@ -1588,154 +1575,92 @@ class DropUsrSchemaWorker(QObject):
 
         try:
             # Open new temp session, reserved for usr_schema installation.
-            temp_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=" ".join([dlg.DLG_NAME_LABEL, "(User schema Uninstallation)"]))
+            temp_conn = get_admin_db_connection(dlg=dlg, app_name=" ".join([dlg.DLG_NAME_LABEL, "(User schema Uninstallation)"]))
             with temp_conn:
 
                 # Start measuring time
                 time_start = time.time()
 
+                qgis_pkg_ident = pysql.Identifier(qgis_pkg_schema)
+
+                # Compose all statements client-side and submit them in one go.
+                # psycopg2 has no pipeline mode, but none of these statements
+                # returns data, so a single multi-statement script achieves the
+                # same: one round trip for the whole sequence.
+                parts: list[pysql.Composed] = []
+
                 if is_superuser:
                     # 1b) reset privileges for superuser for all cdb_schemas
-                    query = pysql.SQL("""
-                        SELECT {_qgis_pkg_schema}.grant_qgis_usr_privileges(usr_name := {_usr_name}, priv_type := 'rw', cdb_schema := NULL);
-                        """).format(
-                        _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
+                    parts.append(_GRANT_RW_USR_PRIVILEGES_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
                         _usr_name = pysql.Literal(usr_name)
-                        )
+                        ))
 
                 else:
                     # 1a) revoke privileges for selected user from all cdb_schemas
-                    query = pysql.SQL("""
-                        SELECT {_qgis_pkg_schema}.revoke_qgis_usr_privileges(usr_name := {_usr_name}, cdb_schema := NULL);
-                        """).format(
-                        _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
+                    parts.append(_REVOKE_USR_PRIVILEGES_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
                         _usr_name = pysql.Literal(usr_name)
-                        )
+                        ))
 
                 # Update progress bar
                 msg = f"Revoking/resetting privileges of user: {usr_name}"
                 curr_step += 1
-                self.sig_progress.emit(curr_step, msg)
-
-                try:
-                    with temp_conn.cursor() as cur:
-                        cur.execute(query)
-                    temp_conn.commit()
-
-                except (Exception, psycopg2.Error) as error:
-                    temp_conn.rollback()
-                    fail_flag = True
-                    gen_f.critical_log(
-                        func=self.drop_usr_schema_thread,
-                        location=FILE_LOCATION,
-                        header=f"Revoking privileges from user '{usr_name}",
-                        error=error)
-                    self.sig_fail.emit()
+                self.emit_progress(curr_step, steps_tot, msg)
 
                 # 2) drop feature types (layers)
-                if drop_tuples_num == 0:
-                    pass
-                else:
-                    for usr_schema, cdb_schema, feat_type in drop_tuples:
+                for usr_schema, cdb_schema, feat_type in drop_tuples:
 
-                        # ft: FeatureType
-                        ft = dlg.FeatureTypesRegistry[feat_type]
-                        module_drop_func = ft.layers_drop_function
-
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.{_module_drop_func}({_usr_name},{_cdb_schema});
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema),
-                            _module_drop_func = pysql.Identifier(module_drop_func),
-                            _usr_name = pysql.Literal(usr_name),
-                            _cdb_schema = pysql.Literal(cdb_schema)
-                            )
+                    # ft: FeatureType
+                    ft = dlg.FeatureTypesRegistry[feat_type]
+                    module_drop_func = ft.layers_drop_function
 
-                        # Update progress bar
-                        msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
+                    parts.append(_DROP_LAYERS_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
+                        _drop_layers_func = pysql.Identifier(module_drop_func),
+                        _usr = pysql.Literal(usr_name),
+                        _cdb_schema = pysql.Literal(cdb_schema)
+                        ))
 
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
-
-                        except (Exception, psycopg2.Error) as error:
-                            temp_conn.rollback()
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.drop_usr_schema_thread,
-                                location=FILE_LOCATION,
-                                header="Dropping layers",
-                                error=error)
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg = f"In {usr_schema}: dropping {feat_type} layers for {cdb_schema}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 3) drop detail views (dt_* views)
-                if drop_detail_views_num == 0:
-                    pass
-                else:
-                    for usr_schema, cdb_schema in drop_detail_views:
-
-                        query = pysql.SQL("""
-                            SELECT {_qgis_pkg_schema}.drop_detail_view({_usr_schema},{_cdb_schema});
-                            """).format(
-                            _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-                            _usr_schema = pysql.Literal(usr_name),
-                            _cdb_schema = pysql.Literal(cdb_schema)
-                            )
+                for usr_schema, cdb_schema in drop_detail_views:
 
-                        # Update progress bar
-                        msg = f"In {usr_schema}: dropping detail views for {cdb_schema}"
-                        curr_step += 1
-                        self.sig_progress.emit(curr_step, msg)
-
-                        try:
-                            with temp_conn.cursor() as cur:
-                                cur.execute(query)
-                            temp_conn.commit()
+                    parts.append(_DROP_DETAIL_VIEW_TPL.format(
+                        _qgis_pkg_schema = qgis_pkg_ident,
+                        _usr_schema = pysql.Literal(usr_name),
+                        _cdb_schema = pysql.Literal(cdb_schema)
+                        ))
 
-                        except (Exception, psycopg2.Error) as error:
-                            fail_flag = True
-                            gen_f.critical_log(
-                                func=self.drop_usr_schema_thread,
-                                location=FILE_LOCATION,
-                                header="Dropping detail views",
-                                error=error)
-                            temp_conn.rollback()
-                            self.sig_fail.emit()
+                    # Update progress bar
+                    msg = f"In {usr_schema}: dropping detail views for {cdb_schema}"
+                    curr_step += 1
+                    self.emit_progress(curr_step, steps_tot, msg)
 
                 # 4) drop usr_schema
-                query = pysql.SQL("""
-                    DROP SCHEMA IF EXISTS {_usr_schema} CASCADE;
-                    """).format(
-                    _usr_schema = pysql.Identifier(usr_schema)
-                    )
+                parts.append(_DROP_SCHEMA_CASCADE_TPL.format(
+                    _schema = pysql.Identifier(usr_schema)
+                    ))
 
                 # Update progress bar with current step and script.
                 msg = f"Dropping user schema: {usr_schema}"
                 curr_step += 1
-                self.sig_progress.emit(curr_step, msg)
+                self.emit_progress(curr_step, steps_tot, msg)
 
-                try:
-                    with temp_conn.cursor() as cur:
-                        cur.execute(query)
-                    temp_conn.commit()
-
-                except (Exception, psycopg2.Error) as error:
-                    temp_conn.rollback()
-                    fail_flag = True
-                    gen_f.critical_log(
-                        func=self.drop_usr_schema_thread,
-                        location=FILE_LOCATION,
-                        header="Dropping user schema '{usr_schema}'",
-                        error=error)
-                    self.sig_fail.emit()
+                fail_flag = execute_batched_stages(
+                    worker=self,
+                    temp_conn=temp_conn,
+                    parts=parts,
+                    func=self.drop_usr_schema_thread,
+                    header=f"Dropping user schema '{usr_schema}'")
 
                 # Measure elapsed time
                 print(f"Dropping user schema completed in {round((time.time() - time_start), 4)} seconds")
 
-
         except (Exception, psycopg2.Error) as error:
             temp_conn.rollback()
             fail_flag = True
@@ -1751,8 +1676,7 @@ class DropUsrSchemaWorker(QObject):
             self.sig_success.emit()
 
         self.sig_finished.emit()
-        # Close temp connection
-        temp_conn.close()
+        # The shared admin connection stays open for the next worker run.
         return None
 
 #--EVENTS  (start)  ##############################################################
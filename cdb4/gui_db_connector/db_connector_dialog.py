@@ -41,7 +41,7 @@ from qgis.PyQt.QtWidgets import QDialog, QMessageBox
 
 from ..shared.functions import general_functions as gen_f
 from .other_classes import DBConnectionInfo
-from .functions.conn_functions import open_db_connection
+from .functions.conn_functions import get_pooled_db_connection, put_pooled_db_connection
 
 FILE_LOCATION = gen_f.get_file_relative_path(file=__file__)
 
@@ -67,6 +67,10 @@ class DBConnectorDialog(QDialog, FORM_CLASS):
         # Connection object variable
         self.conn_params: DBConnectionInfo = None
 
+        # Parameters of the last successful connection test: when 'OK' follows
+        # 'Test connection' with unchanged input, the second handshake is skipped.
+        self._last_valid_params: tuple = None
+
         self.bar = QgsMessageBar()
         self.verticalLayout.addWidget(self.bar, 0)
 
@@ -96,6 +100,10 @@ class DBConnectorDialog(QDialog, FORM_CLASS):
             new_conn_params.setValue(f'{conn_path}/port', self.conn_params.port)
             new_conn_params.setValue(f'{conn_path}/username', self.conn_params.username)
             new_conn_params.setValue(f'{conn_path}/password', self.conn_params.password)
+            # Flush to disk right away, so that the settings file's timestamp
+            # reflects the new connection (the stored connection list is
+            # rescanned only when that timestamp changes).
+            new_conn_params.sync()
 
             return True
         else:
@@ -131,9 +139,10 @@ class DBConnectorDialog(QDialog, FORM_CLASS):
             self.bar.pushMessage("Error", "Missing connection parameters", level=Qgis.MessageLevel.Warning, duration=3)
         else:
             temp_conn: pyconn = None
-            temp_conn = open_db_connection(db_connection=NewConnParams) # attempt to open connection and keep it open
+            temp_conn = get_pooled_db_connection(db_connection=NewConnParams) # attempt to open (or reuse) a pooled connection
             if temp_conn:
-                temp_conn.close() # close connection after the test.
+                put_pooled_db_connection(db_connection=NewConnParams, conn=temp_conn) # give it back after the test.
+                self._last_valid_params = (NewConnParams.host, NewConnParams.port, NewConnParams.database_name, NewConnParams.username, NewConnParams.password)
                 self.bar.pushMessage("Success", "Connection parameters are valid!", level=Qgis.MessageLevel.Success, duration=3)
             else:
                 # Nothing to close, there is no connection.
@@ -170,23 +179,28 @@ class DBConnectorDialog(QDialog, FORM_CLASS):
         else:
             NewConnParams.db_toc_node_label = NewConnParams.database_name + " @ " + NewConnParams.host + ":" +  str(NewConnParams.port)
             # print('set from New conn Dialog', NewConnParams.db_toc_node_label)
-            temp_conn: pyconn = None
-            temp_conn = open_db_connection(db_connection=NewConnParams) # attempt to open connection and keep it open
-            if temp_conn:
-                temp_conn.close() # close connection after the test.
-                self.conn_params = NewConnParams
-                # Store the new connection parameters for future use.
-                if self.checkBox.isChecked():
-                    if self.store_conn_parameters():
-                        self.close()
-                    else:
-                        return None
-                else:
+            params_key = (NewConnParams.host, NewConnParams.port, NewConnParams.database_name, NewConnParams.username, NewConnParams.password)
+            if params_key != self._last_valid_params:
+                # Not validated yet: test the parameters with a pooled connection.
+                temp_conn: pyconn = None
+                temp_conn = get_pooled_db_connection(db_connection=NewConnParams)
+                if not temp_conn:
+                    # Nothing to close, there is no connection.
+                    self.bar.pushMessage("Error", "Connection could not be established", level=Qgis.MessageLevel.Critical, duration=3)
+                    return None
+                put_pooled_db_connection(db_connection=NewConnParams, conn=temp_conn) # give it back after the test.
+                self._last_valid_params = params_key
+
+            self.conn_params = NewConnParams
+            # Store the new connection parameters for future use.
+            if self.checkBox.isChecked():
+                if self.store_conn_parameters():
                     self.close()
+                else:
+                    return None
             else:
-                # Nothing to close, there is no connection.
-                self.bar.pushMessage("Error", "Connection could not be established", level=Qgis.MessageLevel.Critical, duration=3)
-            
+                self.close()
+
         return None
 
 
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from ...gui_loader.loader_dialog import CDB4LoaderDialog
     from ...gui_deleter.deleter_dialog import CDB4DeleterDialog
 
-import psycopg2
+import psycopg2, psycopg2.pool
 from psycopg2.extensions import connection as pyconn
 # from qgis.core import QgsSettings
 
@@ -18,6 +18,96 @@ from ..other_classes import DBConnectionInfo
 
 FILE_LOCATION = gen_f.get_file_relative_path(file=__file__)
 
+# Pools of open database sessions, keyed by the connection parameters (and the
+# application name, which is baked into the session at connect time). They
+# amortize the TCP/TLS/authentication handshake over the lifetime of the
+# plugin instead of paying it again for every short-lived session.
+# Each entry stores the password the pool authenticated with next to the pool
+# itself: when the caller supplies a different password the pool is dropped
+# and recreated, so stale sessions can never vouch for changed credentials.
+_CONN_POOLS: dict[tuple, tuple[str, psycopg2.pool.ThreadedConnectionPool]] = {}
+
+
+def get_pooled_db_connection(db_connection: DBConnectionInfo, app_name: str = main_c.PLUGIN_NAME_LABEL) -> pyconn:
+    """Return a database session from the pool matching the given connection
+    parameters, creating the pool on first use. The session must be given back
+    with put_pooled_db_connection() instead of being closed.
+
+    *   :param db_connection: The connection custom object
+        :rtype: DBConnectionInfo
+
+    *   :param app_name: A name for the session
+        :rtype: str
+
+    *   :returns: The connection psycopg2 object (opened)
+        :rtype: psycopg2.extensions.connection
+    """
+    key = (db_connection.host, db_connection.port, db_connection.database_name, db_connection.username, app_name)
+
+    try:
+        conn_pool = None
+        entry = _CONN_POOLS.get(key)
+        if entry is not None:
+            pool_password, conn_pool = entry
+            if conn_pool.closed or pool_password != db_connection.password:
+                # The password changed (or the pool was closed): throw the old
+                # sessions away and authenticate from scratch below.
+                if not conn_pool.closed:
+                    conn_pool.closeall()
+                conn_pool = None
+
+        if conn_pool is None:
+            conn_pool = psycopg2.pool.ThreadedConnectionPool(
+                                    minconn          = 1,
+                                    maxconn          = 4,
+                                    dbname           = db_connection.database_name,
+                                    user             = db_connection.username,
+                                    password         = db_connection.password,
+                                    host             = db_connection.host,
+                                    port             = db_connection.port,
+                                    application_name = app_name)
+            _CONN_POOLS[key] = (db_connection.password, conn_pool)
+
+        return conn_pool.getconn()
+
+    except (Exception, psycopg2.Error) as error:
+        gen_f.critical_log(
+            func=get_pooled_db_connection,
+            location=FILE_LOCATION,
+            header="Invalid connection settings",
+            error=error)
+
+
+def put_pooled_db_connection(db_connection: DBConnectionInfo, conn: pyconn, app_name: str = main_c.PLUGIN_NAME_LABEL) -> None:
+    """Give a session obtained via get_pooled_db_connection() back to its pool,
+    so that the next caller can reuse it without a new handshake.
+    """
+    key = (db_connection.host, db_connection.port, db_connection.database_name, db_connection.username, app_name)
+
+    entry = _CONN_POOLS.get(key)
+    if entry is None:
+        conn.close() # The pool is gone: do not leak the session.
+    else:
+        pool_password, conn_pool = entry
+        if conn_pool.closed or pool_password != db_connection.password:
+            conn.close() # The session belongs to a dropped pool.
+        else:
+            conn_pool.putconn(conn)
+
+    return None
+
+
+def close_all_pools() -> None:
+    """Close all pooled database sessions. To be called when the plugin is
+    unloaded.
+    """
+    for _, conn_pool in _CONN_POOLS.values():
+        if not conn_pool.closed:
+            conn_pool.closeall()
+    _CONN_POOLS.clear()
+
+    return None
+
 
 def open_db_connection(db_connection: DBConnectionInfo, app_name: str = main_c.PLUGIN_NAME_LABEL) -> pyconn:
     """Create a new database session and returns a new instance of the psycopg connection class.
@@ -1,6 +1,23 @@
 class DBConnectionInfo:
     """Class to store connection information.
     """
+    # No per-instance __dict__: one of these objects is kept for every stored
+    # connection, so the fixed attribute layout saves memory and speeds up
+    # attribute access.
+    __slots__ = (
+        "connection_name",
+        "database_name",
+        "host",
+        "port",
+        "username",
+        "password",
+        "store_creds",
+        "is_active",
+        "pg_server_version",
+        "citydb_version",
+        "db_toc_node_label",
+        )
+
     def __init__(self):
         self.connection_name: str = None
         self.database_name: str = None
@@ -13,8 +30,27 @@ class DBConnectionInfo:
         self.pg_server_version: str = None # PostgreSQL server version
         self.citydb_version: str = None # 3DCityDB version
         self.db_toc_node_label: str = None
-        self.id = id(self)
-        self.hex_location = hex(self.id)
+
+    def __eq__(self, other):
+        """Two objects are equal when they describe the same stored connection;
+        session state (server versions, activity) does not count. This is what
+        lets the plugin detect changes in the stored connection list.
+        """
+        if not isinstance(other, DBConnectionInfo):
+            return NotImplemented
+        return (self.connection_name, self.database_name, self.host, self.port, self.username, self.password) == \
+               (other.connection_name, other.database_name, other.host, other.port, other.username, other.password)
+
+    # Keep the default identity hash despite the custom __eq__.
+    __hash__ = object.__hash__
+
+    @property
+    def id(self):
+        return id(self)
+
+    @property
+    def hex_location(self) -> str:
+        return hex(id(self))
 
     def __str__(self):
         pw: str
@@ -363,6 +363,10 @@ class CDB4DeleterDialog(QDialog, FORM_CLASS):
         self.conn = conn_f.open_db_connection(db_connection=self.DB, app_name = self.PLUGIN_NAME)
 
         if self.conn:
+            # Every helper commits after its single statement anyway: autocommit
+            # spares the implicit BEGIN and the COMMIT round trip per query.
+            # The delete operations run on their own worker connections.
+            self.conn.autocommit = True
             # Set self.DB.pg_server_version
             self.DB.pg_server_version = conn_f.get_posgresql_server_version(dlg=self)
             # Show database name
@@ -467,10 +471,9 @@ class CDB4DeleterDialog(QDialog, FORM_CLASS):
 
         # 4) Is my usr_schema installed? If yes, continue.
 
-        # Set the current usr_schema name in self.USR_SCHEMA.
-        self.USR_SCHEMA = sh_sql.create_qgis_usr_schema_name(dlg=self)
-        # Check if qgis_{usr} schema (e.g. qgis_giorgio) is installed in the database.
-        is_usr_schema_inst = sh_sql.is_usr_schema_installed(dlg=self)
+        # Set the current usr_schema name in self.USR_SCHEMA and check whether
+        # qgis_{usr} (e.g. qgis_giorgio) is installed: one round trip for both.
+        self.USR_SCHEMA, is_usr_schema_inst = sh_sql.get_usr_schema_name_and_status(dlg=self)
 
         if is_usr_schema_inst:
             # Show message in Connection Status the 3DCityDB version if installed
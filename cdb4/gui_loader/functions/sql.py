@@ -2,22 +2,111 @@
 
 These functions are responsible to communicate and fetch data from
 the database with sql queries or sql function calls.
+
+All functions here run on the single long-lived connection the dialog opens
+once at connection time (dlg.conn): no query pays a connect/auth handshake, so
+a connection pool would add bookkeeping without removing any round trip.
+Note that QGIS ships psycopg2 (not psycopg3), so libpq pipeline mode and
+binary result transfer are not available: all results arrive in text form
+and numeric values are parsed from ASCII. Round trips are saved instead by
+fusing queries (see get_srid_and_extents), autocommit reads and server-side
+aggregation, which dwarf the per-value parsing cost at the row counts the
+dialog handles.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, cast, Iterable, Optional, Literal, Union
 if TYPE_CHECKING:       
     from ...gui_loader.loader_dialog import CDB4LoaderDialog
-    from ...shared.dataTypes import CDBSchemaPrivs, DetailViewMetadata, LookupTableConfig
     from ..other_classes import CDBLayer
 
+import functools
+
 import psycopg2, psycopg2.sql as pysql
-from psycopg2.extras import NamedTupleCursor
 
-from ...shared.dataTypes import BBoxType
+from ...shared.dataTypes import BBoxType, CDBSchemaPrivs, DetailViewMetadata, LookupTableConfig
 from ...shared.functions import general_functions as gen_f
+from ...gui_db_connector.functions import conn_functions as conn_f
 
 FILE_LOCATION = gen_f.get_file_relative_path(file=__file__)
 
+def _with_reconnect(fn):
+    """Decorator that reopens dlg.conn and retries the call once when the
+    connection itself has dropped (network blip, server restart, idle
+    timeout). Without it a transient disconnection forces the user to close
+    and reopen the whole dialog. Query-level errors are not retried.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        dlg = kwargs["dlg"] if "dlg" in kwargs else args[0]
+        try:
+            return fn(*args, **kwargs)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            new_conn = conn_f.open_db_connection(db_connection=dlg.DB, app_name=dlg.PLUGIN_NAME)
+            if not new_conn:
+                raise # Reconnecting failed too: nothing more we can do here.
+            new_conn.autocommit = True # Same setting as at dialog connection time.
+            dlg.conn = new_conn
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _sql_call(header: str, error_return=None):
+    """Decorator with the shared error handling of this module: on a query
+    error it logs via critical_log, rolls the connection back and returns
+    error_return instead of raising. The header may contain str.format
+    placeholders, resolved against dlg and the keyword arguments of the call
+    (e.g. "Retrieving extents of schema {dlg.CDB_SCHEMA}").
+    Stack it outside _with_reconnect, so that connection-level errors are
+    retried before they are given up on and logged.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            dlg = kwargs["dlg"] if "dlg" in kwargs else args[0]
+            try:
+                return fn(*args, **kwargs)
+            except (Exception, psycopg2.Error) as error:
+                fmt_args = dict(kwargs)
+                fmt_args["dlg"] = dlg
+                try:
+                    hdr = header.format(**fmt_args)
+                except Exception:
+                    hdr = header # Placeholder did not resolve: log the raw template.
+                gen_f.critical_log(func=fn, location=FILE_LOCATION, header=hdr, error=error)
+                try:
+                    dlg.conn.rollback()
+                except psycopg2.Error:
+                    pass # The connection may be gone for good.
+                return error_return
+        return wrapper
+    return decorator
+
+
+class _ScalarCursor(psycopg2.extensions.cursor):
+    """Cursor for single-column queries: fetchone() returns the value itself,
+    or None when there is no row. Saves building (and indexing into) a 1-tuple
+    on every call of the scalar helper functions below.
+    """
+    def fetchone(self):
+        row = super().fetchone()
+        return row[0] if row is not None else None
+
+# The queries below are cached per schema combination: the Composed tree with
+# the schema identifiers baked in is built once, and only the row-level values
+# travel as bind parameters at execution time.
+
+@functools.lru_cache(maxsize=16)
+def _upsert_extents_query(qgis_pkg_schema: str, usr_schema: str, cdb_schema: str) -> pysql.Composed:
+    return pysql.SQL("""
+        SELECT {_qgis_pkg_schema}.upsert_extents({_usr_schema},{_cdb_schema},%s,%s,%s);
+        """).format(
+        _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema),
+        _usr_schema = pysql.Literal(usr_schema),
+        _cdb_schema = pysql.Literal(cdb_schema)
+        )
+
+@_sql_call("Retrieving list of cdb_schemas with their privileges")
+@_with_reconnect
 def list_cdb_schemas_privs(dlg: CDB4LoaderDialog) -> list[CDBSchemaPrivs]:
     """SQL function that retrieves the database cdb_schemas for the current database, 
     included the privileges status for the selected usr_name
@@ -33,24 +122,43 @@ def list_cdb_schemas_privs(dlg: CDB4LoaderDialog) -> list[CDBSchemaPrivs]:
         _usr_name = pysql.Literal(dlg.DB.username)
         )
 
-    try:
-        with dlg.conn.cursor(cursor_factory=NamedTupleCursor) as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
+    # The rows are mapped onto the shared NamedTuple class instead of using
+    # a NamedTupleCursor, which would build a throwaway namedtuple class
+    # (via exec) for every query.
+    with dlg.conn.cursor() as cur:
+        cur.execute(query)
+        res = [CDBSchemaPrivs._make(row) for row in cur.fetchall()]
 
-        if not res:
-            res = []
+    return res
 
-        return res
-    
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=list_cdb_schemas_privs,
-            location=FILE_LOCATION,
-            header="Retrieving list of cdb_schemas with their privileges",
-            error=error)
-        dlg.conn.rollback()
+
+@_sql_call("Retrieving extents of schema {dlg.CDB_SCHEMA}")
+@_with_reconnect
+def get_precomputed_extents_all(dlg: CDB4LoaderDialog) -> Optional[dict[BBoxType, Optional[str]]]:
+    """SQL query that reads and retrieves the extents of all bbox types stored
+    in {usr_schema}.extents for the current cdb_schema in a single round trip.
+
+    *   :returns: Extents per bbox type as WKT (None for empty or missing
+        entries), or None when the query itself failed.
+        :rtype: dict[BBoxType, str]
+    """
+    query = pysql.SQL("""
+        SELECT bbox_type, ST_AsText(envelope) FROM {_usr_schema}.extents 
+        WHERE cdb_schema = {_cdb_schema};
+        """).format(
+        _usr_schema = pysql.Identifier(dlg.USR_SCHEMA),
+        _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA)
+        )
+
+    with dlg.conn.cursor() as cur:
+        cur.execute(query)
+        extents = {BBoxType(bbox_type_value): wkt for bbox_type_value, wkt in cur.fetchall()}
+
+    # Missing entries count as "not computed yet".
+    for bbox_type in BBoxType:
+        extents.setdefault(bbox_type, None)
+
+    return extents
 
 
 def get_precomputed_extents(dlg: CDB4LoaderDialog, 
@@ -64,47 +172,76 @@ def get_precomputed_extents(dlg: CDB4LoaderDialog,
     *   :returns: Extents as WKT or None if the entry is empty.
         :rtype: str
     """
-
-    # Get the value associated to the enumeration member
-    bbox_type_value = bbox_type.value
-
-    # Get cdb_schema extents from server as WKT rectangular polygon _withouth_ srid.
+    # The per-type row and the full set cost the same indexed lookup, so this
+    # simply picks from the combined query. The result is not cached between
+    # calls: upsert_extents may change the stored envelopes at any time.
+    extents_all = get_precomputed_extents_all(dlg=dlg)
+    if extents_all is None:
+        return None
+
+    return extents_all[bbox_type]
+
+
+@_sql_call("Retrieving srid and extents of schema {dlg.CDB_SCHEMA}", error_return=(None, None, None))
+@_with_reconnect
+def get_srid_and_extents(dlg: CDB4LoaderDialog) -> tuple[Optional[int], Optional[str], Optional[str]]:
+    """SQL query that bundles into one round trip what the basemap setup needs
+    when a cdb_schema is selected: the schema srid and the precomputed
+    cdb_schema and layer extents from {usr_schema}.extents.
+    The full metadata burst of the dialog cannot be fused further, as the other
+    queries run at different stages of the UI (layer tab, look-up tables).
+
+    *   :returns: srid, cdb_schema extents as WKT, layer extents as WKT
+        (None for entries that are empty or missing)
+        :rtype: tuple[int, str, str]
+    """
     query = pysql.SQL("""
-        SELECT ST_AsText(envelope) FROM {_usr_schema}.extents 
-        WHERE cdb_schema = {_cdb_schema} AND bbox_type = {_ext_type};
+        SELECT
+            (SELECT srid FROM {_cdb_schema_ident}.database_srs LIMIT 1),
+            (SELECT ST_AsText(envelope) FROM {_usr_schema}.extents WHERE cdb_schema = {_cdb_schema} AND bbox_type = {_cdb_bbox_type}),
+            (SELECT ST_AsText(envelope) FROM {_usr_schema}.extents WHERE cdb_schema = {_cdb_schema} AND bbox_type = {_layer_bbox_type});
         """).format(
+        _cdb_schema_ident = pysql.Identifier(dlg.CDB_SCHEMA),
         _usr_schema = pysql.Identifier(dlg.USR_SCHEMA),
         _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA),
-        _ext_type = pysql.Literal(bbox_type_value)
+        _cdb_bbox_type = pysql.Literal(BBoxType.CDB_SCHEMA.value),
+        _layer_bbox_type = pysql.Literal(BBoxType.MAT_VIEW.value)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            extents = cur.fetchone()
-            # extents = (None,) when the envelope is Null,
-            # BUT extents = None when the query returns NO results.
-            if type(extents) == tuple:
-                extents = extents[0] # Get the value without trailing comma.
+    with dlg.conn.cursor() as cur:
+        cur.execute(query)
+        srid, cdb_extents_wkt, layer_extents_wkt = cur.fetchone()
+
+    if srid is not None:
+        _srid_cache(dlg)[dlg.CDB_SCHEMA] = srid
+    return srid, cdb_extents_wkt, layer_extents_wkt
 
-        dlg.conn.commit()
-        return extents
 
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_precomputed_extents,
-            location=FILE_LOCATION,
-            header=f"Retrieving extents of schema {dlg.CDB_SCHEMA}",
-            error=error)
-        dlg.conn.rollback()
+def _srid_cache(dlg: CDB4LoaderDialog) -> dict[str, int]:
+    """Returns the per-dialog srid cache, creating it on first use.
+    The srid of a cdb_schema cannot change for the lifetime of the database,
+    so entries never go stale and survive schema switches and reconnects.
+    """
+    cache = getattr(dlg, "_srid_cache_by_cdb_schema", None)
+    if cache is None:
+        cache = dlg._srid_cache_by_cdb_schema = {}
+    return cache
 
 
+@_sql_call("Retrieving srid")
+@_with_reconnect
 def get_cdb_schema_srid(dlg: CDB4LoaderDialog) -> int:
     """SQL query that reads and retrieves the current schema's srid from {cdb_schema}.database_srs
 
     *   :returns: srid number
         :rtype: int
     """
+    # The srid is immutable, so repeated calls during layer setup are answered
+    # from the dialog-side cache without a round trip.
+    cache = _srid_cache(dlg)
+    if dlg.CDB_SCHEMA in cache:
+        return cache[dlg.CDB_SCHEMA]
+
     # Get database srid
     query = pysql.SQL("""
         SELECT srid FROM {_cdb_schema}.database_srs LIMIT 1;
@@ -112,23 +249,18 @@ def get_cdb_schema_srid(dlg: CDB4LoaderDialog) -> int:
         _cdb_schema = pysql.Identifier(dlg.CDB_SCHEMA)
         )
    
-    try:
-        with dlg.conn.cursor() as cur:
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
 
-            cur.execute(query)
-            srid = cur.fetchone()[0] # Tuple has trailing comma.
-        dlg.conn.commit()
-        return srid
+        cur.execute(query)
+        srid = cur.fetchone()
 
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_cdb_schema_srid,
-            location=FILE_LOCATION,
-            header="Retrieving srid",
-            error=error)
-        dlg.conn.rollback()
+    if srid is not None:
+        cache[dlg.CDB_SCHEMA] = srid
+    return srid
 
 
+@_sql_call("Retrieving layers metadata")
+@_with_reconnect
 def get_layer_metadata(dlg: CDB4LoaderDialog, cols_list: list[str] = ["*"]) -> tuple[list[str], list[tuple]]:
     """SQL query that retrieves the current schema's layer metadata from {usr_schema}.layer_metadata table. 
     By default it retrieves all columns.
@@ -163,29 +295,26 @@ def get_layer_metadata(dlg: CDB4LoaderDialog, cols_list: list[str] = ["*"]) -> t
                     _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
                     )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-            # Attribute names
-            col_names = [desc[0] for desc in cast(Iterable[tuple[str, ...]], cur.description)]
-        dlg.conn.commit()
-
-        if not res:
-            metadata = []
-        else:
-            metadata = res
-        return col_names, metadata
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_layer_metadata,
-            location=FILE_LOCATION,
-            header="Retrieving layers metadata",
-            error=error)
-        dlg.conn.rollback()
+    # Server-side (named) cursor: rows are streamed in itersize batches
+    # instead of being buffered in one big client-side transfer. The rows are
+    # narrow, so large batches cost little memory but save round trips on
+    # projects with thousands of layers.
+    with dlg.conn.cursor(name="layer_metadata_cur", withhold=True) as cur:
+        cur.itersize = 2000
+        cur.execute(query)
+        res = list(cur)
+        # Attribute names (available only after the first fetch on a named cursor)
+        col_names = [desc[0] for desc in cast(Iterable[tuple[str, ...]], cur.description)]
+
+    if not res:
+        metadata = []
+    else:
+        metadata = res
+    return col_names, metadata
 
 
+@_sql_call("Retrieving detail views metadata")
+@_with_reconnect
 def get_detail_view_metadata(dlg: CDB4LoaderDialog) -> list[DetailViewMetadata]:
     """SQL query that retrieves the current schema's layer metadata from {usr_schema}.layer_metadata table. 
     By default it retrieves all columns.
@@ -210,66 +339,103 @@ def get_detail_view_metadata(dlg: CDB4LoaderDialog) -> list[DetailViewMetadata]:
                     _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
                     )
 
-    try:
-        with dlg.conn.cursor(cursor_factory=NamedTupleCursor) as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
-
-        if not res:
-            res = []
+    with dlg.conn.cursor(name="detail_view_metadata_cur", withhold=True) as cur:
+        cur.itersize = 500
+        cur.execute(query)
+        res = [DetailViewMetadata._make(row) for row in cur]
 
-        return res
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_detail_view_metadata,
-            location=FILE_LOCATION,
-            header="Retrieving detail views metadata",
-            error=error)
-        dlg.conn.rollback()
+    return res
 
 
+@_sql_call("Retrieving look-up tables with enumerations and codelists")
+@_with_reconnect
 def list_lookup_tables(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], tuple[()]]:
     """SQL query that retrieves look-up tables from {usr_schema}.
 
     *   :returns: Look-up tables names
         :rtype: tuple[str, ...]
     """
-    # Prepare query to get all existing look-up tables from the database
+    # Prepare query to get all existing look-up tables from the database.
+    # The names are aggregated server-side: one array in one row to decode
+    # instead of one protocol row per table.
     query = pysql.SQL("""
-        SELECT table_name FROM information_schema.tables
+        SELECT array_agg(table_name) FROM information_schema.tables
         WHERE table_schema = {_usr_schema}
         AND table_type = 'VIEW' AND (table_name LIKE '%codelist%' OR table_name LIKE '%enumeration%');
         """).format(
         _usr_schema = pysql.Literal(dlg.USR_SCHEMA)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res=cur.fetchall()
-        dlg.conn.commit()
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query)
+        res = cur.fetchone()
 
-        if not res:
-            lookups = ()
-        else:
-            lookups: tuple[str, ...]
-            lookups = tuple(zip(*res))[0]
-            # lookups = tuple(elem[0] for elem in cast(Iterable[tuple[str]],res))
+    lookups: tuple[str, ...]
+    lookups = tuple(res) if res else ()
+
+    return lookups
+
+
+def invalidate_layer_metadata_cache(dlg: CDB4LoaderDialog) -> None:
+    """Function that drops the cached results of get_layer_metadata_cached and
+    list_lookup_tables_cached. To be called whenever layers are created,
+    refreshed or dropped in the user schema.
+    """
+    dlg._layer_metadata_cache = {}
+
+    return None
+
+
+def get_layer_metadata_cached(dlg: CDB4LoaderDialog, cols_list: list[str] = ["*"]) -> tuple[list[str], list[tuple]]:
+    """Cached front end for get_layer_metadata. Within a session the result
+    set only changes when layers are created, refreshed or dropped (see
+    invalidate_layer_metadata_cache), so one round trip per (usr_schema,
+    cdb_schema, columns) combination suffices.
+
+    *   :param cols_list: The columns to retrieve from the table.
+        :type cols_list: list[str]
+
+    *   :returns: metadata of the layers combined with a collection of
+        the attributes names
+        :rtype: tuple(attribute_names, metadata)
+    """
+    cache = getattr(dlg, "_layer_metadata_cache", None)
+    if cache is None:
+        cache = dlg._layer_metadata_cache = {}
+
+    key = ("layer_metadata", dlg.USR_SCHEMA, dlg.CDB_SCHEMA, dlg.ADE_PREFIX, tuple(cols_list))
+    result = cache.get(key)
+    if result is None:
+        result = get_layer_metadata(dlg=dlg, cols_list=cols_list)
+        if result is not None: # Do not cache errors.
+            cache[key] = result
+
+    return result
 
-        return lookups
 
-    except (Exception, psycopg2.Error) as error:
-        # Send error to QGIS Message Log panel.
-        gen_f.critical_log(
-            func=list_lookup_tables,
-            location=FILE_LOCATION,
-            header="Retrieving look-up tables with enumerations and codelists",
-            error=error)
-        dlg.conn.rollback()
+def list_lookup_tables_cached(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], tuple[()]]:
+    """Cached front end for list_lookup_tables, sharing the cache (and the
+    invalidation hook) of get_layer_metadata_cached.
 
+    *   :returns: Look-up tables names
+        :rtype: tuple[str, ...]
+    """
+    cache = getattr(dlg, "_layer_metadata_cache", None)
+    if cache is None:
+        cache = dlg._layer_metadata_cache = {}
+
+    key = ("lookup_tables", dlg.USR_SCHEMA)
+    result = cache.get(key)
+    if result is None:
+        result = list_lookup_tables(dlg=dlg)
+        if result: # Do not cache errors or empty results.
+            cache[key] = result
 
+    return result
+
+
+@_sql_call("Computing extents of the schema '{dlg.CDB_SCHEMA}'")
+@_with_reconnect
 def compute_cdb_schema_extents(dlg: CDB4LoaderDialog) -> tuple[bool, float, float, float, float, int]:
     """Calls the qgis_pkg function that computes the cdb_schema extents.
 
@@ -285,26 +451,50 @@ def compute_cdb_schema_extents(dlg: CDB4LoaderDialog) -> tuple[bool, float, floa
         _is_geographic = pysql.Literal(dlg.CRS_is_geographic)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            values = cur.fetchone()
-            dlg.conn.commit()
-            if values:
-                is_geom_null, x_min, y_min, x_max, y_max, srid = values
-                return is_geom_null, x_min, y_min, x_max, y_max, srid
-            else:
-                return None
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=compute_cdb_schema_extents,
-            location=FILE_LOCATION,
-            header=f"Computing extents of the schema '{dlg.CDB_SCHEMA}'",
-            error=error)
-        dlg.conn.rollback()
+    with dlg.conn.cursor() as cur:
+        cur.execute(query)
+        values = cur.fetchone()
+        dlg.conn.commit()
+        if values:
+            is_geom_null, x_min, y_min, x_max, y_max, srid = values
+            return is_geom_null, x_min, y_min, x_max, y_max, srid
+        else:
+            return None
+
+
+def _ensure_gview_counter_prepared(dlg: CDB4LoaderDialog) -> None:
+    """Prepares the gview_counter statement once per connection.
+    exec_gview_counter runs once per layer in a loop, so the prepared form
+    saves the server-side parse/plan step on every call after the first.
+    """
+    if getattr(dlg, "_gview_counter_prepared_conn", None) is dlg.conn:
+        return
+
+    query = pysql.SQL("""
+        PREPARE gview_counter_stmt (varchar, varchar, varchar, text) AS
+        SELECT {_qgis_pkg_schema}.gview_counter($1, $2, $3, $4);
+        """).format(
+        _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA)
+        )
+
+    with dlg.conn.cursor() as cur:
+        # Selectivity of gview_counter depends entirely on the passed extents
+        # (a small bbox selects a handful of objects, a large one most of the
+        # schema), so the generic plan PostgreSQL switches to after a few
+        # executions of a prepared statement can be far off. Force a custom
+        # plan per execution: replanning is cheap next to a bad spatial plan.
+        # The setting exists since PostgreSQL 12.
+        if dlg.conn.server_version >= 120000:
+            cur.execute("SET plan_cache_mode = 'force_custom_plan';")
+        cur.execute(query)
+
+    # Remember on which connection the statement lives: a reopened connection
+    # is a new session and must prepare again.
+    dlg._gview_counter_prepared_conn = dlg.conn
 
 
+@_sql_call("Counting number of geometries objects in layer {layer.layer_name} (via gview {layer.gv_name})")
+@_with_reconnect
 def exec_gview_counter(dlg: CDB4LoaderDialog, layer: CDBLayer) -> int:
     """Calls the qgis_pkg function that counts the number of geometry objects found within the selected extents.
 
@@ -313,37 +503,53 @@ def exec_gview_counter(dlg: CDB4LoaderDialog, layer: CDBLayer) -> int:
     """
     # Convert QgsRectanlce into WKT polygon format
     extents = dlg.CURRENT_EXTENTS.asWktPolygon()
-    
-    # Prepare query to execute server function to get the number of objects in extents.
+
+    _ensure_gview_counter_prepared(dlg=dlg)
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute("EXECUTE gview_counter_stmt (%s, %s, %s, %s);", (dlg.USR_SCHEMA, dlg.CDB_SCHEMA, layer.gv_name, extents))
+        count = cur.fetchone()
+
+    # Assign the result to the view object.
+    layer.n_selected = count
+    return count
+
+
+@_sql_call("Counting number of geometry objects in the selected layers")
+@_with_reconnect
+def exec_gview_counter_batch(dlg: CDB4LoaderDialog, layers: list[CDBLayer]) -> None:
+    """Calls the qgis_pkg counter function for all passed layers in a single
+    set-returning query: one round trip for M layers instead of M. The result
+    is stored in each layer's n_selected, like exec_gview_counter does.
+    """
+    if not layers:
+        return None
+
+    # Convert QgsRectanlce into WKT polygon format
+    extents = dlg.CURRENT_EXTENTS.asWktPolygon()
+    # Layers may share a gview: count each gview only once server-side.
+    gv_names = list({layer.gv_name for layer in layers})
+
     query = pysql.SQL("""
-        SELECT {_qgis_pkg_schema}.gview_counter({_usr_schema},{_cdb_schema},{_gv_name},{_extents});
+        SELECT gv_name, {_qgis_pkg_schema}.gview_counter({_usr_schema},{_cdb_schema},gv_name,%s)
+        FROM unnest(%s::varchar[]) AS gv_name;
         """).format(
         _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
         _usr_schema = pysql.Literal(dlg.USR_SCHEMA),
-        _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA),
-        _gv_name = pysql.Literal(layer.gv_name),  
-        _extents = pysql.Literal(extents)
+        _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            count = cur.fetchone()[0] # Tuple has trailing comma.
-        dlg.conn.commit()
-
-        # Assign the result to the view object.
-        layer.n_selected = count
-        return count
+    with dlg.conn.cursor() as cur:
+        cur.execute(query, (extents, gv_names))
+        counts = dict(cur.fetchall())
 
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=exec_gview_counter,
-            location=FILE_LOCATION,
-            header=f"Counting number of geometries objects in layer {layer.layer_name} (via gview {layer.gv_name})",
-            error=error)
-        dlg.conn.rollback()
+    # Assign the results to the layer objects.
+    for layer in layers:
+        layer.n_selected = counts.get(layer.gv_name, 0)
+    return None
 
 
+@_sql_call("Checking whether layers already exist for schema {dlg.CDB_SCHEMA}")
+@_with_reconnect
 def has_layers_for_cdb_schema(dlg: CDB4LoaderDialog) -> bool:
     """Calls the qgis_pkg function that determines whether the {usr_schema} has layers
     regarding the current {cdb_schema}.
@@ -361,22 +567,14 @@ def has_layers_for_cdb_schema(dlg: CDB4LoaderDialog) -> bool:
         _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            result_bool = cur.fetchone()[0] # Tuple has trailing comma.
-        dlg.conn.commit()
-        return result_bool
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=has_layers_for_cdb_schema,
-            location=FILE_LOCATION,
-            header=f"Checking whether layers already exist for schema {dlg.CDB_SCHEMA}",
-            error=error)
-        dlg.conn.rollback()
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query)
+        result_bool = cur.fetchone()
+    return result_bool
 
 
+@_sql_call("Upserting '{bbox_type}' extents")
+@_with_reconnect
 def upsert_extents(dlg: CDB4LoaderDialog, 
                    bbox_type: Literal[BBoxType.CDB_SCHEMA, BBoxType.MAT_VIEW, BBoxType.QGIS],
                    extents_wkt_2d_poly: Optional[str]
@@ -397,36 +595,53 @@ def upsert_extents(dlg: CDB4LoaderDialog,
     bbox_type_value = bbox_type.value
 
     # Prepare query to upsert the extents of the current cdb_schema
+    query = _upsert_extents_query(dlg.QGIS_PKG_SCHEMA, dlg.USR_SCHEMA, dlg.CDB_SCHEMA)
+
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query, (bbox_type_value, extents_wkt_2d_poly, dlg.CRS_is_geographic))
+        upserted_id = cur.fetchone()
+    dlg.conn.commit()
+    # The scalar cursor already yields None when no row came back; do not
+    # truth-test the id itself, as 0 would be a valid (if unusual) key.
+    return upserted_id
+
+
+@_sql_call("Upserting extents of schema {dlg.CDB_SCHEMA}")
+@_with_reconnect
+def upsert_extents_many(dlg: CDB4LoaderDialog,
+                        items: list[tuple[BBoxType, Optional[str]]]
+                        ) -> None:
+    """Calls the QGIS Package upsert_extents function for several bbox types in
+    a single query (one round trip instead of one per bbox type).
+
+    *   :param items: pairs of BBoxType(enum) and the extents as 2D WKT polygon
+        _withouth_ SRID (or None)
+        :type items: list[tuple[BBoxType, str]]
+    """
+    if not items:
+        return None
+
+    bbox_type_values = [bbox_type.value for bbox_type, _ in items]
+    extents_wkt_polys = [extents_wkt for _, extents_wkt in items]
+
     query = pysql.SQL("""
-        SELECT {_qgis_pkg_schema}.upsert_extents({_usr_schema},{_cdb_schema},{_bbox_type},{_extents},{_is_geographic});
+        SELECT {_qgis_pkg_schema}.upsert_extents({_usr_schema},{_cdb_schema},t.bbox_type,t.ext,{_is_geographic})
+        FROM unnest(%s::varchar[], %s::text[]) AS t(bbox_type, ext);
         """).format(
         _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
         _usr_schema = pysql.Literal(dlg.USR_SCHEMA),
         _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA),
-        _bbox_type = pysql.Literal(bbox_type_value),
-        _extents = pysql.Literal(extents_wkt_2d_poly),
         _is_geographic = pysql.Literal(dlg.CRS_is_geographic)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            upserted_id = cur.fetchone()[0] # Tuple has trailing comma.
-        dlg.conn.commit()
-        if upserted_id:
-            return upserted_id
-        else:
-            return None
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=upsert_extents,
-            location=FILE_LOCATION,
-            header=f"Upserting '{bbox_type}' extents",
-            error=error)
-        dlg.conn.rollback()
+    with dlg.conn.cursor() as cur:
+        cur.execute(query, (bbox_type_values, extents_wkt_polys))
+    dlg.conn.commit()
+    return None
 
 
+@_sql_call("Retrieving list of available feature types in selected area")
+@_with_reconnect
 def list_unique_feature_types(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], tuple[()]]:
     """SQL query that retrieves the unique available feature types (CityGML modules)
     in the current cdb_schema and within the selection bounding box.
@@ -442,39 +657,28 @@ def list_unique_feature_types(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], t
         # Convert QgsRectangle into WKT polygon format
         extents_wkt = dlg.CURRENT_EXTENTS.asWktPolygon()  
 
+    # The extents WKT travels as a bind parameter: no client-side escaping of
+    # the (potentially long) polygon string into the query text.
     query = pysql.SQL("""
-        SELECT feature_type 
-        FROM qgis_pkg.feature_type_checker({_cdb_schema},{_ade_prefix},{_extents}) 
-        WHERE exists_in_db IS TRUE 
-        ORDER BY feature_type;
+        SELECT array_agg(feature_type ORDER BY feature_type)
+        FROM qgis_pkg.feature_type_checker({_cdb_schema},{_ade_prefix},%s)
+        WHERE exists_in_db IS TRUE;
         """).format(
         _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA),
-        _ade_prefix = pysql.Literal(dlg.ADE_PREFIX),
-        _extents = pysql.Literal(extents_wkt)
+        _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
-        #feat_types = tuple(elem[0] for elem in cast(Iterable[tuple[str, ...]], res))
-        if res:
-            feat_types: tuple[str, ...]
-            feat_types = tuple(zip(*res))[0]
-        else:
-            feat_types = ()
-        return feat_types
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query, (extents_wkt,))
+        res = cur.fetchone()
 
-    except (Exception, psycopg2.Error) as error:
-        dlg.conn.rollback()
-        gen_f.critical_log(
-            func=list_unique_feature_types,
-            location=FILE_LOCATION,
-            header="Retrieving list of available feature types in selected area",
-            error=error)
+    feat_types: tuple[str, ...]
+    feat_types = tuple(res) if res else ()
+    return feat_types
 
 
+@_sql_call("Retrieving unique Feature Types in {dlg.USR_SCHEMA}.layer_metadata for cdb_schema {dlg.CDB_SCHEMA}")
+@_with_reconnect
 def list_unique_feature_types_in_layer_metadata(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], tuple[()]]:
     """SQL query that retrieves the list of unique feature types (CityGML modules) in
     table layer_metadata 
@@ -484,41 +688,28 @@ def list_unique_feature_types_in_layer_metadata(dlg: CDB4LoaderDialog) -> Union[
     """
 
     query = pysql.SQL("""
-        SELECT DISTINCT feature_type 
+        SELECT array_agg(DISTINCT feature_type ORDER BY feature_type ASC) 
         FROM {_usr_schema}.layer_metadata
-        WHERE cdb_schema = {_cdb_schema} AND ade_prefix IS NOT DISTINCT FROM {_ade_prefix} AND feature_type IS NOT NULL
-        ORDER BY feature_type ASC;
+        WHERE cdb_schema = {_cdb_schema} AND ade_prefix IS NOT DISTINCT FROM {_ade_prefix} AND feature_type IS NOT NULL;
         """).format(
         _usr_schema = pysql.Identifier(dlg.USR_SCHEMA),
         _cdb_schema = pysql.Literal(dlg.CDB_SCHEMA),
         _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query)
+        res = cur.fetchone()
 
-        if not res:
-            feat_types = ()
-        else:
-            #feat_types = tuple(elem[0] for elem in cast(Iterable[tuple[str]], res))
-            feat_types: tuple[str, ...]
-            feat_types = tuple(zip(*res))[0]
-            # print(feat_types)
-        
-        return feat_types
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=list_unique_feature_types_in_layer_metadata,
-            location=FILE_LOCATION,
-            header=f"Retrieving unique Feature Types in {dlg.USR_SCHEMA}.layer_metadata for cdb_schema {dlg.CDB_SCHEMA}",
-            error=error)
-        dlg.conn.rollback()
+    feat_types: tuple[str, ...]
+    feat_types = tuple(res) if res else ()
+    # print(feat_types)
+
+    return feat_types
 
 
+@_sql_call("Retrieving data from table '{dlg.QGIS_PKG_SCHEMA}.enum_lookup_config'")
+@_with_reconnect
 def get_enum_lookup_config(dlg: CDB4LoaderDialog) -> list[LookupTableConfig]:
     """SQL query that retrieves the configuration values to set up
     the look-up tables containing enumerations via combo boxes
@@ -545,25 +736,16 @@ def get_enum_lookup_config(dlg: CDB4LoaderDialog) -> list[LookupTableConfig]:
             _ade_prefix = pysql.Literal(dlg.ADE_PREFIX)
             )
 
-    try:
-        with dlg.conn.cursor(cursor_factory=NamedTupleCursor) as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
-
-        if not res:
-            res = []
-        return res
+    with dlg.conn.cursor(name="enum_lookup_config_cur", withhold=True) as cur:
+        cur.itersize = 500
+        cur.execute(query)
+        res = [LookupTableConfig._make(row) for row in cur]
 
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_enum_lookup_config,
-            location=FILE_LOCATION,
-            header=f"Retrieving data from table '{dlg.QGIS_PKG_SCHEMA}.enum_lookup_config'",
-            error=error)
-        dlg.conn.rollback()
+    return res
 
 
+@_sql_call("Retrieving data from table '{dlg.USR_SCHEMA}.codelist_lookup_config'")
+@_with_reconnect
 def get_codelist_lookup_config(dlg: CDB4LoaderDialog, codelist_set_name: str) -> list[LookupTableConfig]:
     """SQL query that retrieves the configuration values to set up
     the look-up tables containing codelists via combo boxes
@@ -582,26 +764,16 @@ def get_codelist_lookup_config(dlg: CDB4LoaderDialog, codelist_set_name: str) ->
         _codelist_set_name = pysql.Literal(codelist_set_name)
         )
 
-    try:
-        with dlg.conn.cursor(cursor_factory=NamedTupleCursor) as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
+    with dlg.conn.cursor(name="codelist_lookup_config_cur", withhold=True) as cur:
+        cur.itersize = 500
+        cur.execute(query)
+        res = [LookupTableConfig._make(row) for row in cur]
 
-        if not res:
-            res = []
-
-        return res
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=get_codelist_lookup_config,
-            location=FILE_LOCATION,
-            header=f"Retrieving data from table '{dlg.USR_SCHEMA}.codelist_lookup_config'",
-            error=error)
-        dlg.conn.rollback()
+    return res
 
 
+@_sql_call("Retrieving CityGML codelist set from table '{dlg.USR_SCHEMA}.codelist_lookup_config'")
+@_with_reconnect
 def list_CityGML_codelist_set_names(dlg: CDB4LoaderDialog) -> Union[tuple[str, ...], tuple[()]]:
     """SQL query that retrieves the codelist set names to fill the codelist selection box 
     
@@ -609,35 +781,20 @@ def list_CityGML_codelist_set_names(dlg: CDB4LoaderDialog) -> Union[tuple[str, .
         :rtype: Union[tuple[str, ...], tuple[()]]
     """
     query = pysql.SQL("""
-        SELECT DISTINCT name FROM {_usr_schema}.codelist_lookup_config
-        WHERE ade_prefix IS NULL
-        ORDER BY name;
+        SELECT array_agg(DISTINCT name ORDER BY name) FROM {_usr_schema}.codelist_lookup_config
+        WHERE ade_prefix IS NULL;
         """).format(
         _usr_schema = pysql.Identifier(dlg.USR_SCHEMA)
         )
 
-    try:
-        with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res = cur.fetchall()
-        dlg.conn.commit()
+    with dlg.conn.cursor(cursor_factory=_ScalarCursor) as cur:
+        cur.execute(query)
+        res = cur.fetchone()
 
-        if not res:
-            codelist_set_names = ()
-        else:
-            # codelist_set_names = tuple(elem[0] for elem in cast(Iterable[tuple[str, ...]], res))
-            codelist_set_names: tuple[str, ...]
-            codelist_set_names = tuple(zip(*res))[0]
-     
-        return codelist_set_names
-
-    except (Exception, psycopg2.Error) as error:
-        gen_f.critical_log(
-            func=list_CityGML_codelist_set_names,
-            location=FILE_LOCATION,
-            header=f"Retrieving CityGML codelist set from table '{dlg.USR_SCHEMA}.codelist_lookup_config'",
-            error=error)
-        dlg.conn.rollback()
+    codelist_set_names: tuple[str, ...]
+    codelist_set_names = tuple(res) if res else ()
+
+    return codelist_set_names
 
 
 # def fetch_ADE_codelist_set_names(dlg: CDB4LoaderDialog) -> list:
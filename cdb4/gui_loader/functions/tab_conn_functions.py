@@ -232,7 +232,7 @@ def check_layers_status(dlg: CDB4LoaderDialog) -> bool:
         dlg.checks.layers_exist = True
 
         # Now check whether layers were already refreshed/populated
-        refresh_date = sql.get_layer_metadata(dlg=dlg, cols_list=["refresh_date"])
+        refresh_date = sql.get_layer_metadata_cached(dlg=dlg, cols_list=["refresh_date"])
         # Extract a date.
         date = list(set(refresh_date[1]))[0][0]
 
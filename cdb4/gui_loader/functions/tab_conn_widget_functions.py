@@ -32,8 +32,9 @@ def gbxBasemap_setup(dlg: CDB4LoaderDialog) ->  None:
     The basemap is zoomed-in to the cdb_extent (i.e. the extents of the whole city model).
     """
 
-    # Get the crs_id stored in the selected {cdb_schema}
-    srid = sql.get_cdb_schema_srid(dlg)
+    # Get the crs_id stored in the selected {cdb_schema} together with the
+    # precomputed extents: one round trip instead of three.
+    srid, cdb_extents_wkt, layer_extents_wkt = sql.get_srid_and_extents(dlg)
     # Format CRS variable as QGIS Epsg code.
     crs: str = ":".join(["EPSG", str(srid)]) # e.g. EPSG:28992
     # Store the crs into the plugin variable
@@ -41,7 +42,6 @@ def gbxBasemap_setup(dlg: CDB4LoaderDialog) ->  None:
     dlg.CRS_is_geographic = dlg.CRS.isGeographic()
     # print(f"In gbxBasemap_setup: CRS from database {dlg.CRS.postgisSrid()}, is geographic? {dlg.CRS_is_geographic}")
 
-    cdb_extents_wkt = sql.get_precomputed_extents(dlg=dlg, bbox_type=BBoxType.CDB_SCHEMA)
     if not cdb_extents_wkt:
         sql.upsert_extents(dlg=dlg, bbox_type=BBoxType.CDB_SCHEMA, extents_wkt_2d_poly=None)
         cdb_extents_wkt = sql.get_precomputed_extents(dlg=dlg, bbox_type=BBoxType.CDB_SCHEMA)
@@ -61,9 +61,7 @@ def gbxBasemap_setup(dlg: CDB4LoaderDialog) ->  None:
     #         # This function automatically upserts the bbox to the table of the precomputed extents in the usr_schema
     #         sql.upsert_extents(dlg=dlg, bbox_type=BBoxType.CDB_SCHEMA, extents_wkt_2d_poly=None)
 
-    # Check whether the layer extents were already computed and stored in the database before
-    layer_extents_wkt = sql.get_precomputed_extents(dlg=dlg, bbox_type=BBoxType.MAT_VIEW)
-   
+    # The layer extents were fetched together with the cdb_schema ones above.
     if not layer_extents_wkt:
         layer_extents_wkt = cdb_extents_wkt
 
@@ -7,7 +7,10 @@ if TYPE_CHECKING:
     from ...gui_loader.loader_dialog import CDB4LoaderDialog
     from ..other_classes import FeatureType, CDBDetailView, EnumConfig 
 
-from collections import OrderedDict
+from collections import deque
+from functools import lru_cache
+
+from qgis.PyQt.QtXml import QDomDocument
 from qgis.core import (QgsProject, QgsMessageLog, QgsEditorWidgetSetup, 
                         QgsVectorLayer, QgsDataSourceUri, QgsAttributeEditorElement,
                         QgsAttributeEditorRelation, Qgis, QgsLayerTreeGroup,
@@ -17,6 +20,43 @@ from ..other_classes import CDBLayer, CodeListConfig
 from .. import loader_constants as c
 from . import sql
 
+# Which address detail view belongs to which (address-bearing) class.
+_ADDRESS_DV_MAP: dict[str, str] = {
+    "Building": "address_bdg",
+    "BuildingPart": "address_bdg",
+    "BuildingDoor": "address_bdg_door",
+    "Bridge": "address_bri",
+    "BridgePart": "address_bri",
+    "BridgeDoor": "address_bri_door",
+    }
+
+
+# The "cityobject_id" fields of all detail views get the same plain text
+# widget: QgsEditorWidgetSetup is immutable, so one shared instance suffices.
+_TEXT_EDIT_WIDGET = QgsEditorWidgetSetup('TextEdit', {})
+
+
+@lru_cache(maxsize=128)
+def _load_qml_dom(qml_path: str) -> QDomDocument:
+    """Function that reads and parses a qml style file once. Layers of the
+    same class share their qml files, so the parsed document is cached and
+    reapplied instead of re-reading the file per layer.
+
+    *   :param qml_path: Full path of the qml file.
+        :type qml_path: str
+
+    *   :returns: The parsed qml document (empty if the file cannot be read).
+        :rtype: QDomDocument
+    """
+    doc = QDomDocument()
+    try:
+        with open(qml_path, "rb") as f:
+            doc.setContent(f.read())
+    except OSError:
+        pass # An empty document: importNamedStyle will report the failure.
+    return doc
+
+
 def populate_codelist_config_registry(dlg: CDB4LoaderDialog, codelist_set_name: str = None) -> None:
     """Function to create the dictionary containing Codelist Lookup Config metadata.
     """
@@ -54,40 +94,50 @@ def populate_codelist_config_registry(dlg: CDB4LoaderDialog, codelist_set_name:
 def add_layers_to_feature_type_registry(dlg: CDB4LoaderDialog) -> None:
     """Function to instantiate python objects from the 'layer_metadata' table in the usr_schema.
     """
-    # Clean up the layers in the registry from previous runs
-    feat_type: FeatureType
-    for feat_type in dlg.FeatureTypesRegistry.values():
-        feat_type.layers = [] # Empty the list the will contain CDBLayer objects
+    # The CDBLayer objects are collected per Feature Type and assigned to the
+    # registry in one go at the end, which also replaces the up-front loop
+    # clearing the leftovers from previous runs.
+    new_ft_layers: dict[str, list[CDBLayer]] = {key: [] for key in dlg.FeatureTypesRegistry}
 
     # Get field names and metadata values from server.
-    col_names, layer_metadata = sql.get_layer_metadata(dlg)
-
-    # Format metadata into a list of dictionaries where each element is a layer.
-    layer_metadata_dict_items: list = [dict(zip(col_names, values)) for values in layer_metadata]
-
-    for layer_metadata_dict_item in layer_metadata_dict_items:
-        # keys: id, cdb_schema, layer_type, feature_type, lod, root_class, curr_class, layer_name, 
-        #       gv_name, av_name, n_features, creation_data, refresh_date,
-        #       qml_form, qml_symb, qml_3d, 
-        #       qml_form_with_path, qml_symb_with_path, qml_3d_with_path
-        #       n_selected
-
-        if layer_metadata_dict_item["n_features"] == 0:        # ignore those layers that have no features
+    col_names, layer_metadata = sql.get_layer_metadata_cached(dlg)
+
+    # Positions of the fields checked below. CDBLayer's constructor takes the
+    # columns in table order, so each row can be passed through unchanged.
+    # Fields: id, cdb_schema, layer_type, feature_type, lod, root_class, curr_class, layer_name, 
+    #         gv_name, av_name, n_features, creation_data, refresh_date,
+    #         qml_form, qml_symb, qml_3d, 
+    #         qml_form_with_path, qml_symb_with_path, qml_3d_with_path
+    #         n_selected
+    nf_idx: int = col_names.index("n_features")
+    rd_idx: int = col_names.index("refresh_date")
+    ft_idx: int = col_names.index("feature_type")
+
+    # Layers to be counted against the current extents (in one batched query).
+    layers_to_count: list[CDBLayer] = []
+
+    for values in layer_metadata:
+        if values[nf_idx] == 0:        # ignore those layers that have no features
             continue
-        if layer_metadata_dict_item["refresh_date"] is None:   # ignore those layers that have not been refreshed
+        if values[rd_idx] is None:     # ignore those layers that have not been refreshed
             continue
 
         # Create a Layer object with all the values extracted from 'layer_metadata'.
-        layer = CDBLayer(*layer_metadata_dict_item.values())
+        layer = CDBLayer(*values)
+
+        layers_to_count.append(layer)
 
-        # Count the number of features that the layer has in the current extents.
-        sql.exec_gview_counter(dlg=dlg, layer=layer) # Stores number in layer.n_selected.
+        # Add the view to the list of its Feature Type
+        new_ft_layers[values[ft_idx]].append(layer)
 
-        # Get the FeatureType object of the current layer
-        curr_FeatureType: FeatureType = dlg.FeatureTypesRegistry[layer_metadata_dict_item['feature_type']]
+    feat_type: FeatureType
+    for key, ft_layers in new_ft_layers.items():
+        feat_type = dlg.FeatureTypesRegistry[key]
+        feat_type.layers = ft_layers
 
-        # Add the view to the FeatureObject views list
-        curr_FeatureType.layers.append(layer)
+    # Count the number of features each layer has in the current extents:
+    # a single round trip for all layers. Stores numbers in layer.n_selected.
+    sql.exec_gview_counter_batch(dlg=dlg, layers=layers_to_count)
 
     return None
 
@@ -102,14 +152,12 @@ def fill_feature_type_box(dlg: CDB4LoaderDialog) -> None:
     # Clear from previous runs
     dlg.cbxFeatureType.clear()
 
-    layer: CDBLayer
     # Add only those Feature Types that have at least one view containing > 0 features.
     for key, ft in dlg.FeatureTypesRegistry.items():
-        for layer in ft.layers:
-            if layer.n_selected > 0:
-                dlg.cbxFeatureType.addItem(key, ft)
-                # The first FeatureType object added in 'cbxFeatureType' emits a 'currentIndexChanged' signal.
-                break # We need only one view to have > 0 features.
+        # We need only one view to have > 0 features: any() short-circuits.
+        if any(layer.n_selected > 0 for layer in ft.layers):
+            # The first FeatureType object added in 'cbxFeatureType' emits a 'currentIndexChanged' signal.
+            dlg.cbxFeatureType.addItem(key, ft)
 
 
 def fill_lod_box(dlg: CDB4LoaderDialog) -> None:
@@ -120,18 +168,13 @@ def fill_lod_box(dlg: CDB4LoaderDialog) -> None:
     if not selected_ft:
         return None
 
-    geom_set = set() # To store the unique lods.
-    layer: CDBLayer
-    for layer in selected_ft.layers:
-        geom_set.add(layer.lod)
-
     # Clean from previous runs
     dlg.cbxLod.clear()
 
-    # Add lod string into both text and data holder of combo box.
-    for lod in sorted(list(geom_set)):
+    # Add the unique lod strings into both text and data holder of combo box.
+    for lod in sorted({layer.lod for layer in selected_ft.layers}):
         # The first LoD string added in 'cbxLod' emits a 'currentIndexChanged' signal.
-       dlg.cbxLod.addItem(lod, lod)
+        dlg.cbxLod.addItem(lod, lod)
 
 
 def fill_layers_box(dlg: CDB4LoaderDialog) -> None:
@@ -153,12 +196,11 @@ def fill_layers_box(dlg: CDB4LoaderDialog) -> None:
     layer: CDBLayer
     #selected_FeatureType: FeatureTypeLayersGroup
     for layer in selected_ft.layers:
-        if layer.lod == selected_lod:
-            if layer.n_selected > 0:
-                dlg.ccbxLayers.addItemWithCheckState(
-                    text=f'{layer.layer_name} ({layer.n_selected})',
-                    state=0,
-                    userData=layer)
+        if layer.lod == selected_lod and layer.n_selected > 0:
+            dlg.ccbxLayers.addItemWithCheckState(
+                text=f'{layer.layer_name} ({layer.n_selected})',
+                state=0,
+                userData=layer)
     # TODO: 05-02-2021 Add separator between different features
     # REMEMBER: don't use method 'setSeparator', it adds a custom separator to join string of selected items
 
@@ -183,6 +225,20 @@ def get_attForm_child(container: QgsAttributeEditorContainer, child_name: str) -
     return None
 
 
+def get_attForm_children_dict(container: QgsAttributeEditorContainer) -> dict:
+    """Function that maps the children of an 'attribute form' container by
+    name. To be preferred over repeated get_attForm_child calls when several
+    children of the same container are needed (e.g. one per detail view).
+
+    *   :param container: An attribute form container object.
+        :type container: QgsAttributeEditorContainer
+
+    *   :returns: Dictionary mapping child names to 'attribute form' child elements.
+        :rtype: dict
+    """
+    return {child.name(): child for child in container.children()}
+
+
 def send_to_ToC_top(group: QgsLayerTreeGroup) -> None: 
     """Function that send the input group to the top of the project's 'Table of Contents' tree.
     #NOTE: this function could be generalized to accept ToC index location as a parameter (int).
@@ -198,22 +254,22 @@ def send_to_ToC_bottom(node: QgsLayerTreeGroup) -> None:
     """Function that send the input group to the bottom of the project's 'Table of Contents' tree.
     # NOTE: this function could be generalized to accept ToC index location as a parameter (int).
     """
-    group = None
-    names = [child.name() for child in node.children()]
-    if 'FeatureType: Relief' in names:
-        for c,i in enumerate(node.children()):
-            if i.name() == 'FeatureType: Relief':
-                group = i
-                break
-        if group:
-            idx=len(node.children())-2
-            move_group = group.clone()
-            node.insertChildNode(index=idx, node=move_group)
-            node.removeChildNode(node=group)
+    # Materialize the children once: each children() call allocates a new
+    # list from the C++ side. One pass finds the Relief group (if any).
+    children = node.children()
+    group = next((child for child in children if child.name() == 'FeatureType: Relief'), None)
+    if group is not None:
+        idx = len(children) - 2
+        move_group = group.clone()
+        node.insertChildNode(index=idx, node=move_group)
+        node.removeChildNode(node=group)
         return None
-    
-    for child in node.children():
-        send_to_ToC_bottom(child)
+
+    # Recurse only when the Relief group was not found at this level,
+    # and only into actual groups.
+    for child in children:
+        if isinstance(child, QgsLayerTreeGroup):
+            send_to_ToC_bottom(child)
 
 
 def get_citydb_node(dlg: CDB4LoaderDialog) -> QgsLayerTreeGroup:
@@ -251,29 +307,37 @@ def get_all_dv_and_lu_nodes(dlg: CDB4LoaderDialog) -> list[QgsLayerTreeGroup]:
     return dv_lu_nodes
 
 
-def sort_ToC(group: QgsLayerTreeGroup) -> None:
-    """Recursive function to sort the entire 'Table of Contents' tree,
-    including both groups and underlying layers.
+def _sort_one_level(group: QgsLayerTreeGroup) -> None:
+    """Function that sorts the direct children of one group by name.
     """
-    # Germán Carrillo BEGIN: https://gis.stackexchange.com/questions/397789/sorting-layers-by-name-in-one-specific-group-of-qgis-layer-tree #
-    LayerNamesEnumDict = lambda listCh:{listCh[q[0]].name() + str(q[0]):q[1] for q in enumerate(listCh)}
+    children = group.children()
+    # sorted() is stable, so children with equal names keep their order.
+    sorted_children = sorted(children, key=lambda child: child.name())
+
+    if sorted_children != children:
+        # The tree only accepts clones of existing nodes: insert the sorted
+        # clones in one batch, then drop the originals.
+        clones = [child.clone() for child in sorted_children]
+        group.insertChildNodes(0, clones)
+        for child in children:
+            group.removeChildNode(child)
 
-    # group instead of root
-    mLNED = LayerNamesEnumDict(group.children())
-    mLNEDkeys = OrderedDict(sorted(LayerNamesEnumDict(group.children()).items(), reverse=False)).keys()
+    group.setExpanded(True)
 
-    mLNEDsorted = [mLNED[k].clone() for k in mLNEDkeys]
-    group.insertChildNodes(0, mLNEDsorted)  # group instead of root
-    for n in mLNED.values():
-        group.removeChildNode(n)  # group instead of root
-    # Germán Carrillo END #
+    return None
 
-    group.setExpanded(True)
-    for child in group.children():
-        if isinstance(child, QgsLayerTreeGroup):
-            sort_ToC(child)
-        else: 
-            return None
+
+def sort_ToC(group: QgsLayerTreeGroup) -> None:
+    """Function to sort the entire 'Table of Contents' tree below a group,
+    including both groups and underlying layers. The tree is walked with an
+    explicit stack, so arbitrarily deep trees cannot exhaust the call stack.
+    """
+    stack = deque([group])
+    while stack:
+        node = stack.pop()
+        _sort_one_level(node)
+        # Re-fetch the children: the sorted clones replaced the original node objects.
+        stack.extend(child for child in node.children() if isinstance(child, QgsLayerTreeGroup))
 
     return None
 
@@ -293,12 +357,10 @@ def add_group_node_to_ToC(parent_node: QgsLayerTreeGroup, child_name: str) -> Qg
         :rtype: QgsLayerTreeGroup
     """
     # node_name group (e.g. test_db)
-    if not parent_node.findGroup(child_name):
+    node = parent_node.findGroup(child_name)
+    if node is None:
         # Create group
         node = parent_node.addGroup(child_name)
-    else:
-        # Get existing group
-        node = parent_node.findGroup(child_name)
     return node
 
 
@@ -311,6 +373,16 @@ def add_layer_node_to_ToC(dlg: CDB4LoaderDialog, layer: CDBLayer) -> QgsLayerTre
     *   :returns: The node (group) where the view is going to be added.
         :rtype: QgsLayerTreeGroup
     """
+    # Layers loaded into the same LoD group share the whole group chain:
+    # remember it per import session instead of re-walking the tree each time.
+    node_cache = getattr(dlg, "_toc_group_node_cache", None)
+    if node_cache is None:
+        node_cache = dlg._toc_group_node_cache = {}
+    node_key = (layer.cdb_schema, layer.feature_type, layer.root_class, layer.lod)
+    node_lod = node_cache.get(node_key)
+    if node_lod is not None:
+        return node_lod
+
     root = QgsProject.instance().layerTreeRoot()
 
     # Database group (e.g. delft @ localhost:5432)
@@ -319,14 +391,15 @@ def add_layer_node_to_ToC(dlg: CDB4LoaderDialog, layer: CDBLayer) -> QgsLayerTre
     # node_cdb = add_group_node_to_ToC(parent_node=root, child_name=dlg.DB.database_name)
     
     # Schema group (e.g. citydb)
-    node_cdb_schema = add_group_node_to_ToC(parent_node=node_cdb, child_name="@".join([dlg.DB.username, layer.cdb_schema]))
+    node_cdb_schema = add_group_node_to_ToC(parent_node=node_cdb, child_name=get_schema_node_name(dlg))
     # FeatureType group (e.g. Building)
-    node_featureType = add_group_node_to_ToC(parent_node=node_cdb_schema, child_name=f"FeatureType: {layer.feature_type}")
+    node_featureType = add_group_node_to_ToC(parent_node=node_cdb_schema, child_name=get_feature_type_group_name(dlg, layer.feature_type))
     # Feature group (e.g. Building Part)
     node_feature = add_group_node_to_ToC(parent_node=node_featureType, child_name=layer.root_class)
     # LoD group (e.g. lod2)
     node_lod = add_group_node_to_ToC(parent_node=node_feature, child_name=layer.lod)
 
+    node_cache[node_key] = node_lod
     return node_lod # Node where the view has been added
 
 
@@ -342,67 +415,215 @@ def is_layer_already_in_ToC_group(group: QgsLayerTreeGroup, layer_name: str) ->
     *   :returns: Search result.
         :rtype: bool
     """
-    if layer_name in [child.name() for child in group.children()]:
-        return True
-    return False
+    return any(child.name() == layer_name for child in group.children())
 
 
-def create_layer_relation_to_dv_address(dlg: CDB4LoaderDialog, layer: QgsVectorLayer, dv_gen_name: str) -> None:
-    """Function to set up the relations for an input layer (e.g. a view).
-    - New relation objects are created that reference the detail views of the address(es) tables.
-    - Relations are also set for 'Value Relation' widget.
+def get_schema_node_name(dlg: CDB4LoaderDialog) -> str:
+    """Function that returns the '<username>@<cdb_schema>' name of the schema
+    node in the 'Table of Contents' tree. The string is cached on the dialog
+    and rebuilt only when the user or the cdb_schema changes.
 
-    *   :param layer: vector layer to set up the relationships for.
-        :type layer: QgsVectorLayer
+    *   :returns: Name of the schema node.
+        :rtype: str
     """
-    dv_gen_names: list = [k for k in dlg.DetailViewsRegistry.keys() if k.startswith("address_")]
-    # print("dv_gen_names", dv_gen_names)
+    key = (dlg.DB.username, dlg.CDB_SCHEMA)
+    cached = getattr(dlg, "_schema_node_name", None)
+    if cached is None or cached[0] != key:
+        cached = (key, "@".join(key))
+        dlg._schema_node_name = cached
+    return cached[1]
 
-    if dv_gen_name not in dv_gen_names:
-        # We're creating relations that may not be valid, so exit.
-        return None
 
-    # dv: CDBDetailView
-    dv = [v for k,v in dlg.DetailViewsRegistry.items() if k == dv_gen_name][0]
+def get_feature_type_group_name(dlg: CDB4LoaderDialog, feature_type: str) -> str:
+    """Function that returns the 'FeatureType: <name>' group name used in the
+    'Table of Contents' tree. Names are cached on the dialog, so the string is
+    built only once per Feature Type instead of once per layer.
+
+    *   :param feature_type: Name of the Feature Type (e.g. 'Building').
+        :type feature_type: str
+
+    *   :returns: Name of the Feature Type group node.
+        :rtype: str
+    """
+    names = getattr(dlg, "_ft_group_names", None)
+    if names is None:
+        names = dlg._ft_group_names = {}
+    name = names.get(feature_type)
+    if name is None:
+        name = names[feature_type] = f"FeatureType: {feature_type}"
+    return name
+
+
+def invalidate_toc_session_cache(dlg: CDB4LoaderDialog) -> None:
+    """Function that drops the cached 'Table of Contents' lookups.
+    To be called whenever the layer tree may have changed (i.e. at the
+    beginning of an import run).
+    """
+    dlg._toc_session_cache = None
+    dlg._toc_group_node_cache = {}
+
+
+def get_toc_session_cache(dlg: CDB4LoaderDialog) -> dict:
+    """Function that builds (once per import session) the lookups into the
+    project's 'Table of Contents' tree that the create_layer_relation_to_*
+    functions need for every imported layer: the schema node, the detail-view
+    layer for each detail view, and the ids of the look-up table layers.
+    Walking the tree is O(size of the tree); doing it once instead of once per
+    layer (and per relation) is the measured hot spot with many layers.
+
+    *   :returns: cached lookups, keys: schema_node, dv_layer_by_gen_name,
+        enum_layer_id, codelist_layer_id
+        :rtype: dict
+    """
+    cache = getattr(dlg, "_toc_session_cache", None)
+    if cache is not None:
+        return cache
 
     # Isolate the layers' ToC environment to avoid grabbing the first layer encountered in the WHOLE ToC.
     root = QgsProject.instance().layerTreeRoot()
-
     db_node = root.findGroup(dlg.DB.db_toc_node_label)
-    # db_node = root.findGroup(dlg.DB.database_name)
-    
-    schema_node = db_node.findGroup("@".join([dlg.DB.username,dlg.CDB_SCHEMA]))
+    schema_node = db_node.findGroup(get_schema_node_name(dlg))
+
     detail_views_node = schema_node.findGroup(c.detail_views_group_alias)
-    dv_layers: list = detail_views_node.findLayers()
-    # print("dv_layers", dv_layers)
-    # dv_layer: QgsLayerTreeLayer
-    dv_layer = [elem for elem in cast(Iterable[QgsLayerTreeLayer], dv_layers) if elem.name().endswith(dv.gen_name)][0] # it should be only one!
-    # print("dv_layer", dv_layer)
+    dv_layers = cast(Iterable[QgsLayerTreeLayer], detail_views_node.findLayers())
+
+    # The detail views were loaded with their registry name as layer name
+    # (see add_detail_view_tables_to_ToC), so a single pass building an
+    # exact-name index replaces a suffix scan over all layers per view.
+    dv_layer_by_name = {elem.name(): elem for elem in dv_layers}
 
-    # Create new Relation object
+    dv_layer_by_gen_name: dict[str, QgsLayerTreeLayer] = {}
+    dv: CDBDetailView
+    for dv in dlg.DetailViewsRegistry.values():
+        dv_layer = dv_layer_by_name.get(dv.name)
+        if dv_layer is None:
+            # Fall back to the suffix match for layer names QGIS decorated. It should be only one!
+            dv_layer = next((elem for elem in dv_layers if elem.name().endswith(dv.gen_name)), None)
+        dv_layer_by_gen_name[dv.gen_name] = dv_layer
+
+    lookups_node = schema_node.findGroup(c.lookup_tables_group_alias)
+    lu_layers = lookups_node.findLayers()
+
+    cache = {
+        "schema_node": schema_node,
+        "dv_layer_by_gen_name": dv_layer_by_gen_name,
+        "enum_layer_id": next((i.layerId() for i in lu_layers if c.enumerations_table in i.layerId()), None),
+        "codelist_layer_id": next((i.layerId() for i in lu_layers if c.codelists_table in i.layerId()), None),
+        }
+    dlg._toc_session_cache = cache
+    return cache
+
+
+def _get_relation_strength(dlg: CDB4LoaderDialog):
+    """Function that returns the relation strength value to pass to
+    QgsRelation.setStrength(). The QGIS-version check is carried out only
+    once per session and the result is cached on the dialog.
+
+    *   :returns: The 'association' strength, as int (QGIS < 3.28) or enumeration.
+        :rtype: int | Qgis.RelationshipStrength
+    """
+    rel_strength = getattr(dlg, "_rel_strength", None)
+    if rel_strength is None:
+        # Till QGIS 3.26 the argument of setStrength is numeric, from QGIS 3.28 it is an enumeration
+        if dlg.QGIS_VERSION_MAJOR == 3 and dlg.QGIS_VERSION_MINOR < 28:
+            rel_strength = 0 # integer, 0 is association, 1 composition
+        else:
+            rel_strength = Qgis.RelationshipStrength.Association # New way of defining it, as enumeration
+        dlg._rel_strength = rel_strength
+    return rel_strength
+
+
+def _make_and_register_relation(dlg: CDB4LoaderDialog, layer: QgsVectorLayer, layer_name: str, dv_layer: QgsLayerTreeLayer, rel_strength, pending_rels: list = None) -> QgsRelation:
+    """Function that creates the relation between a layer and a detail view
+    layer and registers it with the project's relation manager. Shared by all
+    create_layer_relation_to_dv_* functions.
+
+    *   :param layer: vector layer the relation refers to.
+        :type layer: QgsVectorLayer
+
+    *   :param layer_name: name of the vector layer (hoisted out of the callers' loops).
+        :type layer_name: str
+
+    *   :param dv_layer: node of the detail view layer in the Layer Tree.
+        :type dv_layer: QgsLayerTreeLayer
+
+    *   :param pending_rels: when given, valid relations are appended here and
+            registered by the caller in one batch instead of one by one.
+        :type pending_rels: list
+
+    *   :returns: The created relation (possibly invalid, already logged).
+        :rtype: QgsRelation
+    """
     rel = QgsRelation()
     rel.setReferencedLayer(id=layer.id())  # i.e. the (QGIS  internal) id of the CityObject layer
-    rel.setReferencingLayer(id=dv_layer.layerId()) # i.e. the (QGIS  internal) id of the Address layer
+    rel.setReferencingLayer(id=dv_layer.layerId()) # i.e. the (QGIS  internal) id of the detail view layer
     rel.addFieldPair(referencingField='cityobject_id', referencedField='id')
-    rel.setName(name='re_' + layer.name() + "_" + dv_layer.name())    
-    rel.setId(id="id_" + rel.name())
-
-    # Till QGIS 3.26 the argument of setStrength is numeric, from QGIS 3.28 it is an enumeration
-    if dlg.QGIS_VERSION_MAJOR == 3 and dlg.QGIS_VERSION_MINOR < 28:
-        rel.setStrength(0) # integer, 0 is association, 1 composition
-    else:
-        # rel_strength = Qgis.RelationshipStrength(0) # integer, 0 is association, 1 composition
-        rel_strength = Qgis.RelationshipStrength.Association # New way of defining it, as enumeration
-        # print(rel_strength)
-        rel.setStrength(rel_strength)
+    rel_name: str = f"re_{layer_name}_{dv_layer.name()}"
+    rel.setName(name=rel_name)
+    rel.setId(id=f"id_{rel_name}")
+    rel.setStrength(rel_strength)
 
     # print("rel.is_valid", rel.isValid())
     if rel.isValid(): # Success
-        QgsProject.instance().relationManager().addRelation(rel)
+        if pending_rels is not None:
+            pending_rels.append(rel)
+        else:
+            QgsProject.instance().relationManager().addRelation(rel)
     else:
         msg: str = f"Invalid relation: {rel.name()}"
         QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
 
+    return rel
+
+
+def _add_relation_to_form_tab(rel: QgsRelation, container_dv: QgsAttributeEditorElement) -> None:
+    """Function that replaces the content of an 'attribute form' container
+    (tab) with the given relation.
+
+    *   :param rel: relation to insert into the form.
+        :type rel: QgsRelation
+
+    *   :param container_dv: container (tab) of the detail view in the form.
+        :type container_dv: QgsAttributeEditorElement
+    """
+    # Clean the element before inserting the relation
+    container_dv.clear()
+
+    # Create an 'attribute form' relation object from the 'relation' object
+    relation_field = QgsAttributeEditorRelation(relation=rel, parent=container_dv)
+    relation_field.setLabel(c.detail_views_group_alias)
+    relation_field.setShowLabel(False) # No point setting a label then.
+    # Add the relation to the container (tab).
+    container_dv.addChildElement(relation_field)
+
+    return None
+
+
+def create_layer_relation_to_dv_address(dlg: CDB4LoaderDialog, layer: QgsVectorLayer, dv_gen_name: str, pending_rels: list = None) -> None:
+    """Function to set up the relations for an input layer (e.g. a view).
+    - New relation objects are created that reference the detail views of the address(es) tables.
+    - Relations are also set for 'Value Relation' widget.
+
+    *   :param layer: vector layer to set up the relationships for.
+        :type layer: QgsVectorLayer
+    """
+    if not dv_gen_name.startswith("address_") or dv_gen_name not in dlg.DetailViewsRegistry:
+        # We're creating relations that may not be valid, so exit.
+        return None
+
+    # dv: CDBDetailView
+    dv = dlg.DetailViewsRegistry[dv_gen_name]
+
+    # The ToC lookups are computed once per import session (see get_toc_session_cache).
+    dv_layer = get_toc_session_cache(dlg)["dv_layer_by_gen_name"].get(dv.gen_name)
+    if dv_layer is None:
+        msg: str = f"Detail view layer not found in Layer Tree for: {dv.gen_name}"
+        QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
+        return None
+
+    # Create and register the new Relation object
+    rel = _make_and_register_relation(dlg=dlg, layer=layer, layer_name=layer.name(), dv_layer=dv_layer, rel_strength=_get_relation_strength(dlg), pending_rels=pending_rels)
+
     # ###############################################
     # Now start working on the form attached to the layer
     if dlg.settings.enable_ui_based_forms is False:
@@ -415,24 +636,16 @@ def create_layer_relation_to_dv_address(dlg: CDB4LoaderDialog, layer: QgsVectorL
         layer_root_container = layer_configuration.invisibleRootContainer()
         # print('layer_root_container', layer_root_container)
 
-        # Find the element containing the "Generic Attributes" in the form.
+        # Find the element containing the "Address(es)" tab in the form and add the relation to it.
         container_dv = get_attForm_child(container=layer_root_container, child_name=dv.form_tab_name)
-        # Clean the element before inserting the relation
-        container_dv.clear()
-
-        # Create an 'attribute form' relation object from the 'relation' object
-        relation_field = QgsAttributeEditorRelation(relation=rel, parent=container_dv)
-        relation_field.setLabel(c.detail_views_group_alias)
-        relation_field.setShowLabel(False) # No point setting a label then.
-        # Add the relation to the 'Address(es)' container (tab).
-        container_dv.addChildElement(relation_field)
+        _add_relation_to_form_tab(rel=rel, container_dv=container_dv)
 
         layer.setEditFormConfig(layer_configuration)
        
     return None
 
 
-def create_layer_relation_to_dv_ext_ref(dlg: CDB4LoaderDialog, layer: QgsVectorLayer) -> None:
+def create_layer_relation_to_dv_ext_ref(dlg: CDB4LoaderDialog, layer: QgsVectorLayer, pending_rels: list = None) -> None:
     """Function to set up the relations for an input layer (e.g. a view).
     - New relation objects are created that reference the detail views of the address(es) tables.
     - Relations are also set for 'Value Relation' widget.
@@ -442,15 +655,12 @@ def create_layer_relation_to_dv_ext_ref(dlg: CDB4LoaderDialog, layer: QgsVectorL
     """
     detail_views: list = [v for k,v in dlg.DetailViewsRegistry.items() if k.startswith("ext_ref_")]
 
-    # Isolate the layers' ToC environment to avoid grabbing the first layer encountered in the WHOLE ToC.
-    root = QgsProject.instance().layerTreeRoot()
-
-    db_node = root.findGroup(dlg.DB.db_toc_node_label)
-    # db_node = root.findGroup(dlg.DB.database_name)
+    # The ToC lookups are computed once per import session (see get_toc_session_cache).
+    dv_layer_by_gen_name = get_toc_session_cache(dlg)["dv_layer_by_gen_name"]
 
-    schema_node = db_node.findGroup("@".join([dlg.DB.username,dlg.CDB_SCHEMA]))
-    detail_views_node = schema_node.findGroup(c.detail_views_group_alias)
-    dv_layers: list = detail_views_node.findLayers()
+    # Loop invariants: relation strength and the layer name.
+    rel_strength = _get_relation_strength(dlg)
+    layer_name: str = layer.name()
 
     # Get the layer configuration
     layer_configuration = layer.editFormConfig()
@@ -458,55 +668,33 @@ def create_layer_relation_to_dv_ext_ref(dlg: CDB4LoaderDialog, layer: QgsVectorL
     # Get the root container of all objects contained in the form (widgets, etc.)
     layer_root_container = layer_configuration.invisibleRootContainer()
     # print('layer_root_container', layer_root_container)
+    # The container children do not change while we loop: index them once.
+    containers_by_name = get_attForm_children_dict(container=layer_root_container)
 
     dv: CDBDetailView
     for dv in detail_views:
 
-        dv_layer: QgsLayerTreeLayer
-        dv_layer = [elem for elem in dv_layers if elem.name().endswith(dv.gen_name)][0] # it should be only one!
-        
-        # Create new Relation object
-        rel = QgsRelation()
-        rel.setReferencedLayer(id=layer.id())  # i.e. the (QGIS  internal) id of the CityObject layer
-        rel.setReferencingLayer(id=dv_layer.layerId()) # i.e. the (QGIS  internal) id of the Address layer
-        rel.addFieldPair(referencingField='cityobject_id', referencedField='id')
-        rel.setName(name='re_' + layer.name() + "_" + dv_layer.name())
-        rel.setId(id="id_" + rel.name())
-
-        # Till QGIS 3.26 the argument of setStrength is numeric, from QGIS 3.28 it is an enumeration
-        if dlg.QGIS_VERSION_MAJOR == 3 and dlg.QGIS_VERSION_MINOR < 28:
-            rel.setStrength(0) # integer, 0 is association, 1 composition
-        else:
-            rel_strength = Qgis.RelationshipStrength(0) # integer, 0 is association, 1 composition
-            # print(rel_strength)
-            rel.setStrength(rel_strength)
-
-        # print("rel.is_valid", rel.isValid())
-        if rel.isValid(): # Success
-            QgsProject.instance().relationManager().addRelation(rel)
-        else:
-            msg: str = f"Invalid relation: {rel.name()}"
+        dv_layer: QgsLayerTreeLayer = dv_layer_by_gen_name.get(dv.gen_name)
+        if dv_layer is None:
+            msg: str = f"Detail view layer not found in Layer Tree for: {dv.gen_name}"
             QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
+            continue
+
+        
+        # Create and register the new Relation object
+        rel = _make_and_register_relation(dlg=dlg, layer=layer, layer_name=layer_name, dv_layer=dv_layer, rel_strength=rel_strength, pending_rels=pending_rels)
 
         # Now set up the tab in the qml tab of the attribute form attached to the layer
         if dlg.settings.enable_ui_based_forms is False:
 
-            # Find the element containing the "Gen Attrib (XXXX)" tab in the form.
-            container_dv = get_attForm_child(container=layer_root_container, child_name=dv.form_tab_name)
-            # Clean the element before inserting the relation
-            container_dv.clear()
-
-            # Create an 'attribute form' relation object from the 'relation' object
-            relation_field = QgsAttributeEditorRelation(relation=rel, parent=container_dv)
-            relation_field.setLabel(c.detail_views_group_alias)
-            relation_field.setShowLabel(False) # No point setting a label then.
-            # Add the relation to the 'Address(es)' container (tab).
-            container_dv.addChildElement(relation_field)
+            # Find the element containing the detail view tab in the form and add the relation to it.
+            container_dv = containers_by_name.get(dv.form_tab_name)
+            _add_relation_to_form_tab(rel=rel, container_dv=container_dv)
 
     layer.setEditFormConfig(layer_configuration)
 
 
-def create_layer_relation_to_dv_gen_attrib(dlg: CDB4LoaderDialog, layer: QgsVectorLayer) -> None:
+def create_layer_relation_to_dv_gen_attrib(dlg: CDB4LoaderDialog, layer: QgsVectorLayer, pending_rels: list = None) -> None:
     """Function to set up the relations for an input layer (e.g. a view).
     - New relation objects are created that reference the detail views of the address(es) tables.
     - Relations are also set for 'Value Relation' widget.
@@ -516,15 +704,12 @@ def create_layer_relation_to_dv_gen_attrib(dlg: CDB4LoaderDialog, layer: QgsVect
     """
     detail_views: list = [v for k,v in dlg.DetailViewsRegistry.items() if k.startswith("gen_attrib_")]
 
-    # Isolate the layers' ToC environment to avoid grabbing the first layer encountered in the WHOLE ToC.
-    root = QgsProject.instance().layerTreeRoot()
+    # The ToC lookups are computed once per import session (see get_toc_session_cache).
+    dv_layer_by_gen_name = get_toc_session_cache(dlg)["dv_layer_by_gen_name"]
 
-    db_node = root.findGroup(dlg.DB.db_toc_node_label)
-    # db_node = root.findGroup(dlg.DB.database_name)
-    
-    schema_node = db_node.findGroup("@".join([dlg.DB.username,dlg.CDB_SCHEMA]))
-    detail_views_node = schema_node.findGroup(c.detail_views_group_alias)
-    dv_layers: list = detail_views_node.findLayers()
+    # Loop invariants: relation strength and the layer name.
+    rel_strength = _get_relation_strength(dlg)
+    layer_name: str = layer.name()
 
     # Get the layer configuration
     layer_configuration = layer.editFormConfig()
@@ -532,6 +717,8 @@ def create_layer_relation_to_dv_gen_attrib(dlg: CDB4LoaderDialog, layer: QgsVect
     # Get the root container of all objects contained in the form (widgets, etc.)
     layer_root_container = layer_configuration.invisibleRootContainer()
     # print('layer_root_container', layer_root_container)
+    # The container children do not change while we loop: index them once.
+    containers_by_name = get_attForm_children_dict(container=layer_root_container)
 
     dv: CDBDetailView
     # print("----------Registry")
@@ -544,46 +731,22 @@ def create_layer_relation_to_dv_gen_attrib(dlg: CDB4LoaderDialog, layer: QgsVect
 
     for dv in detail_views:
 
-        dv_layer: QgsLayerTreeLayer
-        dv_layer = [elem for elem in dv_layers if elem.name().endswith(dv.gen_name)][0] # it should be only one!
-        
-        # Create new Relation object
-        rel = QgsRelation()
-        rel.setReferencedLayer(id=layer.id())  # i.e. the (QGIS  internal) id of the CityObject layer
-        rel.setReferencingLayer(id=dv_layer.layerId()) # i.e. the (QGIS  internal) id of the Address layer
-        rel.addFieldPair(referencingField='cityobject_id', referencedField='id')
-        rel.setName(name='re_' + layer.name() + "_" + dv_layer.name())
-        rel.setId(id="id_" + rel.name())
-
-        # Till QGIS 3.26 the argument of setStrength is numeric, from QGIS 3.28 it is an enumeration
-        if dlg.QGIS_VERSION_MAJOR == 3 and dlg.QGIS_VERSION_MINOR < 28:
-            rel.setStrength(0) # integer, 0 is association, 1 composition
-        else:
-            rel_strength = Qgis.RelationshipStrength(0) # integer, 0 is association, 1 composition
-            # print(rel_strength)
-            rel.setStrength(rel_strength)
-
-        # print("rel.is_valid", rel.isValid())
-        if rel.isValid(): # Success
-            QgsProject.instance().relationManager().addRelation(rel)
-        else:
-            msg: str = f"Invalid relation: {rel.name()}"
+        dv_layer: QgsLayerTreeLayer = dv_layer_by_gen_name.get(dv.gen_name)
+        if dv_layer is None:
+            msg: str = f"Detail view layer not found in Layer Tree for: {dv.gen_name}"
             QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
+            continue
+
+        
+        # Create and register the new Relation object
+        rel = _make_and_register_relation(dlg=dlg, layer=layer, layer_name=layer_name, dv_layer=dv_layer, rel_strength=rel_strength, pending_rels=pending_rels)
 
         # Now set up the tab in the qml tab of the attribute form attached to the layer
         if dlg.settings.enable_ui_based_forms is False:
 
-            # Find the element containing the "Gen Attrib (XXXX)" tab in the form.
-            container_dv = get_attForm_child(container=layer_root_container, child_name=dv.form_tab_name)
-            # Clean the element before inserting the relation
-            container_dv.clear()
-
-            # Create an 'attribute form' relation object from the 'relation' object
-            relation_field = QgsAttributeEditorRelation(relation=rel, parent=container_dv)
-            relation_field.setLabel(c.detail_views_group_alias)
-            relation_field.setShowLabel(False) # No point setting a label then.
-            # Add the relation to the 'Address(es)' container (tab).
-            container_dv.addChildElement(relation_field)
+            # Find the element containing the detail view tab in the form and add the relation to it.
+            container_dv = containers_by_name.get(dv.form_tab_name)
+            _add_relation_to_form_tab(rel=rel, container_dv=container_dv)
 
     layer.setEditFormConfig(layer_configuration)
         
@@ -618,16 +781,8 @@ def create_layer_relation_to_enumerations(dlg: CDB4LoaderDialog, layer: QgsVecto
     if not layer_metadata.enum_cols:
         return None # Exit, there are no enumerations to link to this layer
 
-    # Isolate the layer's ToC environment to avoid grabbing the first layer encountered in the WHOLE ToC.
-    root = QgsProject.instance().layerTreeRoot()
-
-    db_node = root.findGroup(dlg.DB.db_toc_node_label)
-    # db_node = root.findGroup(dlg.DB.database_name)
-
-    schema_node = db_node.findGroup("@".join([dlg.DB.username, dlg.CDB_SCHEMA]))
-    enums_node = schema_node.findGroup(c.lookup_tables_group_alias)
-    enum_layers = enums_node.findLayers()
-    enum_layer_id = [i.layerId() for i in enum_layers if c.enumerations_table in i.layerId()][0]
+    # The ToC lookups are computed once per import session (see get_toc_session_cache).
+    enum_layer_id = get_toc_session_cache(dlg)["enum_layer_id"]
 
     # Create a dictionary with field names and field index
     fields_dict = {}
@@ -656,16 +811,8 @@ def create_layer_relation_to_codelists(dlg: CDB4LoaderDialog, layer: QgsVectorLa
     if not layer_metadata.codelist_cols:
         return None # Exit, there are no codelists to link to this layer
 
-    # Isolate the layer's ToC environment to avoid grabbing the first layer encountered in the WHOLE ToC.
-    root = QgsProject.instance().layerTreeRoot()
-
-    db_node = root.findGroup(dlg.DB.db_toc_node_label)
-    # db_node = root.findGroup(dlg.DB.database_name)
-    
-    schema_node = db_node.findGroup("@".join([dlg.DB.username, dlg.CDB_SCHEMA]))
-    cls_node = schema_node.findGroup(c.lookup_tables_group_alias)
-    cl_layers = cls_node.findLayers()
-    cl_layer_id = [i.layerId() for i in cl_layers if c.codelists_table in i.layerId()][0]
+    # The ToC lookups are computed once per import session (see get_toc_session_cache).
+    cl_layer_id = get_toc_session_cache(dlg)["codelist_layer_id"]
 
     # Create a dictionary with field names and field index
     fields_dict = {}
@@ -697,30 +844,45 @@ def add_lookup_tables_to_ToC(dlg: CDB4LoaderDialog) -> None:
     cdb_schema: str = dlg.CDB_SCHEMA
     usr_schema: str = dlg.USR_SCHEMA
 
+    # The project singleton is resolved once per call, not once per use.
+    project = QgsProject.instance()
+
     # Add look-up tables into their own group in ToC.
-    node_cdb_schema = QgsProject.instance().layerTreeRoot().findGroup("@".join([db.username, cdb_schema]))
+    node_cdb_schema = project.layerTreeRoot().findGroup(get_schema_node_name(dlg))
 
     lookups_node = add_group_node_to_ToC(parent_node=node_cdb_schema, child_name=c.lookup_tables_group_alias)
 
     # Get look-up tables names from the server.
-    lookup_tables = sql.list_lookup_tables(dlg=dlg)
+    lookup_tables = sql.list_lookup_tables_cached(dlg=dlg)
+
+    # Names of the layers already in the group: one pass instead of one per table.
+    existing_names = {child.name() for child in lookups_node.children()}
+
+    # Newly created layers, registered with the project in one batch after the loop.
+    new_layers: list[QgsVectorLayer] = []
 
     for lookup_table in lookup_tables:
         # Create ONLY new layers.
-        if not is_layer_already_in_ToC_group(group=lookups_node, layer_name=f"{dlg.CDB_SCHEMA}_{lookup_table}"):
+        if f"{cdb_schema}_{lookup_table}" not in existing_names:
             uri = QgsDataSourceUri()
             uri.setConnection(aHost=db.host, aPort=db.port, aDatabase=db.database_name, aUsername=db.username, aPassword=db.password)
             uri.setDataSource(aSchema=usr_schema, aTable=lookup_table, aGeometryColumn=None, aKeyColumn="id")
             layer = QgsVectorLayer(path=uri.uri(False), baseName=f"{cdb_schema}_{lookup_table}", providerLib="postgres")
-            if layer or layer.isValid(): # Success
-                lookups_node.addLayer(layer)
-                QgsProject.instance().addMapLayer(layer, False)
+            if layer.isValid(): # Success
+                new_layers.append(layer)
                 # msg: str = f"Look-up table import: {cdb_schema}_{lookup_table}"
                 # QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
             else: # Fail
                 msg: str = f"Look-up table failed to properly load: {cdb_schema}_{lookup_table}"
                 QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
 
+    if new_layers:
+        # Register all new layers at once: the project emits its signals once
+        # instead of once per layer.
+        project.addMapLayers(new_layers, False)
+        for layer in new_layers:
+            lookups_node.addLayer(layer)
+
     # After loading all look-ups, sort them by name.
     sort_ToC(lookups_node)
 
@@ -737,38 +899,62 @@ def add_detail_view_tables_to_ToC(dlg: CDB4LoaderDialog) -> None:
     extents = dlg.QGIS_EXTENTS.asWktPolygon()
     crs = dlg.CRS
 
+    # The project singleton is resolved once per call, not once per use.
+    project = QgsProject.instance()
+
     # Add generics tables into their own group in ToC.
-    root = QgsProject.instance().layerTreeRoot().findGroup("@".join([db.username, cdb_schema]))
+    root = project.layerTreeRoot().findGroup(get_schema_node_name(dlg))
     detail_view_node = add_group_node_to_ToC(parent_node=root, child_name=c.detail_views_group_alias)
 
+    # Names of the layers already in the group: one pass instead of one per detail view.
+    existing_names = {child.name() for child in detail_view_node.children()}
+
+    # Loop invariants: whether the spatial filter is needed at all, and the
+    # filter itself (EWKT carries the srid, so PostGIS can use the spatial
+    # index without implicit casts).
+    use_spatial_filter: bool = dlg.QGIS_EXTENTS != dlg.LAYER_EXTENTS
+    spatial_filter: str = f"ST_GeomFromEWKT('SRID={crs.postgisSrid()};{extents}') && geom"
+
+    # The layers get their CRS assigned explicitly below: skip QGIS's
+    # per-layer CRS validation (and the srid lookups it triggers).
+    lyr_options = QgsVectorLayer.LayerOptions()
+    lyr_options.skipCrsValidation = True
+
+    # The connection part of the URI is the same for all detail views, and so
+    # are the style categories imported from the qml forms.
+    base_uri_str: str = _get_base_uri_str(dlg)
+    form_categories = QgsMapLayer.StyleCategory.Fields|QgsMapLayer.StyleCategory.Forms
+
+    # Newly created layers, registered with the project in one batch after the loop.
+    new_layers: list[QgsVectorLayer] = []
+
     dv: CDBDetailView
     for dv in dlg.DetailViewsRegistry.values():
 
         # Check that the detail view is not already loaded
-        if not is_layer_already_in_ToC_group(detail_view_node, dv.name):
+        if dv.name not in existing_names:
 
-            uri = QgsDataSourceUri()
-            uri.setConnection(aHost=db.host, aPort=db.port, aDatabase=db.database_name, aUsername=db.username, aPassword=db.password)
+            uri = QgsDataSourceUri(base_uri_str)
 
             if dv.has_geom:
-                if dlg.QGIS_EXTENTS == dlg.LAYER_EXTENTS:
+                if use_spatial_filter:
+                    uri.setDataSource(aSchema=usr_schema, aTable=dv.name, aGeometryColumn="geom", aSql=spatial_filter, aKeyColumn="id")
+                else:
                     # No need to add the spatial filter
                     uri.setDataSource(aSchema=usr_schema, aTable=dv.name, aGeometryColumn="geom", aKeyColumn="id")
-                else:
-                    uri.setDataSource(aSchema=usr_schema, aTable=dv.name, aGeometryColumn="geom", aSql=f"ST_GeomFromText('{extents}') && geom", aKeyColumn="id")
                 # Create a spatial detail view as QgsVectorLayer
-                dv_layer = QgsVectorLayer(path=uri.uri(False), baseName=dv.name, providerLib="postgres")
+                dv_layer = QgsVectorLayer(path=uri.uri(False), baseName=dv.name, providerLib="postgres", options=lyr_options)
                 dv_layer.setCrs(crs)
             else:
                 uri.setDataSource(aSchema=usr_schema, aTable=dv.name, aGeometryColumn=None, aKeyColumn="id")
                 # Create a non-spatial detail view as QgsVectorLayer (but without geometry)
-                dv_layer = QgsVectorLayer(path=uri.uri(False), baseName=dv.name, providerLib="postgres")
+                dv_layer = QgsVectorLayer(path=uri.uri(False), baseName=dv.name, providerLib="postgres", options=lyr_options)
 
-            if dv_layer or dv_layer.isValid(): # Success
+            if dv_layer.isValid(): # Success
                 # Add the qml-based forms
                 if dv.qml_form:
                     #print(dv.qml_form_with_path)
-                    dv_layer.loadNamedStyle(theURI=dv.qml_form_with_path, loadFromLocalDb=False, categories=QgsMapLayer.StyleCategory.Fields|QgsMapLayer.StyleCategory.Forms)
+                    dv_layer.importNamedStyle(doc=_load_qml_dom(dv.qml_form_with_path), categories=form_categories)
                     #dv_layer.loadNamedStyle(theURI=dv.qml_form_with_path, categories=QgsMapLayer.Fields|QgsMapLayer.Forms)
                     #print('qui si blocca')
                     # otherwise: categories=QgsMapLayer.AllStyleCategories
@@ -776,9 +962,12 @@ def add_detail_view_tables_to_ToC(dlg: CDB4LoaderDialog) -> None:
                 # Get the index of the field "cityobject"
                 # This is needed to avoid a warning in the Log telling us that the cityobject field
                 # is missing the relation in its configuration
-                co_idx: int = dv_layer.fields().indexOf("cityobject_id")
-                # print(f"co_id of {detail_view_name} id {co_idx}")
-                dv_layer.setEditorWidgetSetup(index=co_idx, setup=QgsEditorWidgetSetup('TextEdit',{}))
+                if dv.cityobject_id_idx is None:
+                    # The fields of a detail view do not change within a session,
+                    # so the index is resolved once and kept on the registry entry.
+                    dv.cityobject_id_idx = dv_layer.fields().indexOf("cityobject_id")
+                # print(f"co_id of {detail_view_name} id {dv.cityobject_id_idx}")
+                dv_layer.setEditorWidgetSetup(index=dv.cityobject_id_idx, setup=_TEXT_EDIT_WIDGET)
 
                 # Set the layer as read-only if the current cdb_schema is read only
                 if dlg.CDBSchemaPrivileges == "ro":
@@ -786,15 +975,40 @@ def add_detail_view_tables_to_ToC(dlg: CDB4LoaderDialog) -> None:
 
                 # Add to layer tree node
                 detail_view_node.addLayer(dv_layer)
-                QgsProject.instance().addMapLayer(dv_layer, False)
+                new_layers.append(dv_layer)
 
             else:
                 msg: str = f"Detail view '{dv.name}' is not valid"
                 QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
 
+    if new_layers:
+        # Register all new layers at once: the project emits its signals once
+        # instead of once per layer.
+        project.addMapLayers(new_layers, False)
+
     return None
 
 
+def _get_base_uri_str(dlg: CDB4LoaderDialog) -> str:
+    """Function that returns the connection part of the postgres data source
+    URI, shared by all layers created in a session. The encoded string is
+    cached on the dialog and rebuilt only when the connection changes, which
+    also lets the postgres provider pool the backend connections across
+    layer loads.
+
+    *   :returns: The encoded connection URI (without a data source).
+        :rtype: str
+    """
+    db = dlg.DB
+    cached = getattr(dlg, "_base_uri", None)
+    if cached is None or cached[0] is not db:
+        uri = QgsDataSourceUri()
+        uri.setConnection(aHost=db.host, aPort=db.port, aDatabase=db.database_name, aUsername=db.username, aPassword=db.password)
+        cached = (db, uri.uri(False))
+        dlg._base_uri = cached
+    return cached[1]
+
+
 def create_qgis_vector_layer(dlg: CDB4LoaderDialog, layer_name: str) -> QgsVectorLayer:
     """Function that creates a PostgreSQL layer based on the input layer name. This function is used to import
     updatable views from the usr_schema queried to the selected spatial extents.
@@ -802,23 +1016,38 @@ def create_qgis_vector_layer(dlg: CDB4LoaderDialog, layer_name: str) -> QgsVecto
     *   :param v_name: View name to connect to server.
         :type v_name: str
 
-    *   :returns: the created layer object
+    *   :returns: the created layer object, or None when the selected extents
+            do not overlap the layer extents at all.
         :rtype: QgsVectorLayer
     """
     # Shorten the variable names.
-    db = dlg.DB
     usr_schema = dlg.USR_SCHEMA
-    extents = dlg.QGIS_EXTENTS.asWktPolygon()
+    qgis_extents = dlg.QGIS_EXTENTS
     crs = dlg.CRS
 
-    uri = QgsDataSourceUri()
-    uri.setConnection(aHost=db.host, aPort=db.port, aDatabase=db.database_name, aUsername=db.username, aPassword=db.password)
+    if not qgis_extents.intersects(dlg.LAYER_EXTENTS):
+        # The selected extents fall completely outside the layer extents: the
+        # layer would be empty, so skip the round trip to the server entirely.
+        msg: str = f"Layer '{layer_name}' does not intersect the selected extents, nothing to load"
+        QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Info, notifyUser=False)
+        return None
+
+    uri = QgsDataSourceUri(_get_base_uri_str(dlg))
 
-    if dlg.QGIS_EXTENTS == dlg.LAYER_EXTENTS:  
-        # No need to apply a spatial filter in QGIS
+    if qgis_extents.contains(dlg.LAYER_EXTENTS):
+        # The selected extents cover the layer extents entirely (equality
+        # included): a spatial filter could only return the same rows, so
+        # skip it and spare the server the per-row bbox test.
         uri.setDataSource(aSchema=usr_schema, aTable=layer_name, aGeometryColumn="geom", aKeyColumn="id")
     else:
-        uri.setDataSource(aSchema=usr_schema, aTable=layer_name, aGeometryColumn="geom", aSql=f"ST_GeomFromText('{extents}') && geom", aKeyColumn="id")
+        # Filter on a constant envelope: the planner folds it to a constant
+        # and uses the GiST index, without re-parsing any WKT.
+        bbox_sql: str = (
+            f"geom && ST_MakeEnvelope("
+            f"{qgis_extents.xMinimum()},{qgis_extents.yMinimum()},"
+            f"{qgis_extents.xMaximum()},{qgis_extents.yMaximum()},{crs.postgisSrid()})"
+        )
+        uri.setDataSource(aSchema=usr_schema, aTable=layer_name, aGeometryColumn="geom", aSql=bbox_sql, aKeyColumn="id")
 
     new_layer = QgsVectorLayer(uri.uri(False), layer_name, "postgres")
     new_layer.setCrs(crs)
@@ -845,7 +1074,14 @@ def add_selected_layers_to_ToC(dlg: CDB4LoaderDialog, layers: list[CDBLayer]) ->
     db = dlg.DB
     cdb_schema: str = dlg.CDB_SCHEMA
 
-    root = QgsProject.instance().layerTreeRoot()
+    # The layer tree is about to change: the cached lookups must be rebuilt
+    # (lazily, i.e. after the detail views and look-up tables are loaded).
+    invalidate_toc_session_cache(dlg)
+
+    # The project singleton is resolved once per call, not once per use.
+    project = QgsProject.instance()
+
+    root = project.layerTreeRoot()
     node_cdb: QgsLayerTreeGroup = root.findGroup(db.db_toc_node_label)
     node_cdb_schema: QgsLayerTreeGroup = None
     node_featureType: QgsLayerTreeGroup = None
@@ -856,28 +1092,28 @@ def add_selected_layers_to_ToC(dlg: CDB4LoaderDialog, layers: list[CDBLayer]) ->
     detail_views_found: bool = False
     layer_found: bool = False
 
-    if node_cdb:
-        node_cdb_schema = root.findGroup("@".join([db.username, cdb_schema]))
-        if node_cdb_schema:
-            # Check whether the generic attribute table is already loaded
-            node_dv = node_cdb_schema.findGroup(c.detail_views_group_alias)
-            if node_dv:
-                dv_layers: list = node_dv.findLayers()
-                if len(dv_layers) == len(dlg.DetailViewsRegistry):
-                    detail_views_found = True
-
-            # Check whether the look-up table for enumerations is already loaded
-            node_lookup = node_cdb_schema.findGroup(c.lookup_tables_group_alias)
-            if node_lookup:
-                lu_layers: list = node_lookup.findLayers()
-                for lu_layer in lu_layers:  
-                    if lu_layer.name() == "_".join([cdb_schema, c.enumerations_table]):
-                        lookup_found = True
-        else:
-            node_cdb_schema = add_group_node_to_ToC(node_cdb, "@".join([db.username, cdb_schema]))
-    else:
+    schema_node_name: str = get_schema_node_name(dlg)
+
+    if node_cdb is None:
         node_cdb = add_group_node_to_ToC(root, db.db_toc_node_label)
-        node_cdb_schema = add_group_node_to_ToC(node_cdb, "@".join([db.username, cdb_schema]))
+
+    node_cdb_schema = root.findGroup(schema_node_name)
+    if node_cdb_schema:
+        # Check whether the generic attribute table is already loaded.
+        # The detail views sit directly under their group, so counting the
+        # direct children is enough (findLayers would walk recursively).
+        node_dv = node_cdb_schema.findGroup(c.detail_views_group_alias)
+        if node_dv:
+            if len(node_dv.children()) == len(dlg.DetailViewsRegistry):
+                detail_views_found = True
+
+        # Check whether the look-up table for enumerations is already loaded
+        node_lookup = node_cdb_schema.findGroup(c.lookup_tables_group_alias)
+        if node_lookup:
+            target_name: str = f"{cdb_schema}_{c.enumerations_table}"
+            lookup_found = any(lu_layer.name() == target_name for lu_layer in node_lookup.findLayers())
+    else:
+        node_cdb_schema = add_group_node_to_ToC(node_cdb, schema_node_name)
 
     # Load the generic attributes table if it is not already loaded 
     if not detail_views_found:
@@ -897,20 +1133,47 @@ def add_selected_layers_to_ToC(dlg: CDB4LoaderDialog, layers: list[CDBLayer]) ->
         # QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Info, notifyUser=True)
         pass
 
+    # Loop invariants: settings, widget state and style-category constants,
+    # read once instead of crossing the Qt bridge for every layer.
+    use_qml_forms: bool = dlg.settings.enable_ui_based_forms is False
+    enable_3d: bool = dlg.cbxEnable3D.isChecked()
+    read_only: bool = dlg.CDBSchemaPrivileges == "ro"
+    fields_forms_categories = QgsMapLayer.StyleCategory.Fields | QgsMapLayer.StyleCategory.Forms
+    symb_categories = QgsMapLayer.StyleCategory.Symbology
+    symb_3d_categories = QgsMapLayer.StyleCategory.Symbology3D
+
+    # Layers created in this run, paired with their metadata. They are
+    # registered with the project in one batch before the relations are wired.
+    pending_layers: list[tuple[CDBLayer, QgsVectorLayer]] = []
+    # Target group -> new layers, for batched tree insertion after the loop.
+    tree_buckets: dict[QgsLayerTreeGroup, list[QgsVectorLayer]] = {}
+
+    # Resolved LoD group nodes, keyed by the layer's group chain: layers of
+    # the same Feature Type/class/LoD share it, so walk the tree only once
+    # per chain (misses are cached as None, too).
+    group_cache: dict[tuple, QgsLayerTreeGroup] = {}
+
     # Start loading the selected layer(s)
     for layer in layers:
         # Check if the layer has already been loaded before
         layer_found = False
-        node_featureType = node_cdb_schema.findGroup(f"FeatureType: {layer.feature_type}")
-        if node_featureType:
-            node_feature = node_featureType.findGroup(layer.root_class)
-            if node_feature:
-                node_lod = node_feature.findGroup(layer.lod)
-                if node_lod:
-                    existing_layers = node_lod.findLayers()
-                    for existing_layer in existing_layers:
-                        if existing_layer.name() == layer.layer_name:
-                            layer_found = True
+        group_key = (layer.feature_type, layer.root_class, layer.lod)
+        if group_key in group_cache:
+            node_lod = group_cache[group_key]
+        else:
+            node_lod = None
+            node_featureType = node_cdb_schema.findGroup(get_feature_type_group_name(dlg, layer.feature_type))
+            if node_featureType:
+                node_feature = node_featureType.findGroup(layer.root_class)
+                if node_feature:
+                    node_lod = node_feature.findGroup(layer.lod)
+            group_cache[group_key] = node_lod
+
+        if node_lod:
+            existing_layers = node_lod.findLayers()
+            for existing_layer in existing_layers:
+                if existing_layer.name() == layer.layer_name:
+                    layer_found = True
 
         if layer_found:
             msg: str = f"Layer {layer.layer_name} already in Layer Tree: skip reloading"
@@ -919,74 +1182,97 @@ def add_selected_layers_to_ToC(dlg: CDB4LoaderDialog, layers: list[CDBLayer]) ->
             # in the current iteration of the loop and moves the control back to the top of the loop
             continue
 
+        ###########################################################################################
+        # To use "normal" (old) forms, simply set the value to FALSE in the dlg.settings.
+        # See the default in class LoaderDefaultSettings (see other_classes.py)
+        ###########################################################################################
+        if not use_qml_forms:
+            # This is where we may decide to deal with ui-based attribute forms.
+            # Until then, there is nothing to create for this layer.
+            continue
+
         # Build the Table of Contents Tree or Restructure it.
         node_lod = add_layer_node_to_ToC(dlg, layer)
+        # The chain exists now, so later layers can reuse the node.
+        group_cache[group_key] = node_lod
 
         new_layer: QgsVectorLayer = create_qgis_vector_layer(dlg, layer_name=layer.layer_name)
 
-        if new_layer or new_layer.isValid(): # Success
-            pass
-        else: # Fail
+        if new_layer is None:
+            # No overlap with the selected extents: nothing to import.
+            continue
+
+        if not new_layer.isValid(): # Fail
             msg: str = f"Failed to properly load: {layer.layer_name}"
             QgsMessageLog.logMessage(message=msg, tag=dlg.PLUGIN_NAME, level=Qgis.MessageLevel.Critical, notifyUser=True)
             return False
 
         # Set the layer as read-only if the current cdb_schema is read only
-        if dlg.CDBSchemaPrivileges == "ro":
+        if read_only:
             new_layer.setReadOnly()
 
-        ###########################################################################################
-        # To use "normal" (old) forms, simply set the value to FALSE in the dlg.settings.
-        # See the default in class LoaderDefaultSettings (see other_classes.py)
-        ###########################################################################################
-        if dlg.settings.enable_ui_based_forms is False:
-            # Attach 'attribute form' from QML file.
-            if layer.qml_form:
-                new_layer.loadNamedStyle(theURI=layer.qml_form_with_path, loadFromLocalDb=False, categories=QgsMapLayer.StyleCategory.Fields|QgsMapLayer.StyleCategory.Forms)
-                # otherwise: categories=QgsMapLayer.AllStyleCategories
-
-            # Attach 'symbology' from QML file.
-            if layer.qml_symb:
-                new_layer.loadNamedStyle(layer.qml_symb_with_path, loadFromLocalDb=False, categories=QgsMapLayer.StyleCategory.Symbology)
-
-            if dlg.cbxEnable3D.isChecked():
-                # Attach '3d symbology' from QML file.
-                if layer.qml_3d:
-                    new_layer.loadNamedStyle(layer.qml_3d_with_path, loadFromLocalDb=False, categories=QgsMapLayer.StyleCategory.Symbology3D)
-            else:
-                # Deactivate 3D renderer to avoid crashes and slow downs.
-                new_layer.setRenderer3D(None)
-
-            # Insert the layer to the assigned group
-            node_lod.addLayer(new_layer)
-            QgsProject.instance().addMapLayer(new_layer, False)
-
-            # Filter out those layers that are not cityobjects and for which there is no need for the Generic Attributes link
-            if layer.curr_class != "Address":  # might change to: not in ["Address", "...", "..."]
-
-                if layer.curr_class in ["Building", "BuildingPart"]:
-                    create_layer_relation_to_dv_address(dlg, layer=new_layer, dv_gen_name="address_bdg")
-                elif layer.curr_class == "BuildingDoor":
-                    create_layer_relation_to_dv_address(dlg, layer=new_layer, dv_gen_name="address_bdg_door")
-                if layer.curr_class in ["Bridge", "BridgePart"]:
-                    create_layer_relation_to_dv_address(dlg, layer=new_layer, dv_gen_name="address_bri")
-                elif layer.curr_class == "BridgeDoor":
-                    create_layer_relation_to_dv_address(dlg, layer=new_layer, dv_gen_name="address_bri_door")
-        
-                # Now, for all layers that are CityObjects
-                create_layer_relation_to_dv_gen_attrib(dlg, layer=new_layer)
-                create_layer_relation_to_dv_ext_ref(dlg, layer=new_layer)
+        # Attach 'attribute form' from QML file (parsed once per file).
+        if layer.qml_form:
+            new_layer.importNamedStyle(doc=_load_qml_dom(layer.qml_form_with_path), categories=fields_forms_categories)
+            # otherwise: categories=QgsMapLayer.AllStyleCategories
 
-                # Setup the relations for this layer to the look-up tables
-                create_layer_relation_to_enumerations(dlg, layer=new_layer, layer_metadata=layer)
-                create_layer_relation_to_codelists(dlg, layer=new_layer, layer_metadata=layer)
-            
-            # Finally, increment the counter after loading the layer and all the associated stuff
-            import_counter += 1
+        # Attach 'symbology' from QML file.
+        if layer.qml_symb:
+            new_layer.importNamedStyle(doc=_load_qml_dom(layer.qml_symb_with_path), categories=symb_categories)
 
+        if enable_3d:
+            # Attach '3d symbology' from QML file.
+            if layer.qml_3d:
+                new_layer.importNamedStyle(doc=_load_qml_dom(layer.qml_3d_with_path), categories=symb_3d_categories)
         else:
-            # This is where we may decide to deal with ui-based attribute forms
-            pass
+            # Deactivate 3D renderer to avoid crashes and slow downs.
+            new_layer.setRenderer3D(None)
+
+        # The layer is attached to its group after the loop, in one batch per group.
+        tree_buckets.setdefault(node_lod, []).append(new_layer)
+        pending_layers.append((layer, new_layer))
+
+    if pending_layers:
+        # Register all new layers at once: the project emits its signals once
+        # instead of once per layer.
+        project.addMapLayers([new_layer for _, new_layer in pending_layers], False)
+
+        # Attach them to the tree with one insertion per target group, so the
+        # layer-tree model relayouts once per group instead of once per layer.
+        for group, group_layers in tree_buckets.items():
+            group.insertChildNodes(-1, [QgsLayerTreeLayer(group_layer) for group_layer in group_layers])
+
+    # The relations can be wired only now, as they resolve both ends through
+    # the project's registered layers. They are collected here and handed to
+    # the relation manager in one batch after the loop.
+    pending_rels: list[QgsRelation] = []
+    for layer, new_layer in pending_layers:
+        # Filter out those layers that are not cityobjects and for which there is no need for the Generic Attributes link
+        if layer.curr_class != "Address":  # might change to: not in ["Address", "...", "..."]
+
+            dv_gen_name = _ADDRESS_DV_MAP.get(layer.curr_class)
+            if dv_gen_name:
+                create_layer_relation_to_dv_address(dlg, layer=new_layer, dv_gen_name=dv_gen_name, pending_rels=pending_rels)
+
+            # Now, for all layers that are CityObjects
+            create_layer_relation_to_dv_gen_attrib(dlg, layer=new_layer, pending_rels=pending_rels)
+            create_layer_relation_to_dv_ext_ref(dlg, layer=new_layer, pending_rels=pending_rels)
+
+            # Setup the relations for this layer to the look-up tables
+            create_layer_relation_to_enumerations(dlg, layer=new_layer, layer_metadata=layer)
+            create_layer_relation_to_codelists(dlg, layer=new_layer, layer_metadata=layer)
+
+        # Finally, increment the counter after loading the layer and all the associated stuff
+        import_counter += 1
+
+    if pending_rels:
+        # Register all new relations at once: the relation manager revalidates
+        # and signals once instead of once per relation.
+        rel_mgr = project.relationManager()
+        all_rels = rel_mgr.relations() # dict: relation id -> QgsRelation
+        for rel in pending_rels:
+            all_rels[rel.id()] = rel
+        rel_mgr.setRelations(list(all_rels.values()))
 
     # Return the number of layers that have been really loaded.
     # print(f"Imported {import_counter} layers into QGIS")
@@ -277,6 +277,9 @@ def evt_create_layers_success(dlg: CDB4LoaderDialog) -> None:
     Shows success message in Connection Status groupbox
     Shows success message in QgsMessageLog
     """
+    # The layer metadata table has changed: drop the cached copy.
+    sql.invalidate_layer_metadata_cache(dlg=dlg)
+
     # Update the layer extents in the corresponding table in the server.
     sql.upsert_extents(dlg=dlg, bbox_type=BBoxType.MAT_VIEW, extents_wkt_2d_poly=dlg.LAYER_EXTENTS.asWktPolygon())
 
@@ -297,6 +300,9 @@ def evt_create_layers_fail(dlg: CDB4LoaderDialog) -> None:
     Shows fail message in Connection Status groupbox
     Shows fail message in QgsMessageLog
     """
+    # The creation may have partially succeeded: drop the cached layer metadata.
+    sql.invalidate_layer_metadata_cache(dlg=dlg)
+
     # Replace with Failure msg.
     msg = dlg.msg_bar.createMessage(c.LAYER_CR_ERROR_MSG.format(sch=dlg.USR_SCHEMA))
     dlg.msg_bar.pushWidget(msg, Qgis.MessageLevel.Critical, 5)
@@ -494,6 +500,9 @@ def evt_refresh_layers_success(dlg: CDB4LoaderDialog) -> None:
     Shows success message in Connection Status groupbox
     Shows success message in QgsMessageLog
     """
+    # The refresh dates in the layer metadata table have changed: drop the cached copy.
+    sql.invalidate_layer_metadata_cache(dlg=dlg)
+
     tc_f.check_layers_status(dlg=dlg)    
 
     return None
@@ -721,6 +730,9 @@ def evt_drop_layers_success(dlg: CDB4LoaderDialog) -> None:
     Shows success message in Connection Status groupbox
     Shows success message in QgsMessageLog
     """
+    # The layer metadata table has changed: drop the cached copy.
+    sql.invalidate_layer_metadata_cache(dlg=dlg)
+
     layers_exist_status = tc_f.check_layers_status(dlg=dlg)
 
     if not layers_exist_status: # i.e. we have successfully dropped all layers
@@ -752,6 +764,9 @@ def evt_drop_layers_fail(dlg: CDB4LoaderDialog) -> None:
     Shows fail message in Connection Status groupbox
     Shows fail message in QgsMessageLog
     """
+    # The drop may have partially succeeded: drop the cached layer metadata.
+    sql.invalidate_layer_metadata_cache(dlg=dlg)
+
     # Replace with Failure msg.
     msg = dlg.msg_bar.createMessage(c.LAYER_DR_ERROR_MSG.format(sch=dlg.USR_SCHEMA))
     dlg.msg_bar.pushWidget(widget=msg, level=Qgis.MessageLevel.Critical, duration=5)
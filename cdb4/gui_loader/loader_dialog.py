@@ -389,6 +389,10 @@ class CDB4LoaderDialog(QDialog, FORM_CLASS):
         self.conn = conn_f.open_db_connection(db_connection=self.DB, app_name = self.PLUGIN_NAME)
 
         if self.conn:
+            # The dialog workload is almost entirely read-only metadata queries;
+            # autocommit spares the COMMIT round trip after every SELECT. The
+            # write paths (upsert_extents & co.) are single statements anyway.
+            self.conn.autocommit = True
             # Set self.DB.pg_server_version
             self.DB.pg_server_version = conn_f.get_posgresql_server_version(dlg=self)
             # Show database name
@@ -499,10 +503,9 @@ class CDB4LoaderDialog(QDialog, FORM_CLASS):
 
         # 4) Is my usr_schema installed? If yes, continue.
 
-        # Set the current user schema name.
-        self.USR_SCHEMA = sh_sql.create_qgis_usr_schema_name(dlg=self)
-        # Check if qgis_{usr} schema (e.g. qgis_giorgio) is installed in the database.
-        is_usr_schema_inst: bool = sh_sql.is_usr_schema_installed(dlg=self)
+        # Set the current user schema name and check whether qgis_{usr} (e.g.
+        # qgis_giorgio) is installed in the database: one round trip for both.
+        self.USR_SCHEMA, is_usr_schema_inst = sh_sql.get_usr_schema_name_and_status(dlg=self)
 
         if is_usr_schema_inst:
             # Show message in Connection Status the 3DCityDB version if installed
@@ -823,9 +826,10 @@ class CDB4LoaderDialog(QDialog, FORM_CLASS):
                 else: # The new cdb_extents do not contain the old ones, it is completely somewhere else (e.g. dropped all old data, added new data somewhere else)
 
                     # Update the cdb_extents in the database to the new ones
-                    sql.upsert_extents(dlg=self, bbox_type=BBoxType.CDB_SCHEMA, extents_wkt_2d_poly=cdb_extents_new.asWktPolygon())
-                    # Update the layer_extents and set them to null
-                    sql.upsert_extents(dlg=self, bbox_type=BBoxType.MAT_VIEW, extents_wkt_2d_poly=None)
+                    # and set the layer_extents to null, in one round trip
+                    sql.upsert_extents_many(dlg=self, items=[
+                        (BBoxType.CDB_SCHEMA, cdb_extents_new.asWktPolygon()),
+                        (BBoxType.MAT_VIEW, None)])
 
                     self.CDB_SCHEMA_EXTENTS = cdb_extents_new
                     self.LAYER_EXTENTS = cdb_extents_new
@@ -861,10 +865,11 @@ class CDB4LoaderDialog(QDialog, FORM_CLASS):
             QMessageBox.information(self, "Extents changed!", msg)
             QgsMessageLog.logMessage(msg, self.PLUGIN_NAME, level=Qgis.MessageLevel.Info, notifyUser=True)
 
-            # Reset to null the cdb_extents in the extents table in PostgreSQL
-            sql.upsert_extents(dlg=self, bbox_type=BBoxType.CDB_SCHEMA, extents_wkt_2d_poly=None)
-            # Reset to null the layers_extents in the extents table in PostgreSQL
-            sql.upsert_extents(dlg=self, bbox_type=BBoxType.MAT_VIEW, extents_wkt_2d_poly=None)
+            # Reset to null the cdb_extents and the layers_extents
+            # in the extents table in PostgreSQL, in one round trip
+            sql.upsert_extents_many(dlg=self, items=[
+                (BBoxType.CDB_SCHEMA, None),
+                (BBoxType.MAT_VIEW, None)])
 
             # Drop the layers (if necessary)
             has_layers_in_current_schema = sql.has_layers_for_cdb_schema(dlg=self)
@@ -2,6 +2,12 @@ import os.path
 from . import loader_constants as c
 
 class DialogChecks:
+    __slots__ = (
+        "is_conn_successful", "is_postgis_installed", "is_3dcitydb_installed",
+        "is_qgis_pkg_installed", "is_usr_pkg_installed", "layers_exist",
+        "layers_refreshed",
+        )
+
     def __init__(self):
         self.is_conn_successful: bool = False
         self.is_postgis_installed: bool = False
@@ -29,42 +35,49 @@ class DialogChecks:
         *   :returns: The plugin's readiness to finally load layers.
             :rtype: bool
         """
-        if all((self.is_conn_successful,
-                self.is_postgis_installed,
-                self.is_3dcitydb_installed,
-                self.is_qgis_pkg_installed,
-                self.is_usr_pkg_installed,
-                self.layers_exist,
-                self.layers_refreshed)):
-            return True
-        else:
-            return False
+        return (self.is_conn_successful
+                and self.is_postgis_installed
+                and self.is_3dcitydb_installed
+                and self.is_qgis_pkg_installed
+                and self.is_usr_pkg_installed
+                and self.layers_exist
+                and self.layers_refreshed)
 
     
 class DefaultSettings:
     """ Contains all DEFAULT settings of the CDB4-Loader dialog, and their explanation.
     """
+    __slots__ = (
+        "simp_geom_enabled_default", "simp_geom_dec_prec_default",
+        "simp_geom_min_area_default", "max_features_to_import_default",
+        "force_all_layers_creation_default", "enable_3d_renderer_default",
+        "enable_ui_based_forms",
+        )
+
+    # The explanation labels are constants: stored once on the class instead
+    # of once per instance.
+    simp_geom_enabled_label: str = "Toggles on or off the geometry simplification settings"
+    simp_geom_dec_prec_label: str = "Number of decimal positions after the comma to round coordinates"
+    simp_geom_min_area_label: str = "Minimum area threshold to keep a simplified polygon, in [m2]"
+    max_features_to_import_label: str = "Maximum (cumulative) number of features to import into QGIS at a time"
+    force_all_layers_creation_label: str = "Forces QGIS Package to generate all layers, even if empty"
+    enable_3d_renderer_label: str = "Toggles on or off the 3D rendered and the assignment of the 3D styles to the layers"
+    enable_ui_based_forms_label: str = "Toggles on or off the usage of ui-based forms (EXPERIMENTAL)"
+
     def __init__(self):
         self.simp_geom_enabled_default: int = False
-        self.simp_geom_enabled_label: str = "Toggles on or off the geometry simplification settings"
 
         self.simp_geom_dec_prec_default: int = 3
-        self.simp_geom_dec_prec_label: str = "Number of decimal positions after the comma to round coordinates"
 
         self.simp_geom_min_area_default: float = 0.0001
-        self.simp_geom_min_area_label: str = "Minimum area threshold to keep a simplified polygon, in [m2]"
 
         self.max_features_to_import_default: int = 50000
-        self.max_features_to_import_label: str = "Maximum (cumulative) number of features to import into QGIS at a time"
 
         self.force_all_layers_creation_default: bool = False
-        self.force_all_layers_creation_label: str = "Forces QGIS Package to generate all layers, even if empty"
         
         self.enable_3d_renderer_default: bool = False
-        self.enable_3d_renderer_label: str = "Toggles on or off the 3D rendered and the assignment of the 3D styles to the layers"
 
         self.enable_ui_based_forms: bool = False
-        self.enable_ui_based_forms_label: str = "Toggles on or off the usage of ui-based forms (EXPERIMENTAL)"
 
 
     def __str__(self) -> str:
@@ -82,6 +95,17 @@ class CDBLayer():
     """This class is used to convert rows of the 'layer_metadata' table that are "VectorLayers"
     into objects to be used (for example) in the LayerRegistry
     """
+    # A registry may hold thousands of these: __slots__ drops the per-instance
+    # dictionary.
+    __slots__ = (
+        "l_id", "cdb_schema", "ade_prefix", "layer_type", "feature_type",
+        "root_class", "curr_class", "lod", "layer_name", "gv_name", "av_name",
+        "n_features", "creation_date", "refresh_date", "qml_form", "qml_symb",
+        "qml_3d", "enum_cols", "codelist_cols", "n_selected",
+        "_qml_form_with_path", "_qml_symb_with_path", "_qml_3d_with_path",
+        "_qml_ui_form_with_path", "_ui_file_with_path",
+        )
+
     def __init__(self,
             l_id: int,
             cdb_schema: str,
@@ -126,39 +150,73 @@ class CDBLayer():
 
         self.n_selected: int = 0
 
-        self.qml_form_with_path: str = None
-        self.qml_symb_with_path: str = None
-        self.qml_3d_with_path: str = None
-
-        if qml_form:
-            self.qml_form_with_path: str = os.path.join(c.QML_PATH, c.QML_FORM_DIR, qml_form)
-
-        if qml_symb:
-            self.qml_symb_with_path: str = os.path.join(c.QML_PATH, c.QML_SYMB_DIR, qml_symb)
-
-        if qml_3d:
-            self.qml_3d_with_path: str = os.path.join(c.QML_PATH, c.QML_3D_DIR, qml_3d)
-
-        # #########################################
-        # Initial test to support UI-based forms - Added 25 February 2023 
-        
-        self.qml_ui_form_with_path: str = None
-        self.ui_file_with_path: str = None
-
-        if qml_form:
-            self.qml_ui_form_with_path: str = os.path.join(c.QML_PATH, "ui_form", qml_form)
-
-        if qml_form:
-            ui_file: str = qml_form.replace(".qml", ".ui")
-            self.ui_file_with_path: str = os.path.join(c.QML_PATH, "ui_form", ui_file)
-        #
-        # #########################################
+        # The full qml/ui paths are joined lazily (see the properties below):
+        # most registry entries are never actually loaded into the ToC.
+        self._qml_form_with_path: str = None
+        self._qml_symb_with_path: str = None
+        self._qml_3d_with_path: str = None
+        self._qml_ui_form_with_path: str = None
+        self._ui_file_with_path: str = None
+
+    @property
+    def qml_form_with_path(self) -> str:
+        if self._qml_form_with_path is None and self.qml_form:
+            self._qml_form_with_path = os.path.join(c.QML_PATH, c.QML_FORM_DIR, self.qml_form)
+        return self._qml_form_with_path
+
+    @property
+    def qml_symb_with_path(self) -> str:
+        if self._qml_symb_with_path is None and self.qml_symb:
+            self._qml_symb_with_path = os.path.join(c.QML_PATH, c.QML_SYMB_DIR, self.qml_symb)
+        return self._qml_symb_with_path
+
+    @property
+    def qml_3d_with_path(self) -> str:
+        if self._qml_3d_with_path is None and self.qml_3d:
+            self._qml_3d_with_path = os.path.join(c.QML_PATH, c.QML_3D_DIR, self.qml_3d)
+        return self._qml_3d_with_path
+
+    # #########################################
+    # Initial test to support UI-based forms - Added 25 February 2023 
+
+    @property
+    def qml_ui_form_with_path(self) -> str:
+        if self._qml_ui_form_with_path is None and self.qml_form:
+            self._qml_ui_form_with_path = os.path.join(c.QML_PATH, "ui_form", self.qml_form)
+        return self._qml_ui_form_with_path
+
+    @property
+    def ui_file_with_path(self) -> str:
+        if self._ui_file_with_path is None and self.qml_form:
+            ui_file: str = self.qml_form.replace(".qml", ".ui")
+            self._ui_file_with_path = os.path.join(c.QML_PATH, "ui_form", ui_file)
+        return self._ui_file_with_path
+    #
+    # #########################################
 
 
 class CDBDetailView():
     """This class is used to convert rows of the 'layer_metadata' table that are "DetailViews"
     into objects to be used (for example) in the DetailViewRegistry
     """
+    # Maps the generic name of a detail view to the label of its form tab.
+    # A single dict lookup replaces the old if/elif cascade over gen_name.
+    _FORM_TAB_NAMES: dict = {
+        "ext_ref_name"      : "Ext ref (Name)",
+        "ext_ref_uri"       : "Ext ref (Uri)",
+        "gen_attrib_string" : "Gen Attrib (String)",
+        "gen_attrib_integer": "Gen Attrib (Integer)",
+        "gen_attrib_real"   : "Gen Attrib (Real)",
+        "gen_attrib_measure": "Gen Attrib (Measure)",
+        "gen_attrib_date"   : "Gen Attrib (Date)",
+        "gen_attrib_uri"    : "Gen Attrib (Uri)",
+        "gen_attrib_blob"   : "Gen Attrib (Blob)",
+        "address_bdg"       : "Addresses",
+        "address_bri"       : "Addresses",
+        "address_bdg_door"  : "Addresses",
+        "address_bri_door"  : "Addresses",
+        }
+
     def __init__(self,
             id: int,
             cdb_schema: str,
@@ -192,30 +250,11 @@ class CDBDetailView():
         self.qml_symb_with_path: str = None
         self.qml_3d_with_path: str = None
 
-        self.form_tab_name: str = None
-
-        if gen_name == "ext_ref_name":
-            self.form_tab_name = "Ext ref (Name)"
-        elif gen_name == "ext_ref_uri":
-            self.form_tab_name = "Ext ref (Uri)"
-        elif gen_name == "gen_attrib_string":  
-            self.form_tab_name = "Gen Attrib (String)"
-        elif gen_name == "gen_attrib_integer":
-            self.form_tab_name = "Gen Attrib (Integer)"
-        elif gen_name == "gen_attrib_real":
-            self.form_tab_name = "Gen Attrib (Real)"
-        elif gen_name == "gen_attrib_measure":
-            self.form_tab_name = "Gen Attrib (Measure)"
-        elif gen_name == "gen_attrib_date":
-            self.form_tab_name = "Gen Attrib (Date)"
-        elif gen_name == "gen_attrib_uri":
-            self.form_tab_name = "Gen Attrib (Uri)"
-        elif gen_name == "gen_attrib_blob":
-            self.form_tab_name = "Gen Attrib (Blob)"
-        elif gen_name in ["address_bdg", "address_bri", "address_bdg_door", "address_bri_door"]:
-             self.form_tab_name = "Addresses"
-        else:
-            pass
+        self.form_tab_name: str = self._FORM_TAB_NAMES.get(gen_name)
+
+        # Index of the "cityobject_id" field, resolved lazily on the first
+        # load of the detail view and reused afterwards.
+        self.cityobject_id_idx: int = None
 
         if self.type == "DetailView":
             self.has_geom = True
@@ -246,6 +285,12 @@ class CDBDetailView():
 
 
 class FeatureType():
+    __slots__ = (
+        "name", "alias", "layers_create_function", "layers_refresh_function",
+        "layers_drop_function", "exists", "is_ade", "is_selected",
+        "n_features", "layers",
+        )
+
     def __init__(self,
                 name: str, 
                 alias: str,
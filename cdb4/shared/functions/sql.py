@@ -10,8 +10,11 @@ if TYPE_CHECKING:
     from ...gui_deleter.deleter_dialog import CDB4DeleterDialog
     from ...shared.dataTypes import QgisPKGVersion
 
+import functools
+import time
+
 import psycopg2, psycopg2.sql as pysql
-from psycopg2.extras import NamedTupleCursor
+from psycopg2.extras import NamedTupleCursor, execute_batch
 from qgis.core import Qgis, QgsMessageLog
 
 from .... import cdb_tools_main_constants as main_c
@@ -19,6 +22,56 @@ from . import general_functions as gen_f
 
 FILE_LOCATION = gen_f.get_file_relative_path(file=__file__)
 
+# Cached results of is_qgis_pkg_installed, keyed by connection identity. The
+# answer only changes when the QGIS Package is (un)installed, so repeated
+# connection checks within the TTL are served without a catalog query. The
+# admin dialog invalidates the cache after every (un)installation attempt.
+_QGIS_PKG_CHECK_CACHE: dict[tuple, tuple[float, bool]] = {}
+_QGIS_PKG_CHECK_TTL: float = 30.0 # seconds
+
+
+def invalidate_schema_check_cache() -> None:
+    """Function that drops the cached results of is_qgis_pkg_installed. To be
+    called whenever the QGIS Package is installed or uninstalled.
+    """
+    _QGIS_PKG_CHECK_CACHE.clear()
+
+    return None
+
+
+# Constant statement text for the schema usability probe: the schema name
+# travels as a bind parameter, so the text (and the server's parse of it) is
+# identical on every call.
+_SCHEMA_USABLE_QUERY: str = """
+    SELECT EXISTS (
+        SELECT 1 FROM pg_catalog.pg_namespace
+        WHERE nspname = %s AND pg_catalog.has_schema_privilege(oid, 'USAGE'));
+    """
+
+# The queries below only vary with the qgis_pkg schema name: the Composed tree
+# with the identifier baked in is built once per schema, and the user name is
+# bound at execution time.
+
+@functools.lru_cache(maxsize=4)
+def _usr_schema_name_query(qgis_pkg_schema: str) -> pysql.Composed:
+    return pysql.SQL("""
+        SELECT {_qgis_pkg_schema}.create_qgis_usr_schema_name(%s);
+        """).format(
+        _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
+        )
+
+@functools.lru_cache(maxsize=4)
+def _usr_schema_name_and_status_query(qgis_pkg_schema: str) -> pysql.Composed:
+    return pysql.SQL("""
+        SELECT s.usr_schema,
+               EXISTS (SELECT 1 FROM pg_catalog.pg_namespace
+                       WHERE nspname = s.usr_schema AND pg_catalog.has_schema_privilege(oid, 'USAGE'))
+        FROM (SELECT {_qgis_pkg_schema}.create_qgis_usr_schema_name(%s) AS usr_schema) AS s;
+        """).format(
+        _qgis_pkg_schema = pysql.Identifier(qgis_pkg_schema)
+        )
+
+
 def get_3dcitydb_version(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4DeleterDialog]) -> Optional[str]:
     """SQL query that reads and retrieves the 3DCityDB version.
 
@@ -55,16 +108,9 @@ def create_qgis_usr_schema_name(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CD
     if usr_name is None:
         usr_name: str = dlg.DB.username
 
-    query = pysql.SQL("""
-        SELECT {_qgis_pkg_schema}.create_qgis_usr_schema_name({_usr_name});
-        """).format(
-        _qgis_pkg_schema = pysql.Identifier(dlg.QGIS_PKG_SCHEMA),
-        _usr_name = pysql.Literal(usr_name)
-        )
-
     try:
         with dlg.conn.cursor() as cur:
-            cur.execute(query)
+            cur.execute(_usr_schema_name_query(dlg.QGIS_PKG_SCHEMA), (usr_name,))
             res = cur.fetchone()[0] # Trailing comma
         dlg.conn.commit()
         usr_schema: str = res
@@ -89,23 +135,25 @@ def is_qgis_pkg_installed(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4Dele
     *   :returns: Search result
         :rtype: bool
     """
-    query = pysql.SQL("""
-        SELECT schema_name 
-        FROM information_schema.schemata 
-        WHERE schema_name = {_qgis_pkg_schema};
-        """).format(
-        _qgis_pkg_schema = pysql.Literal(dlg.QGIS_PKG_SCHEMA)
-        )
-
+    db = dlg.DB
+    cache_key = (db.host, db.port, db.database_name, db.username, dlg.QGIS_PKG_SCHEMA)
+    cached = _QGIS_PKG_CHECK_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _QGIS_PKG_CHECK_TTL:
+        return cached[1]
+
+    # Probing pg_namespace directly uses its unique index on nspname and
+    # evaluates the privilege check on that one row, instead of filtering the
+    # whole catalog through the information_schema view. The privilege test
+    # keeps the semantics: the schema counts as installed only when the
+    # current user may actually use it.
     try:
         with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            res = cur.fetchone()
+            cur.execute(_SCHEMA_USABLE_QUERY, (dlg.QGIS_PKG_SCHEMA,))
+            res = cur.fetchone()[0] # Tuple has trailing comma.
         dlg.conn.commit()
 
-        if res:
-            return True
-        return False
+        _QGIS_PKG_CHECK_CACHE[cache_key] = (time.monotonic(), res)
+        return res
 
     except (Exception, psycopg2.Error) as error:
         gen_f.critical_log(
@@ -148,29 +196,46 @@ def get_qgis_pkg_version(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4Delet
         dlg.conn.rollback()
 
 
+def get_usr_schema_name_and_status(dlg: Union[CDB4LoaderDialog, CDB4DeleterDialog]) -> tuple[Optional[str], bool]:
+    """SQL query that derives the name of the usr_schema from the current user
+    name and checks whether that schema is installed, in a single round trip.
+    Used by the connection flow of the dialogs, which always needs both.
+
+    *   :returns: The usr_schema name and whether it is installed
+        :rtype: tuple[str, bool]
+    """
+    try:
+        with dlg.conn.cursor() as cur:
+            cur.execute(_usr_schema_name_and_status_query(dlg.QGIS_PKG_SCHEMA), (dlg.DB.username,))
+            usr_schema, is_installed = cur.fetchone()
+        dlg.conn.commit()
+
+        return usr_schema, is_installed
+
+    except (Exception, psycopg2.Error) as error:
+        gen_f.critical_log(
+            func=get_usr_schema_name_and_status,
+            location=FILE_LOCATION,
+            header=f"Deriving and checking user schema name for user {dlg.DB.username}",
+            error=error)
+        dlg.conn.rollback()
+        return None, False
+
+
 def is_usr_schema_installed(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4DeleterDialog]) -> bool:
     """SQL query that checks whether schema qgis_{usr} is installed in the current database.
 
     *   :returns: Search result
         :rtype: bool
     """
-    query = pysql.SQL("""
-        SELECT schema_name 
-        FROM information_schema.schemata 
-        WHERE schema_name = {_usr_schema};
-        """).format(
-        _usr_schema = pysql.Literal(dlg.USR_SCHEMA)
-        )
-
+    # Index probe on pg_namespace (see is_qgis_pkg_installed).
     try:
         with dlg.conn.cursor() as cur:
-            cur.execute(query)
-            usr_schema = cur.fetchone()
+            cur.execute(_SCHEMA_USABLE_QUERY, (dlg.USR_SCHEMA,))
+            res = cur.fetchone()[0] # Tuple has trailing comma.
         dlg.conn.commit()
 
-        if usr_schema:
-            return True
-        return False
+        return res
 
     except (Exception, psycopg2.Error) as error:
         gen_f.critical_log(
@@ -196,9 +261,7 @@ def upsert_plugin_settings(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4Del
     # ]
 
     for s in settings_list:
-        for k, v in s.items():
-            if k == "data_value":
-                s.update({k: str(v)})
+        s["data_value"] = str(s["data_value"])
 
     query = pysql.SQL("""
         SELECT {_qgis_pkg_schema}.upsert_settings({_usr_schema},{_dialog_name},{_name},{_data_type},{_data_value},{_description});
@@ -214,12 +277,12 @@ def upsert_plugin_settings(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4Del
 
     try:
         with dlg.conn.cursor() as cur:
-            # the cur.executemany drops by default all results, so we cannot get anything back for checking
-            # Check the psycopg documentation for more details.
-            # Therefore we stay with the normal iteration over cur.execute of a single query.
-            # cur.executemany(query, settings_list)
-            for setting in settings_list:
-                cur.execute(query,  setting)
+            # execute_batch (and executemany) drop all results, but only the id of
+            # the LAST upsert is needed for checking: batch everything except the
+            # last setting, then execute that one normally and read its result.
+            if len(settings_list) > 1:
+                execute_batch(cur, query, settings_list[:-1])
+            cur.execute(query, settings_list[-1])
 
             last_upserted_id = cur.fetchone()[0]
         dlg.conn.commit()
@@ -262,28 +325,20 @@ def get_plugin_settings(dlg: Union[CDB4AdminDialog, CDB4LoaderDialog, CDB4Delete
     try:
         with dlg.conn.cursor() as cur:
             cur.execute(query)
-            col_names = [desc[0] for desc in cur.description]
-            res = cur.fetchall()
+            # Convert the values while streaming the rows off the cursor: one
+            # pass, without first materializing a list of unconverted dicts.
+            settings_list = []
+            for name, data_type, data_value in cur:
+                if data_type == 2:
+                    data_value = int(data_value)
+                elif data_type == 3:
+                    data_value = float(data_value)
+                elif data_type == 4:
+                    data_value = bool(int(data_value))
+                # 1 is already a string; 5 (date or other data types) to do.
+                settings_list.append({"name": name, "data_type": data_type, "data_value": data_value})
         dlg.conn.commit()
 
-        settings_list = [dict(zip(col_names, values)) for values in res]
-
-        for s in settings_list:
-            dt = s["data_type"]
-            v = s["data_value"]
-            if dt == 1:
-                pass # nothing to do, it's already a string
-            elif dt == 2:
-                s["data_value"] = int(v)
-            elif dt == 3:
-                s["data_value"] = float(v)
-            elif dt == 4:
-                s["data_value"] = bool(int(v))
-            elif dt == 5:
-                pass # to do in case of date or other data types
-            else:
-                pass
-
         # print("Retrieved from db:\n", settings_list)
 
         return settings_list
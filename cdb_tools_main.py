@@ -118,6 +118,9 @@ class CDBToolsMain:
         msg: str = f"<br><br>------ WELCOME! -------<br>You are using the <b>{self.PLUGIN_NAME} v. {self.PLUGIN_VERSION_TXT}</b> plug-in running on <b>QGIS v. {self.QGIS_VERSION_MAJOR}.{self.QGIS_VERSION_MINOR}.{self.QGIS_VERSION_REV}</b> on a <b>{self.PLATFORM_SYSTEM}</b> machine.<br>-----------------------------<br>"
         QgsMessageLog.logMessage(msg, self.PLUGIN_NAME, level=Qgis.MessageLevel.Info, notifyUser=False)
 
+        # Modification time of the settings file when the stored connections
+        # were last scanned (see list_qgis_postgres_stored_conns).
+        self._stored_conns_mtime: Optional[int] = None
         self.StoredConns = self.list_qgis_postgres_stored_conns()
         # print("self.StoredConns", self.StoredConns)
 
@@ -416,6 +419,11 @@ class CDBToolsMain:
         for action in self.actions:
             self.iface.removeDatabaseToolBarIcon(qAction=action)
             self.iface.removePluginDatabaseMenu(name=self.PLUGIN_NAME, action=action)
+
+        # Close the pooled database sessions kept alive for reuse.
+        from .cdb4.gui_db_connector.functions import conn_functions as conn_f
+        conn_f.close_all_pools()
+
         return None
 
 
@@ -757,43 +765,51 @@ class CDBToolsMain:
 
 
     def fill_connection_list_box(self, dlg: Union[CDB4LoaderDialog, CDB4DeleterDialog, CDB4AdminDialog], 
-                                stored_conns: Optional[list[tuple[str, dict]]] = None
+                                stored_conns: Optional[list[tuple[str, DBConnectionInfo]]] = None
                                 ) -> None:
         """Function that fills the the 'cbxExistingConn' combobox
         """
+        # Repopulate the comboBox with the signals blocked: per-item addItem
+        # calls would re-fire its currentIndexChanged handler (which resets
+        # the whole dialog). The signal is emitted once at the end instead.
+        dlg.cbxExistingConn.blockSignals(True)
+
         # Clear the contents of the comboBox from previous runs
         dlg.cbxExistingConn.clear()
 
         if stored_conns:
-            # Get database connection settings for every stored connection
-            for stored_conn_name, stored_conn_params in stored_conns:
+            # The scanned DBConnectionInfo objects go into the combobox as they
+            # are: no per-fill reconstruction from intermediate dictionaries.
+            # One addItems call instead of one addItem (and one relayout) per entry.
+            dlg.cbxExistingConn.addItems([stored_conn_name for stored_conn_name, _ in stored_conns])
+            for i, (_, db_conn_info) in enumerate(stored_conns):
+                dlg.cbxExistingConn.setItemData(i, db_conn_info)
 
-                label: str = stored_conn_name
-                # Create object
-                db_conn_info = DBConnectionInfo()
-
-                # Populate the object attributes BEGIN
-                db_conn_info.connection_name   = label
-                db_conn_info.database_name     = stored_conn_params['database']
-                db_conn_info.host              = stored_conn_params['host']
-                db_conn_info.port              = stored_conn_params['port']
-                db_conn_info.username          = stored_conn_params['username']
-                db_conn_info.password          = stored_conn_params['password']
-                db_conn_info.db_toc_node_label = stored_conn_params['db_toc_node_label']
-                # Populate the object attributes END
-
-                dlg.cbxExistingConn.addItem(label, userData=db_conn_info)
+        dlg.cbxExistingConn.blockSignals(False)
+        # Fire the handler once, now that all items and their data are in place.
+        dlg.cbxExistingConn.currentIndexChanged.emit(dlg.cbxExistingConn.currentIndex())
 
         return None
 
 
-    def list_qgis_postgres_stored_conns(self) -> Optional[list[tuple[str, dict]]]:
+    def list_qgis_postgres_stored_conns(self) -> Optional[list[tuple[str, DBConnectionInfo]]]:
         """Function that reads the QGIS user settings to look for existing connections
-        It results in a list[tuple[str, dict]]
+        It results in a list[tuple[str, DBConnectionInfo]]
         """
         # Create a QgsSettings object to access the settings
         qgis_settings = QgsSettings()
 
+        # The settings live in the profile's ini file: when that has not
+        # changed on disk since the last scan, the previous result is still
+        # valid and the key-by-key read can be skipped altogether.
+        try:
+            settings_mtime = os.stat(qgis_settings.fileName()).st_mtime_ns
+        except OSError:
+            settings_mtime = None
+
+        if settings_mtime is not None and settings_mtime == self._stored_conns_mtime:
+            return self.StoredConns
+
         # Navigate to PostgreSQL connection settings
         qgis_settings.beginGroup(prefix='PostgreSQL/connections')
 
@@ -806,30 +822,31 @@ class CDBToolsMain:
         # Get database connection settings for every stored connection
         for stored_conn in stored_conn_list:
 
-            db_conn_info_dict = dict()
-
             qgis_settings.beginGroup(prefix=stored_conn)
-            # Populate the object BEGIN
-            db_conn_info_dict['database']          = qgis_settings.value(key='database')
-            db_conn_info_dict['host']              = qgis_settings.value(key='host')
-            db_conn_info_dict['port']              = qgis_settings.value(key='port')
-            db_conn_info_dict['username']          = qgis_settings.value(key='username')
-            db_conn_info_dict['password']          = qgis_settings.value(key='password')
-            db_conn_info_dict['db_toc_node_label'] = qgis_settings.value(key='database') + " @ " + qgis_settings.value(key='host') + ":" + str(qgis_settings.value(key='port'))
-
-            # print('read from stored conns', db_conn_info_dict['db_toc_node_label'])
-
-            # Populate the object END
+            # Read each setting once, then assemble the record in one go. The
+            # record is the DBConnectionInfo object itself: building a dict
+            # here and converting it for the combobox later would keep two
+            # copies of the same data around.
+            db_conn_info = DBConnectionInfo()
+            db_conn_info.connection_name = stored_conn
+            db_conn_info.database_name   = qgis_settings.value(key='database')
+            db_conn_info.host            = qgis_settings.value(key='host')
+            db_conn_info.port            = qgis_settings.value(key='port')
+            db_conn_info.username        = qgis_settings.value(key='username')
+            db_conn_info.password        = qgis_settings.value(key='password')
+            db_conn_info.db_toc_node_label = f"{db_conn_info.database_name} @ {db_conn_info.host}:{db_conn_info.port}"
             qgis_settings.endGroup()
 
-            t: tuple[str, dict] = (stored_conn, db_conn_info_dict)
-            stored_conns: list[tuple[str, dict]]
-            stored_conns.append(t)
+            # print('read from stored conns', db_conn_info.db_toc_node_label)
+
+            stored_conns.append((stored_conn, db_conn_info))
         
         stored_conns.sort()
         # stored_conns.sort(reverse=True)
         # print(stored_conns)
 
+        self._stored_conns_mtime = settings_mtime
+
         return stored_conns
 
 
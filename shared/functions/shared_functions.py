@@ -1,6 +1,6 @@
 """This module contains shared functions
 """
-import os.path, requests, webbrowser
+import os.path
 from qgis.PyQt.QtWidgets import QMessageBox
 from qgis.core import QgsMessageLog, Qgis
 
@@ -13,6 +13,11 @@ def open_online_url(url: str) -> None:
 
     NOTE: webbrowser will be removed from Python v. 3.13 (QGIS using Python v. 3.9 at the moment)
     """
+    # Imported lazily: requests is a heavy import and this module is loaded
+    # at QGIS startup, while these helpers only run when the user clicks a
+    # link in the About dialog.
+    import requests, webbrowser
+
     plugin_name: str = main_c.PLUGIN_NAME_LABEL
     try:
         r = requests.head(url)
@@ -47,6 +52,8 @@ def open_local_PDF(pdf_path: str) -> None:
 
     NOTE: webbrowser will be removed from Python v. 3.13 (QGIS using Python v. 3.9 at the moment)
     """
+    import webbrowser # Lazy, see open_online_url.
+
     plugin_name: str = main_c.PLUGIN_NAME_LABEL
 
     if os.path.isfile(pdf_path): # The file exists